@@ -566,9 +566,46 @@ loadvars(){
 
 	llphaset=3
 
+	#Zähler der openWB Satellit Ladepunkte (mpm3pmlllp1..8) gemeinsam in einem Aufruf auslesen
+	lpmeters=""
+	if [[ $ladeleistungmodul == "mpm3pmlllp1" ]]; then
+		lpmeters+=",1:$mpmlp1ip:$mpmlp1id"
+	fi
+	if ((lastmanagement == 1)) && [[ $ladeleistungs1modul == "mpm3pmlllp2" ]]; then
+		lpmeters+=",2:$mpmlp2ip:$mpmlp2id"
+	fi
+	if ((lastmanagements2 == 1)) && [[ $ladeleistungs2modul == "mpm3pmlllp3" ]]; then
+		lpmeters+=",3:$mpmlp3ip:$mpmlp3id"
+	fi
+	for lp in 4 5 6 7 8; do
+		lastmanagementlp="lastmanagementlp$lp"
+		evseconlp="evseconlp$lp"
+		if [[ ${!lastmanagementlp} == "1" && ${!evseconlp} != "extopenwb" && ${!evseconlp} != "owbpro" ]]; then
+			mpmlpip="mpmlp${lp}ip"
+			mpmlpid="mpmlp${lp}id"
+			lpmeters+=",$lp:${!mpmlpip}:${!mpmlpid}"
+		fi
+	done
+	if [[ -n $lpmeters ]]; then
+		timeout 10 bash packages/legacy_run.sh "modules.chargepoints.lp_meter.meter" "read" "${lpmeters:1}" >>/var/www/html/openWB/ramdisk/openWB.log 2>&1 || true
+	fi
+	#KEBA Wallboxen LP1 und LP2 gemeinsam in einem Aufruf auslesen
+	kebas=""
+	if [[ $ladeleistungmodul == "keballlp1" ]]; then
+		kebas+=",1:$kebaiplp1"
+	fi
+	if ((lastmanagement == 1)) && [[ $ladeleistungs1modul == "keballlp2" ]]; then
+		kebas+=",2:$kebaiplp2"
+	fi
+	if [[ -n $kebas ]]; then
+		timeout 10 bash packages/legacy_run.sh "modules.chargepoints.keba.chargepoint_module" "${kebas:1}" >>/var/www/html/openWB/ramdisk/openWB.log 2>&1 || true
+	fi
+
 	#Ladeleistung ermitteln
 	if [[ $ladeleistungmodul != "none" ]]; then
-		timeout 10 "modules/$ladeleistungmodul/main.sh" || true
+		if [[ $ladeleistungmodul != "mpm3pmlllp1" && $ladeleistungmodul != "keballlp1" ]]; then
+			timeout 10 "modules/$ladeleistungmodul/main.sh" || true
+		fi
 		llkwh=$(</var/www/html/openWB/ramdisk/llkwh)
 		llkwhges=$llkwh
 		lla1=$(cat /var/www/html/openWB/ramdisk/lla1)
@@ -641,7 +678,9 @@ loadvars(){
 			soc1=0
 			soc1vorhanden=0
 		fi
-		timeout 10 "modules/$ladeleistungs1modul/main.sh" || true
+		if [[ $ladeleistungs1modul != "mpm3pmlllp2" && $ladeleistungs1modul != "keballlp2" ]]; then
+			timeout 10 "modules/$ladeleistungs1modul/main.sh" || true
+		fi
 		llkwhs1=$(</var/www/html/openWB/ramdisk/llkwhs1)
 		llkwhges=$(echo "$llkwhges + $llkwhs1" |bc)
 		llalts1=$(cat /var/www/html/openWB/ramdisk/llsolls1)
@@ -678,7 +717,9 @@ loadvars(){
 
 	#dritter ladepunkt
 	if ((lastmanagements2 == 1)); then
-		timeout 10 "modules/$ladeleistungs2modul/main.sh" || true
+		if [[ $ladeleistungs2modul != "mpm3pmlllp3" ]]; then
+			timeout 10 "modules/$ladeleistungs2modul/main.sh" || true
+		fi
 		llkwhs2=$(</var/www/html/openWB/ramdisk/llkwhs2)
 		llkwhges=$(echo "$llkwhges + $llkwhs2" |bc)
 		llalts2=$(cat /var/www/html/openWB/ramdisk/llsolls2)
@@ -720,8 +761,6 @@ loadvars(){
 			timeout 3 modules/extopenwb/main.sh 4 "$chargep4ip" "$chargep4cp" || true
 		elif [[ "$evseconlp4" == "owbpro" ]]; then
 			timeout 3 modules/owbpro/main.sh 4 "$owbpro4ip" || true
-		else
-			timeout 3 modules/mpm3pmlllp4/main.sh || true
 		fi
 		llkwhlp4=$(</var/www/html/openWB/ramdisk/llkwhlp4)
 		llkwhges=$(echo "$llkwhges + $llkwhlp4" |bc)
@@ -760,8 +799,6 @@ loadvars(){
 			timeout 3 modules/extopenwb/main.sh 5 "$chargep5ip" "$chargep5cp" || true
 		elif [[ "$evseconlp5" == "owbpro" ]]; then
 			timeout 3 modules/owbpro/main.sh 5 "$owbpro5ip" || true
-		else
-			timeout 3 modules/mpm3pmlllp5/main.sh || true
 		fi
 		llkwhlp5=$(</var/www/html/openWB/ramdisk/llkwhlp5)
 		llkwhges=$(echo "$llkwhges + $llkwhlp5" |bc)
@@ -800,8 +837,6 @@ loadvars(){
 			timeout 3 modules/extopenwb/main.sh 6 "$chargep6ip" "$chargep6cp" || true
 		elif [[ "$evseconlp6" == "owbpro" ]]; then
 			timeout 3 modules/owbpro/main.sh 6 "$owbpro6ip" || true
-		else
-			timeout 3 modules/mpm3pmlllp6/main.sh || true
 		fi
 		llkwhlp6=$(</var/www/html/openWB/ramdisk/llkwhlp6)
 		llkwhges=$(echo "$llkwhges + $llkwhlp6" |bc)
@@ -840,8 +875,6 @@ loadvars(){
 			timeout 3 modules/extopenwb/main.sh 7 "$chargep7ip" "$chargep7cp" || true
 		elif [[ "$evseconlp7" == "owbpro" ]]; then
 			timeout 3 modules/owbpro/main.sh 7 "$owbpro7ip" || true
-		else
-			timeout 3 modules/mpm3pmlllp7/main.sh || true
 		fi
 		llkwhlp7=$(</var/www/html/openWB/ramdisk/llkwhlp7)
 		llkwhges=$(echo "$llkwhges + $llkwhlp7" |bc)
@@ -879,8 +912,6 @@ loadvars(){
 			timeout 3 modules/extopenwb/main.sh 8 "$chargep8ip" "$chargep8cp" || true
 		elif [[ "$evseconlp8" == "owbpro" ]]; then
 			timeout 3 modules/owbpro/main.sh 8 "$owbpro8ip" || true
-		else
-			timeout 3 modules/mpm3pmlllp8/main.sh || true
 		fi
 
 		llkwhlp8=$(</var/www/html/openWB/ramdisk/llkwhlp8)
@@ -1116,7 +1147,7 @@ loadvars(){
 			openwbDebugLog "MAIN" 0 "loadvars read openWB/evu/WHExport_temp from mosquito $exporttemp"
 			echo $exporttemp > /var/www/html/openWB/ramdisk/bezugwatt0neg
 		fi
-		sudo python /var/www/html/openWB/runs/simcount.py "$watt2" bezug bezugkwh einspeisungkwh
+		sudo python3 /var/www/html/openWB/runs/simcount.py "$watt2" bezug bezugkwh einspeisungkwh
 		importtemp1=$(</var/www/html/openWB/ramdisk/bezugwatt0pos)
 		exporttemp1=$(</var/www/html/openWB/ramdisk/bezugwatt0neg)
 		if [[ $importtemp !=  "$importtemp1" ]]; then
@@ -1159,7 +1190,7 @@ loadvars(){
 			openwbDebugLog "MAIN" 0 "loadvars read openWB/pv/WHExport_temp from mosquito $exporttemp"
 			echo $exporttemp > /var/www/html/openWB/ramdisk/pvwatt0neg
 		fi
-		sudo python /var/www/html/openWB/runs/simcount.py "$watt3" pv pvposkwh pvkwh
+		sudo python3 /var/www/html/openWB/runs/simcount.py "$watt3" pv pvposkwh pvkwh
 		importtemp1=$(</var/www/html/openWB/ramdisk/pvwatt0pos)
 		exporttemp1=$(</var/www/html/openWB/ramdisk/pvwatt0neg)
 		if [[ $importtemp !=  "$importtemp1" ]]; then
@@ -1199,7 +1230,7 @@ loadvars(){
 			openwbDebugLog "MAIN" 0 "loadvars read openWB/pv/WH2Export_temp from mosquito $exporttemp"
 			echo $exporttemp > /var/www/html/openWB/ramdisk/pv2watt0neg
 		fi
-		sudo python /var/www/html/openWB/runs/simcount.py "$watt4" pv2 pv2poskwh pv2kwh
+		sudo python3 /var/www/html/openWB/runs/simcount.py "$watt4" pv2 pv2poskwh pv2kwh
 		importtemp1=$(</var/www/html/openWB/ramdisk/pv2watt0pos)
 		exporttemp1=$(</var/www/html/openWB/ramdisk/pv2watt0neg)
 		if [[ $importtemp !=  "$importtemp1" ]]; then
@@ -1241,7 +1272,7 @@ loadvars(){
 			openwbDebugLog "MAIN" 0 "loadvars read openWB/housebattery/WHExport_temp from mosquito $exporttemp"
 			echo $exporttemp > /var/www/html/openWB/ramdisk/speicherwatt0neg
 		fi
-		sudo python /var/www/html/openWB/runs/simcount.py "$watt2" speicher speicherikwh speicherekwh
+		sudo python3 /var/www/html/openWB/runs/simcount.py "$watt2" speicher speicherikwh speicherekwh
 		importtemp1=$(</var/www/html/openWB/ramdisk/speicherwatt0pos)
 		exporttemp1=$(</var/www/html/openWB/ramdisk/speicherwatt0neg)
 		if [[ $importtemp !=  "$importtemp1" ]]; then
@@ -1276,7 +1307,7 @@ loadvars(){
 			openwbDebugLog "MAIN" 0 "loadvars read openWB/verbraucher/1/WHExport_temp from mosquito $exporttemp"
 			echo $exporttemp > /var/www/html/openWB/ramdisk/verbraucher1watt0neg
 		fi
-		sudo python /var/www/html/openWB/runs/simcount.py "$watt3" verbraucher1 verbraucher1_wh verbraucher1_whe
+		sudo python3 /var/www/html/openWB/runs/simcount.py "$watt3" verbraucher1 verbraucher1_wh verbraucher1_whe
 		importtemp1=$(</var/www/html/openWB/ramdisk/verbraucher1watt0pos)
 		exporttemp1=$(</var/www/html/openWB/ramdisk/verbraucher1watt0neg)
 		if [[ $importtemp !=  "$importtemp1" ]]; then
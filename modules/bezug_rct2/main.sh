@@ -10,10 +10,13 @@ else
         MYLOGFILE="${RAMDISKDIR}/evu.log"
 fi
 
-bash "$OPENWBBASEDIR/packages/legacy_run.sh" "bezug_rct2.rct_read_bezug" "--ip=${bezug1_ip}" >>"${MYLOGFILE}" 2>&1
-ret=$?
+# Werte werden bereits mit dem WR oder Speicher in derselben Verbindung abgefragt
+if [[ ${pvwattmodul} != "wr_rct2" ]] && [[ ${speichermodul} != "speicher_rct2" ]]; then
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "bezug_rct2.rct_read_bezug" "--ip=${bezug1_ip}" >>"${MYLOGFILE}" 2>&1
+	ret=$?
 
-openwbDebugLog ${DMOD} 2 "RET: ${ret}"
+	openwbDebugLog ${DMOD} 2 "RET: ${ret}"
+fi
 
 # Nehme wattbezug als ergbenis mit zurueck da beim Bezug-Module ein Returnwert erwartet wird.
 cat "${RAMDISKDIR}/wattbezug"
\ No newline at end of file
@@ -18,7 +18,6 @@ import select
 import struct
 import binascii
 import time
-import copy
 import operator
 import logging
 import datetime
@@ -77,6 +76,13 @@ class rct_id():
         self.value = None
         self.pending = False    # used to read pending
 
+    # create a copy of the item, all attributes are immutable so there is no need for a deep copy
+    def clone(self):
+        item = rct_id(self.id, self.idx, self.name, self.data_type, self.desc)
+        item.value = self.value
+        item.pending = self.pending
+        return item
+
     # decode a value according to the id data type
     def decode_value(self, data):
         try:
@@ -133,14 +139,33 @@ HEADER_WITH_LENGTH = 1 + 1 + 2      # frame length for header, command and 2 byt
 FRAME_TYPE_STANDARD = 4             # standard frame with id
 FRAME_TYPE_PLANT = 8                # plant frame with id and address
 FRAME_CRC16_LENGTH = 2              # nr of bytes for CRC16 field
+
+
+# lookup table for the CRC16 (CCITT polynom 0x1021), one entry per value of the high byte
+def crc16_setup_table():
+    table = []
+    for byte in range(256):
+        crcsum = byte << 8
+        for bit in range(8):
+            crcsum <<= 1
+            if crcsum & 0x10000:
+                crcsum = (crcsum & 0xFFFF) ^ 0x1021
+        table.append(crcsum)
+    return table
+
+
+crc16_table = crc16_setup_table()
+
 class Frame:
     def __init__(self, command = 0, address = 0, frame_type=FRAME_TYPE_STANDARD):
         self.command = command
         self.address = address        # for plant communication only
         self.idList = []
+        self.idMap = {}                 # id -> list of items in idList with this id
         self.frame_type = frame_type
         self.bEscapeMode = False
-        self.rxStream = b""
+        self.rxStream = bytearray()
+        self.FrameLength = 0
         self.pendingCount = False      # nr of id's which are not yet handled
         self.statisticRxDropped = 0
         self.statisticRxConsumed = 0
@@ -158,6 +183,7 @@ class Frame:
                 self.desc_len = len(item.desc)
 
             self.idList.append(item)
+            self.idMap.setdefault(item.id, []).append(item)
             item.pending = True
             item.value = None
             if item.id > 0:
@@ -165,47 +191,60 @@ class Frame:
 
     # consume all data, extract frames and decode them.
     # Incomplete frames remain in self.rxStream for the nexht data chunk
+    # The data is scanned for start and escape tokens with find(), unescaped runs are copied in one piece.
     def consume(self, data):
-        for d in data:
-            c = bytes([d])
-
+        pos = 0
+        end = len(data)
+        while pos < end:
             # sync to start_token
             if len(self.rxStream) == 0:
-                if c == start_token:
-                    self.rxStream += c
+                pos = data.find(start_token, pos)
+                if pos < 0:
+                    return
+                self.rxStream.append(start_token[0])
+                pos += 1
                 continue
 
             if self.bEscapeMode:
+                # escaped byte is added as it is
                 self.bEscapeMode = False
+                self.rxStream.append(data[pos])
+                pos += 1
             else:
-                if c == escape_token:
+                # add all bytes up to the next escape token but not beyond the end of header or frame
+                if len(self.rxStream) < HEADER_WITH_LENGTH:
+                    missing = HEADER_WITH_LENGTH - len(self.rxStream)
+                else:
+                    missing = self.FrameLength + FRAME_CRC16_LENGTH - len(self.rxStream)
+                stop = min(pos + missing, end)
+                escape = data.find(escape_token, pos, stop)
+                if escape == pos:
                     self.bEscapeMode = True                  # escape mode -> set mode and don't add byte
+                    pos += 1
                     continue
-
-            # add byte to receive stream
-            self.rxStream += c
+                if escape > pos:
+                    stop = escape
+                self.rxStream += data[pos:stop]
+                pos = stop
 
             # when minimum frame size is received, decode the length and check completeness of frame
-            if len(self.rxStream) >= HEADER_WITH_LENGTH:
-                if len(self.rxStream) == HEADER_WITH_LENGTH:
-                    cmd = struct.unpack("B", bytes([self.rxStream[1]]))[0]
-                    if cmd == cmd_long_response or cmd == cmd_long_write:
-                        self.FrameLength = struct.unpack(">H", self.rxStream[2:4])[0] + 2     # 2 byte length MSBF
-                    else:
-                        self.FrameLength = struct.unpack(">B", bytes([self.rxStream[2]]))[0] + 1       # 1 byte length
-
-                    self.FrameLength += 2                                                   # 2 bytes header
+            if len(self.rxStream) == HEADER_WITH_LENGTH:
+                cmd = self.rxStream[1]
+                if cmd == cmd_long_response or cmd == cmd_long_write:
+                    self.FrameLength = struct.unpack_from(">H", self.rxStream, 2)[0] + 2     # 2 byte length MSBF
                 else:
-                    if len(self.rxStream) == self.FrameLength + FRAME_CRC16_LENGTH:
-                        #print(binascii.hexlify(self.rxStream))
-                        self.decode()
-                        self.rxStream = b""
+                    self.FrameLength = self.rxStream[2] + 1                                 # 1 byte length
+
+                self.FrameLength += 2                                                       # 2 bytes header
+            elif len(self.rxStream) > HEADER_WITH_LENGTH and len(self.rxStream) == self.FrameLength + FRAME_CRC16_LENGTH:
+                self.decode()
+                self.rxStream = bytearray()
 
     # decode rxStream and store the values in the frame
     def decode(self):
         crc16_pos = len(self.rxStream)-2
-        received = struct.unpack(">H", self.rxStream[crc16_pos:crc16_pos+2])[0]
-        calculated = self.CRC16(self.rxStream[1:crc16_pos]) 
+        received = struct.unpack_from(">H", self.rxStream, crc16_pos)[0]
+        calculated = self.CRC16(memoryview(self.rxStream)[1:crc16_pos])
         if received != calculated:
             #print(binascii.hexlify(self.rxStream))
             #print("CRC Error: {}".format(binascii.hexlify(self.rxStream)))
@@ -214,45 +253,46 @@ class Frame:
 
         # CRC16 is correct
         # extract command and length field
-        self.command = struct.unpack(">B", bytes([self.rxStream[1]]))[0]
+        self.command = self.rxStream[1]
         if self.command == cmd_long_response or self.command == cmd_long_write:
-            data_length = struct.unpack(">H", self.rxStream[2:4])[0]  # 2 byte length MSBF
+            data_length = struct.unpack_from(">H", self.rxStream, 2)[0]  # 2 byte length MSBF
             idx = 4
         else:
-            data_length = struct.unpack(">B", bytes([self.rxStream[2]]))[0]   # 1 byte length
+            data_length = self.rxStream[2]   # 1 byte length
             idx = 3
 
         # substract frame type specific length
         data_length -= self.frame_type
 
         # extract 32 bit ID
-        id = struct.unpack(">I", self.rxStream[idx:idx+4])[0]
+        id = struct.unpack_from(">I", self.rxStream, idx)[0]
         idx += 4
 
         # Just for completeness. Plant specific frames should not be received
         if self.frame_type == FRAME_TYPE_PLANT:
-            self.address = struct.unpack(">I", self.rxStream[idx:idx+4])[0]
+            self.address = struct.unpack_from(">I", self.rxStream, idx)[0]
             idx += 4
 
         # extract the payload from the stream
-        data = self.rxStream[idx:idx+data_length]
+        data = bytes(self.rxStream[idx:idx+data_length])
         #data_dump = binascii.hexlify(data)                
 
         # just decode responses 
         if data_length > 0 and (self.command == cmd_response or self.command == cmd_long_response):
             # The frame object contains a list of id's for which responses are expected
-            for item in self.idList:
-                if item.id == id:
-                    # received ID found in the list. store the value in the item! 
+            items = self.idMap.get(id)
+            if items is not None:
+                # received ID found in the list. store the value in all items with this id!
+                for item in items:
                     item.value = item.decode_value(data)
                     # mark the ID item in the list as "not pending" (just if not yet done)
-                    if item.pending == True: 
+                    if item.pending == True:
                         item.pending = False
                         self.pendingCount -= 1
                         self.statisticRxConsumed += 1
                     else:
                         self.statisticRxDuplicate += 1
-                    return
+                return
 
         self.statisticRxDropped += 1
 
@@ -277,8 +317,8 @@ class Frame:
     # Run thru the idList and find elements which don't have a response received so far.
     def encode(self):
         # build a byte stream
-        buf_all = b""
-        
+        buf_all = bytearray()
+
         for item in self.idList:
             # consider items with id != 0 but without previous response
             if item.id != 0 and item.pending == True:
@@ -310,39 +350,26 @@ class Frame:
                 buf += struct.pack('>H', crc16)                               # 2 bytes
 
                 # add start token and inject escape tokens in buf where necessary to buf_all
-                buf_all += struct.pack('c', start_token) + self.createStream(buf)
+                buf_all += start_token
+                buf_all += self.createStream(buf)
 
-        return buf_all
+        return bytes(buf_all)
 
     # inject escape token whenever there is a 0x2B (start_token) or 0x2D (escape_token) byte in data
     def createStream(self, data):
-        stream = bytearray()
-        for d in data:
-            c = bytes([d])
-            if c == start_token or c == escape_token:
-                stream += escape_token
-
-            stream += c
-        return stream
+        return bytearray(bytes(data).replace(escape_token, escape_token + escape_token)
+                         .replace(start_token, escape_token + start_token))
 
     # calculate the CRC16 for the passed data stream
     def CRC16(self, data):
-        bitrange = range(8)  # 8 Bits
         crcsum = 0xFFFF
-        polynom = 0x1021  # CCITT Polynom
+        table = crc16_table
+        for byte in data:
+            crcsum = ((crcsum << 8) & 0xFFFF) ^ table[(crcsum >> 8) ^ byte]
 
-        # align buffer: append a 0 if needed
-        Buffer = bytearray(data)
+        # align buffer: a 0 is appended if needed
         if len(data) & 0x01:
-            Buffer.append(0)
-
-        for byte in Buffer:
-            crcsum ^= byte << 8
-            for bit in bitrange:  # Loop for 8 bits
-                crcsum <<= 1
-                if crcsum & 0x7FFF0000:
-                    # ~~ overflow in bit 16
-                    crcsum = (crcsum & 0x0000FFFF) ^ polynom
+            crcsum = ((crcsum << 8) & 0xFFFF) ^ table[crcsum >> 8]
         return crcsum
 
     # encode a value according to the id data type
@@ -394,6 +421,13 @@ class RCT():
 
         self.id_tab_setup()
 
+        # indexes for find_by_* and add_by_*, the first entry wins for duplicate ids or names
+        self.id_index = {}
+        self.name_index = {}
+        for l in self.id_tab:
+            self.id_index.setdefault(l.id, l)
+            self.name_index.setdefault(l.name, l)
+
         # parse command line arguments
         try:
             options, remainder = getopt.getopt(argv, '', ['ip=', 'debug', 'info', 'id=', 'name='])
@@ -418,7 +452,7 @@ class RCT():
     # find a table entry by using the 32 bit ID
     def find_by_id(self, id, tab = []):
         if tab == []:
-            tab = self.id_tab
+            return self.id_index.get(id)
 
         for l in tab:
             if l.id == id:
@@ -429,8 +463,8 @@ class RCT():
     # find a table entry by using the name
     def find_by_name(self, name, tab = []):
         if tab == []:
-            tab = self.id_tab
-            
+            return self.name_index.get(name)
+
         for l in tab:
             if l.name == name:
                 return l
@@ -439,23 +473,23 @@ class RCT():
 
     # search in id_tab by name and append a copy of the entry to the passed table tab
     def add_by_name(self, tab, name):
-        for l in self.id_tab:
-            if l.name == name:
-                newItem = copy.deepcopy(l)
-                tab.append(newItem)
-                return newItem
+        l = self.name_index.get(name)
+        if l is None:
+            return None
 
-        return None
+        newItem = l.clone()
+        tab.append(newItem)
+        return newItem
 
     # search in id_tab by id and append a copy of the entry to the passed table tab
     def add_by_id(self, tab, id):
-        for l in self.id_tab:
-            if l.id == id:
-                newItem = copy.deepcopy(l)
-                tab.append(newItem)
-                return newItem
+        l = self.id_index.get(id)
+        if l is None:
+            return None
 
-        return None
+        newItem = l.clone()
+        tab.append(newItem)
+        return newItem
 
     # helper function to connect to the RCT power device
     def connect_to_server(self):
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+# Benchmark der Protokollverarbeitung (encode, CRC16, consume) für eine komplette Abfrage von
+# rct_read_bezug.py, rct_read_wr.py und rct_read_speicher.py ohne Wechselrichter.
+# Aufruf: python3 rct_lib_benchmark.py
+import struct
+import timeit
+
+import rct_lib
+from rct_lib_test import response_stream
+
+NAMES = [
+    # rct_read_bezug.py
+    'energy.e_grid_feed_total', 'energy.e_grid_load_total', 'g_sync.p_ac_sc_sum', 'g_sync.u_l_rms[0]',
+    'g_sync.u_l_rms[1]', 'g_sync.u_l_rms[2]', 'g_sync.p_ac_sc[0]', 'g_sync.p_ac_sc[1]', 'g_sync.p_ac_sc[2]',
+    'grid_pll[0].f', 'fault[0].flt', 'fault[1].flt', 'fault[2].flt', 'fault[3].flt',
+    # rct_read_wr.py
+    'dc_conv.dc_conv_struct[0].p_dc', 'dc_conv.dc_conv_struct[1].p_dc', 'io_board.s0_external_power', 'p_rec_lim[2]',
+    'energy.e_dc_day[0]', 'energy.e_dc_day[1]', 'energy.e_ext_day', 'energy.e_dc_month[0]', 'energy.e_dc_month[1]',
+    'energy.e_ext_month', 'energy.e_dc_year[0]', 'energy.e_dc_year[1]', 'energy.e_ext_year', 'energy.e_dc_total[0]',
+    'energy.e_dc_total[1]', 'energy.e_ext_total',
+    # rct_read_speicher.py
+    'battery.soc', 'g_sync.p_acc_lp', 'battery.stored_energy', 'battery.used_energy', 'battery.bat_status',
+    'battery.status', 'battery.status2', 'battery.soc_target',
+]
+
+
+def main(number=200):
+    rct = rct_lib.RCT([])
+    items = [rct.find_by_name(name) for name in NAMES]
+    # jeder Wert mit 0x2B im Payload, damit auch das Escaping gemessen wird
+    response = b''.join(response_stream(item.id, struct.pack('>I', 0x2B2D2B2D)) for item in items)
+
+    def setup():
+        tab = []
+        for name in NAMES:
+            rct.add_by_name(tab, name)
+        return rct.read_setup_frame(tab)
+
+    def read():
+        frame = setup()
+        frame.encode()
+        frame.consume(response)
+        assert frame.pendingCount == 0
+
+    for name, case in (("id table setup", setup), ("full read", read)):
+        seconds = timeit.timeit(case, number=number)
+        print("bezug+wr+speicher {:15}: {} ids, {:.3f} ms".format(name, len(NAMES), seconds / number * 1000))
+
+if __name__ == "__main__":
+    main()
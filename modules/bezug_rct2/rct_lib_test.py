@@ -0,0 +1,153 @@
+import random
+import struct
+
+import pytest
+
+import rct_lib
+
+# Antwort auf die Abfrage von rct_read_bezug.py, enthält escapte Bytes (0x2D und ein 0x2B im Wert von fault[3].flt)
+SAMPLE_BEZUG_RESPONSE = bytes.fromhex(
+    "2b050844d4c5334b723159573d2b050862fbe7dc4a89e0e58d6a2b05086002891fc505f40021982b0508cf053085436780007faa"
+    "2b050854b4684e4365c000e2182b05082545e22d2d4366400065da2b050827be51d9c432200008e62b0508f5584f90c42f400021"
+    "482b0508b221bcfac436700067642b05081c4a665f4247eb85bc892b050837f9d5ca000000001d852b0508234b4736000000004c"
+    "522b05083b7fcd470000000012822b05087f813d730000002d2b7772")
+
+SAMPLE_BEZUG_VALUES = {
+    'energy.e_grid_feed_total': 15872345.0,
+    'energy.e_grid_load_total': 4518002.5,
+    'g_sync.p_ac_sc_sum': -2143.25,
+    'g_sync.u_l_rms[0]': 231.5,
+    'g_sync.u_l_rms[1]': 229.75,
+    'g_sync.u_l_rms[2]': 230.25,
+    'g_sync.p_ac_sc[0]': -712.5,
+    'g_sync.p_ac_sc[1]': -701.0,
+    'g_sync.p_ac_sc[2]': -729.75,
+    'grid_pll[0].f': pytest.approx(49.98),
+    'fault[0].flt': 0,
+    'fault[1].flt': 0,
+    'fault[2].flt': 0,
+    'fault[3].flt': 43,
+}
+
+
+def crc16_bitwise(data: bytes) -> int:
+    # bisherige bitweise Berechnung als Referenz
+    crcsum = 0xFFFF
+    buffer = bytearray(data)
+    if len(data) & 0x01:
+        buffer.append(0)
+    for byte in buffer:
+        crcsum ^= byte << 8
+        for bit in range(8):
+            crcsum <<= 1
+            if crcsum & 0x7FFF0000:
+                crcsum = (crcsum & 0x0000FFFF) ^ 0x1021
+    return crcsum
+
+
+def response_stream(id: int, payload: bytes, command: int = rct_lib.cmd_response) -> bytes:
+    frame = rct_lib.Frame()
+    if command == rct_lib.cmd_long_response:
+        buf = struct.pack('>BHI', command, 4 + len(payload), id) + payload
+    else:
+        buf = struct.pack('>BBI', command, 4 + len(payload), id) + payload
+    buf += struct.pack('>H', frame.CRC16(buf))
+    return rct_lib.start_token + bytes(frame.createStream(buf))
+
+
+def setup_frame(rct: rct_lib.RCT, names) -> rct_lib.Frame:
+    tab = []
+    for name in names:
+        rct.add_by_name(tab, name)
+    return rct.read_setup_frame(tab)
+
+
+def test_crc16_matches_bitwise():
+    frame = rct_lib.Frame()
+    generator = random.Random(0)
+    for length in range(64):
+        data = bytes(generator.getrandbits(8) for _ in range(length))
+        assert frame.CRC16(data) == crc16_bitwise(data)
+
+
+def test_create_stream_escapes_tokens():
+    assert rct_lib.Frame().createStream(b'\x01+\x02-\x03') == b'\x01-+\x02--\x03'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, len(SAMPLE_BEZUG_RESPONSE)])
+def test_consume_sample_response(chunk_size: int):
+    # setup
+    frame = setup_frame(rct_lib.RCT([]), SAMPLE_BEZUG_VALUES)
+
+    # execution
+    for pos in range(0, len(SAMPLE_BEZUG_RESPONSE), chunk_size):
+        frame.consume(SAMPLE_BEZUG_RESPONSE[pos:pos + chunk_size])
+
+    # evaluation
+    assert {item.name: item.value for item in frame.idList} == SAMPLE_BEZUG_VALUES
+    assert frame.pendingCount == 0
+    assert frame.statisticCrc16Error == 0
+
+
+def test_consume_skips_garbage_and_crc_errors():
+    # setup
+    rct = rct_lib.RCT([])
+    frame = setup_frame(rct, ['battery.soc', 'wifi.ip'])
+    soc = rct.find_by_name('battery.soc')
+    ip = rct.find_by_name('wifi.ip')
+    broken = bytearray(response_stream(soc.id, struct.pack('>f', 0.5)))
+    broken[-1] ^= 0xFF
+
+    # execution
+    frame.consume(b'\x00-\x01' + bytes(broken) + response_stream(soc.id, struct.pack('>f', 0.75)) +
+                  response_stream(ip.id, b'192.168.0.43', rct_lib.cmd_long_response))
+
+    # evaluation
+    assert frame.statisticCrc16Error == 1
+    assert [item.value for item in frame.idList] == [0.75, '192.168.0.43']
+    assert frame.pendingCount == 0
+
+
+def test_encode_round_trip():
+    # setup
+    rct = rct_lib.RCT([])
+    request = setup_frame(rct, SAMPLE_BEZUG_VALUES)
+    received = rct_lib.Frame(rct_lib.cmd_read)
+    ids = []
+    received.decode = lambda: ids.append(struct.unpack_from(">I", received.rxStream, 3)[0])
+
+    # execution
+    received.consume(request.encode())
+
+    # evaluation
+    assert ids == [rct.find_by_name(name).id for name in SAMPLE_BEZUG_VALUES]
+
+
+def test_add_by_name_clones_entry():
+    # setup
+    rct = rct_lib.RCT([])
+    tab = []
+
+    # execution
+    item = rct.add_by_name(tab, 'battery.soc')
+
+    # evaluation
+    entry = rct.find_by_name('battery.soc')
+    assert tab == [item]
+    assert item is not entry
+    assert (item.id, item.name, item.data_type) == (entry.id, entry.name, entry.data_type)
+    assert rct.find_by_id(entry.id) is entry
+    assert rct.add_by_name(tab, 'unknown') is None
+
+
+def test_consume_sets_all_items_with_same_id():
+    # setup
+    rct = rct_lib.RCT([])
+    frame = setup_frame(rct, ['battery.soc', 'battery.soc'])
+
+    # execution
+    frame.consume(response_stream(rct.find_by_name('battery.soc').id, struct.pack('>f', 0.5)))
+
+    # evaluation
+    assert [item.value for item in frame.idList] == [0.5, 0.5]
+    assert frame.pendingCount == 0
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+from typing import List
+import sys, traceback, time
+try: # make script callable from command line and LRS
+    from bezug_rct2 import rct_lib, rct_read_bezug, rct_read_speicher, rct_read_wr
+except:
+    import rct_lib, rct_read_bezug, rct_read_speicher, rct_read_wr
+
+# Fragt die Werte fuer EVU, PV und Speicher in einer gemeinsamen Verbindung ab und schreibt alle drei Ergebnisse.
+# Aufruf: rct_read_all.py --ip=<host> [bezug] [wr] [speicher]
+# Die Teile werden nach den Optionen angegeben, RCT() wertet nur die Optionen aus.
+PARTS = {
+    'bezug': rct_read_bezug,
+    'wr': rct_read_wr,
+    'speicher': rct_read_speicher,
+}
+
+
+# Entry point with parameter check
+def main(argv: List[str]):
+    start_time = time.time()
+    rct = rct_lib.RCT(argv)
+    parts = [part for part in argv if part in PARTS]
+
+    if rct.connect_to_server() == True:
+        try:
+            MyTab = []
+            ids = {}
+            for part in parts:
+                ids[part] = PARTS[part].add_ids(rct, MyTab)
+
+            # read all parameters of all parts
+            response = rct.read(MyTab)
+            rct.close()
+
+            # ein fehlender Wert betrifft nur den jeweiligen Teil
+            for part in parts:
+                try:
+                    PARTS[part].write_values(rct, ids[part])
+                except:
+                    print("-"*100)
+                    print("Fehler beim Schreiben der Werte fuer " + part)
+                    traceback.print_exc(file=sys.stdout)
+
+            # debug output of processing time and all response elements
+            rct.dbglog(response.format_list(time.time() - start_time))
+        except:
+            print("-"*100)
+            traceback.print_exc(file=sys.stdout)
+            rct.close()
+
+    rct = None
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
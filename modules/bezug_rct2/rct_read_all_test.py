@@ -0,0 +1,38 @@
+import struct
+
+import rct_read_all
+from rct_lib_test import response_stream
+
+# rct_read_all importiert rct_lib je nach sys.path als bezug_rct2.rct_lib
+rct_lib = rct_read_all.rct_lib
+
+
+def test_read_all_parts_in_one_session(monkeypatch):
+    # setup
+    connections = []
+    written = {}
+    requested = []
+
+    def read(self, idList):
+        requested.extend(item.name for item in idList)
+        frame = self.read_setup_frame(idList)
+        for item in idList:
+            value = struct.pack('>f', 200.0) if item.data_type == rct_lib.rct_data.t_float else struct.pack('>I', 0)
+            frame.consume(response_stream(item.id, value))
+        return frame
+
+    monkeypatch.setattr(rct_lib.RCT, "connect_to_server", lambda self: connections.append(self) or True)
+    monkeypatch.setattr(rct_lib.RCT, "read", read)
+    monkeypatch.setattr(rct_lib.RCT, "close", lambda self: None)
+    monkeypatch.setattr(rct_lib.RCT, "write_ramdisk", lambda self, fn, val, rctname: written.update({fn: val}))
+    monkeypatch.setattr(rct_read_all.rct_read_bezug.os, "system", lambda command: 0)
+
+    # execution
+    rct_read_all.main(["--ip=192.168.0.10", "bezug", "wr", "speicher"])
+
+    # evaluation
+    assert len(connections) == 1
+    assert len(requested) == 38
+    assert written["wattbezug"] == 200
+    assert written["pvwatt"] == -600
+    assert written["speichersoc"] == 20000
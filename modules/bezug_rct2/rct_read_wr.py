@@ -6,6 +6,57 @@ try: # make script callable from command line and LRS
 except:
     import rct_lib
 
+
+# id's der Abfrage an MyTab anhaengen (auch fuer die gemeinsame Abfrage in rct_read_all.py)
+def add_ids(rct, MyTab):
+    ids = {}
+    ids['pv1watt']  = rct.add_by_name(MyTab, 'dc_conv.dc_conv_struct[0].p_dc')
+    ids['pv2watt']  = rct.add_by_name(MyTab, 'dc_conv.dc_conv_struct[1].p_dc')
+    ids['pv3watt']  = rct.add_by_name(MyTab, 'io_board.s0_external_power')
+    ids['pLimit']   = rct.add_by_name(MyTab, 'p_rec_lim[2]')   # max. AC power according to RCT Power
+    ids['dA']       = rct.add_by_name(MyTab, 'energy.e_dc_day[0]')
+    ids['dB']       = rct.add_by_name(MyTab, 'energy.e_dc_day[1]')
+    ids['dE']       = rct.add_by_name(MyTab, 'energy.e_ext_day')
+    ids['mA']       = rct.add_by_name(MyTab, 'energy.e_dc_month[0]')
+    ids['mB']       = rct.add_by_name(MyTab, 'energy.e_dc_month[1]')
+    ids['mE']       = rct.add_by_name(MyTab, 'energy.e_ext_month')
+    ids['yA']       = rct.add_by_name(MyTab, 'energy.e_dc_year[0]')
+    ids['yB']       = rct.add_by_name(MyTab, 'energy.e_dc_year[1]')
+    ids['yE']       = rct.add_by_name(MyTab, 'energy.e_ext_year')
+    ids['pv1total'] = rct.add_by_name(MyTab, 'energy.e_dc_total[0]')
+    ids['pv2total'] = rct.add_by_name(MyTab, 'energy.e_dc_total[1]')
+    ids['pv3total'] = rct.add_by_name(MyTab, 'energy.e_ext_total')
+    return ids
+
+
+# Werte nachbearbeiten und in die ramdisk schreiben
+def write_values(rct, ids):
+    # actual DC power
+    rct.write_ramdisk('pv1wattString1', ids['pv1watt'].value, 'pv1watt')
+    rct.write_ramdisk('pv1wattString2', ids['pv2watt'].value, 'pv2watt')
+    pvwatt = ids['pv1watt'].value + ids['pv2watt'].value + ids['pv3watt'].value
+    rct.write_ramdisk('pvwatt', int(pvwatt) * -1, 'negative Summe von pv1watt + pv2watt + pv3watt')
+
+    # max. possible AC power (might be used by the control loop to limit PV charging power)
+    rct.write_ramdisk('maxACkW', int(ids['pLimit'].value), 'Maximale zur Ladung verwendete AC-Leistung des Wechselrichters')
+
+    # daily
+    daily_pvkwhk = (ids['dA'].value + ids['dB'].value + ids['dE'].value) / 1000.0   # -> KW
+    rct.write_ramdisk('daily_pvkwhk', daily_pvkwhk, 'daily_pvkwhk')
+
+    # monthly
+    monthly_pvkwhk = (ids['mA'].value + ids['mB'].value + ids['mE'].value) / 1000.0   # -> KW
+    rct.write_ramdisk('monthly_pvkwhk', monthly_pvkwhk, 'monthly_pvkwhk')
+
+    # yearly
+    yearly_pvkwhk = (ids['yA'].value + ids['yB'].value + ids['yE'].value) / 1000.0   # -> KW
+    rct.write_ramdisk('yearly_pvkwhk', yearly_pvkwhk, 'yearly_pvkwhk')
+
+    # total
+    pvkwh = (ids['pv1total'].value + ids['pv2total'].value + ids['pv3total'].value)
+    rct.write_ramdisk('pvkwh', pvkwh, 'Summe von pv1total pv1total pv1total')
+
+
 # Entry point with parameter check
 def main(argv: List[str]):
     start_time =  time.time()
@@ -14,51 +65,13 @@ def main(argv: List[str]):
     if rct.connect_to_server() == True:
         try:
             MyTab = []
-            pv1watt  = rct.add_by_name(MyTab, 'dc_conv.dc_conv_struct[0].p_dc')
-            pv2watt  = rct.add_by_name(MyTab, 'dc_conv.dc_conv_struct[1].p_dc')
-            pv3watt  = rct.add_by_name(MyTab, 'io_board.s0_external_power')
-            pLimit   = rct.add_by_name(MyTab, 'p_rec_lim[2]')   # max. AC power according to RCT Power
-            dA       = rct.add_by_name(MyTab, 'energy.e_dc_day[0]')
-            dB       = rct.add_by_name(MyTab, 'energy.e_dc_day[1]')
-            dE       = rct.add_by_name(MyTab, 'energy.e_ext_day')
-            mA       = rct.add_by_name(MyTab, 'energy.e_dc_month[0]')
-            mB       = rct.add_by_name(MyTab, 'energy.e_dc_month[1]')
-            mE       = rct.add_by_name(MyTab, 'energy.e_ext_month')
-            yA       = rct.add_by_name(MyTab, 'energy.e_dc_year[0]')
-            yB       = rct.add_by_name(MyTab, 'energy.e_dc_year[1]')
-            yE       = rct.add_by_name(MyTab, 'energy.e_ext_year')
-            pv1total = rct.add_by_name(MyTab, 'energy.e_dc_total[0]')
-            pv2total = rct.add_by_name(MyTab, 'energy.e_dc_total[1]')
-            pv3total = rct.add_by_name(MyTab, 'energy.e_ext_total')
+            ids = add_ids(rct, MyTab)
 
             # read all parameters
             response = rct.read(MyTab)
             rct.close()
 
-            # actual DC power
-            rct.write_ramdisk('pv1wattString1', pv1watt.value, 'pv1watt')
-            rct.write_ramdisk('pv1wattString2', pv2watt.value, 'pv2watt')
-            pvwatt = pv1watt.value + pv2watt.value + pv3watt.value
-            rct.write_ramdisk('pvwatt', int(pvwatt) * -1, 'negative Summe von pv1watt + pv2watt + pv3watt')
-
-            # max. possible AC power (might be used by the control loop to limit PV charging power)
-            rct.write_ramdisk('maxACkW', int(pLimit.value), 'Maximale zur Ladung verwendete AC-Leistung des Wechselrichters')
-
-            # daily
-            daily_pvkwhk = (dA.value + dB.value + dE.value) / 1000.0   # -> KW
-            rct.write_ramdisk('daily_pvkwhk', daily_pvkwhk, 'daily_pvkwhk')
-
-            # monthly
-            monthly_pvkwhk = (mA.value + mB.value + mE.value) / 1000.0   # -> KW
-            rct.write_ramdisk('monthly_pvkwhk', monthly_pvkwhk, 'monthly_pvkwhk')
-
-            # yearly
-            yearly_pvkwhk = (yA.value + yB.value + yE.value) / 1000.0   # -> KW
-            rct.write_ramdisk('yearly_pvkwhk', yearly_pvkwhk, 'yearly_pvkwhk')
-
-            # total
-            pvkwh = (pv1total.value + pv2total.value + pv3total.value)
-            rct.write_ramdisk('pvkwh', pvkwh, 'Summe von pv1total pv1total pv1total')
+            write_values(rct, ids)
 
             # debug output of processing time and all response elements
             rct.dbglog(response.format_list(time.time() - start_time))
@@ -1,3 +1,4 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
 
-sudo python /var/www/html/openWB/modules/mpm3pmlllp1/readmpm3pm.py $mpmlp1ip $mpmlp1id
+bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "1:$mpmlp1ip:$mpmlp1id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
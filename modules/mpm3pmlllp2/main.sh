@@ -1,3 +1,4 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
 
-sudo python /var/www/html/openWB/modules/mpm3pmlllp2/readmpm3pm.py $mpmlp2ip $mpmlp2id
+bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "2:$mpmlp2ip:$mpmlp2id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
@@ -1,3 +1,4 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
 
-sudo python /var/www/html/openWB/modules/mpm3pmlllp3/readmpm3pm.py $mpmlp3ip $mpmlp3id
+bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "3:$mpmlp3ip:$mpmlp3id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
@@ -1,6 +1,8 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
+
 if [[ $evseconlp4 == "extopenwb" ]]; then
 	/var/www/html/openWB/modules/extopenwb/main.sh 4 $chargep4ip
 else
-	sudo python /var/www/html/openWB/modules/mpm3pmlllp4/readmpm3pm.py $mpmlp4ip $mpmlp4id
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "4:$mpmlp4ip:$mpmlp4id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
 fi
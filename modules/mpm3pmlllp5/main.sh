@@ -1,6 +1,8 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
+
 if [[ $evseconlp5 == "extopenwb" ]]; then
 	/var/www/html/openWB/modules/extopenwb/main.sh 5 $chargep5ip
 else
-	sudo python /var/www/html/openWB/modules/mpm3pmlllp5/readmpm3pm.py $mpmlp5ip $mpmlp5id
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "5:$mpmlp5ip:$mpmlp5id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
 fi
@@ -1,6 +1,8 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
+
 if [[ $evseconlp6 == "extopenwb" ]]; then
 	/var/www/html/openWB/modules/extopenwb/main.sh 6 $chargep6ip
 else
-	sudo python /var/www/html/openWB/modules/mpm3pmlllp6/readmpm3pm.py $mpmlp6ip $mpmlp6id
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "6:$mpmlp6ip:$mpmlp6id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
 fi
@@ -1,6 +1,8 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
+
 if [[ $evseconlp7 == "extopenwb" ]]; then
 	/var/www/html/openWB/modules/extopenwb/main.sh 7 $chargep7ip
 else
-	sudo python /var/www/html/openWB/modules/mpm3pmlllp7/readmpm3pm.py $mpmlp7ip $mpmlp7id
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "7:$mpmlp7ip:$mpmlp7id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
 fi
@@ -1,6 +1,8 @@
 #!/bin/bash
+OPENWBBASEDIR=$(cd "$(dirname "$0")/../../" && pwd)
+
 if [[ $evseconlp8 == "extopenwb" ]]; then
 	/var/www/html/openWB/modules/extopenwb/main.sh 8 $chargep8ip
 else
-	sudo python /var/www/html/openWB/modules/mpm3pmlllp8/readmpm3pm.py $mpmlp8ip $mpmlp8id
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "modules.chargepoints.lp_meter.meter" "read" "8:$mpmlp8ip:$mpmlp8id" >>"$OPENWBBASEDIR/ramdisk/openWB.log" 2>&1
 fi
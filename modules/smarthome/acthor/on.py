@@ -1,23 +1,28 @@
 #!/usr/bin/python3
 import sys
-import logging
 from smarthome.smartlog import initlog
-bp = '/var/www/html/openWB/ramdisk/smarthome_device_'
-devicenumber = int(sys.argv[1])
-ipadr = str(sys.argv[2])
-uberschuss = int(sys.argv[3])
-initlog("acthor", devicenumber)
-log = logging.getLogger("acthor")
-file_stringpv = bp + str(devicenumber) + '_pv'
-file_stringcount = bp + str(devicenumber) + '_count'
-file_stringcount5 = bp + str(devicenumber) + '_count5'
-log.info(" on devicenr %d ipadr %s ueberschuss %6d" %
-         (devicenumber, ipadr, uberschuss))
-with open(file_stringpv, 'w') as f:
-    f.write(str(1))
-count1 = 999
-with open(file_stringcount, 'w') as f:
-    f.write(str(count1))
-count5 = 999
-with open(file_stringcount5, 'w') as f:
-    f.write(str(count5))
+
+
+def on(argv):
+    bp = '/var/www/html/openWB/ramdisk/smarthome_device_'
+    devicenumber = int(argv[0])
+    ipadr = str(argv[1])
+    uberschuss = int(argv[2])
+    log = initlog("acthor", devicenumber)
+    file_stringpv = bp + str(devicenumber) + '_pv'
+    file_stringcount = bp + str(devicenumber) + '_count'
+    file_stringcount5 = bp + str(devicenumber) + '_count5'
+    log.info(" on devicenr %d ipadr %s ueberschuss %6d" %
+             (devicenumber, ipadr, uberschuss))
+    with open(file_stringpv, 'w') as f:
+        f.write(str(1))
+    count1 = 999
+    with open(file_stringcount, 'w') as f:
+        f.write(str(count1))
+    count5 = 999
+    with open(file_stringcount5, 'w') as f:
+        f.write(str(count5))
+
+
+if __name__ == '__main__':
+    on(sys.argv[1:])
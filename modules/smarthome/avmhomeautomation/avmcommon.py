@@ -15,13 +15,14 @@ LOGLEVELINFO = 1
 LOGLEVELERROR = 2
 
 class AVMHomeAutomation:
-    # Parse configuration from command line arguments as proviced by /runs/smarthomehandler.py
-    def __init__(self):
-        self.devicenumber = str(sys.argv[1])
-        self.host = str(sys.argv[2]) # IP or hostname (e.g. "fritz.box")
-        self.switchname = str(sys.argv[5])
-        self.username = str(sys.argv[6])
-        self.password = str(sys.argv[7])
+    # Parse configuration from the argument list as proviced by /runs/smarthomehandler.py
+    # (command line arguments without the program name)
+    def __init__(self, argv):
+        self.devicenumber = str(argv[0])
+        self.host = str(argv[1]) # IP or hostname (e.g. "fritz.box")
+        self.switchname = str(argv[4])
+        self.username = str(argv[5])
+        self.password = str(argv[6])
         self.baseURL = "http://" + self.host
         self.sessionID = ""
         self.device_infos = {}
@@ -313,18 +314,17 @@ class AVMHomeAutomation:
         self.logMessage(LOGLEVELDEBUG, "end of switchDevice")
 
 
-    # getActualPowerForce returns current observed power and the state of the switch relais.
-    # The JSON answer is either written to the according smarthome device return file
-    # or dumped to stdout if no such file exists (for local development)
+    # getActualPower returns current observed power and the state of the switch relais
+    # as dictionary, None if no values could be retrieved.
     def getActualPower(self):
         if self.sessionID == INVALID_SESSIONID:
             self.logMessage(LOGLEVELERROR, "Kann ohne valide Anmeldung keine neuen Daten holen.")
-            return
+            return None
         self.logMessage(LOGLEVELDEBUG, "start of getActualPower")
         self.readOrBuildDeviceInfoCache()
         if not self.switchname in self.device_infos:
             self.logMessage(LOGLEVELERROR, "no such device found at FRITZ!Box: %s" % (self.switchname))
-            return
+            return None
 
         try:
             switch = self.device_infos[self.switchname]
@@ -346,24 +346,13 @@ class AVMHomeAutomation:
             else:
                 self.logMessage(LOGLEVELERROR, "device does not provider switch state, falling back to OFF")
                 relais = 0
-            answer = '{"power":' + str(aktpower) + ',"powerc":' + str(powerc) + ',"on":' + str(relais) + '}'
+            answer = {"power": float(aktpower), "powerc": float(powerc), "on": relais}
         except:
             exc_type, exc_obj, exc_tb = sys.exc_info()
             fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            self.logMessage(LOGLEVELERROR, "unexpected error getActualPower build JSON string: %s %s %s" % (exc_type, fname, exc_tb.tb_lineno))
+            self.logMessage(LOGLEVELERROR, "unexpected error getActualPower build answer: %s %s %s" % (exc_type, fname, exc_tb.tb_lineno))
+            return None
 
-        self.logMessage(LOGLEVELDEBUG, "constructed JSON answer: %s" % (answer))
-        outFileString ='/var/www/html/openWB/ramdisk/smarthome_device_ret' + str(self.devicenumber);
-        self.logMessage(LOGLEVELDEBUG, "handing answer back to smarthomehandler via %s" % (outFileString))
-        try:
-            f1 = open(outFileString, 'w')
-            json.dump(answer, f1)
-            f1.close()
-        except IOError as e:
-            self.logMessage(LOGLEVELERROR, "error writing power result %s" % (e))
-            print(answer) # dump answer to stdout if file cannot be written
-        except:
-            exc_type, exc_obj, exc_tb = sys.exc_info()
-            fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            self.logMessage(LOGLEVELERROR, "unexpected error getActualPower write JSON %s %s %s" % (exc_type, fname, exc_tb.tb_lineno))
+        self.logMessage(LOGLEVELDEBUG, "constructed answer: %s" % (answer))
         self.logMessage(LOGLEVELDEBUG, "end of getActualPower")
+        return answer
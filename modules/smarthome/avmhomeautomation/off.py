@@ -1,6 +1,13 @@
 #!/usr/bin/python3
+import sys
 import avmcommon
 
-interface = avmcommon.AVMHomeAutomation()
-interface.connect()
-interface.switchDevice(False)
+
+def off(argv):
+    interface = avmcommon.AVMHomeAutomation(argv)
+    interface.connect()
+    interface.switchDevice(False)
+
+
+if __name__ == '__main__':
+    off(sys.argv[1:])
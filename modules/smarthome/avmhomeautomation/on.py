@@ -1,6 +1,13 @@
 #!/usr/bin/python3
+import sys
 import avmcommon
 
-interface = avmcommon.AVMHomeAutomation()
-interface.connect()
-interface.switchDevice(True)
+
+def on(argv):
+    interface = avmcommon.AVMHomeAutomation(argv)
+    interface.connect()
+    interface.switchDevice(True)
+
+
+if __name__ == '__main__':
+    on(sys.argv[1:])
@@ -1,6 +1,17 @@
 #!/usr/bin/python3
+import sys
+import json
 import avmcommon
+from smarthome.smartret import writeret
 
-interface = avmcommon.AVMHomeAutomation()
-interface.connect()
-interface.getActualPower()
+
+def watt(argv):
+    interface = avmcommon.AVMHomeAutomation(argv)
+    interface.connect()
+    return interface.getActualPower()
+
+
+if __name__ == '__main__':
+    answer = watt(sys.argv[1:])
+    if answer is not None:
+        writeret(json.dumps(answer), int(sys.argv[1]))
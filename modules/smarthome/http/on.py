@@ -1,17 +1,22 @@
 #!/usr/bin/python3
 import sys
-import logging
 from smarthome.smartlog import initlog
 from urllib.request import Request, urlopen
 from urllib.parse import urlparse
-devicenumber = int(sys.argv[1])
-uberschuss = int(sys.argv[3])
-url = str(sys.argv[4])
-initlog("http", devicenumber)
-log = logging.getLogger("http")
-if not urlparse(url).scheme:
-    url = 'http://' + url
-log.info('on devicenr %d url %s' % (devicenumber, url))
-headers = {'User-Agent': 'Mozilla/5.0'}
-request = Request(url, headers=headers)
-urlopen(request, timeout=5).read()
+
+
+def on(argv):
+    devicenumber = int(argv[0])
+    uberschuss = int(argv[2])
+    url = str(argv[3])
+    log = initlog("http", devicenumber)
+    if not urlparse(url).scheme:
+        url = 'http://' + url
+    log.info('on devicenr %d url %s' % (devicenumber, url))
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    request = Request(url, headers=headers)
+    urlopen(request, timeout=5).read()
+
+
+if __name__ == '__main__':
+    on(sys.argv[1:])
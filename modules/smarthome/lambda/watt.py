@@ -7,118 +7,126 @@ import struct
 import codecs
 from pymodbus.payload import BinaryPayloadBuilder, Endian
 from pymodbus.client.sync import ModbusTcpClient
-named_tuple = time.localtime()  # getstruct_time
-time_string = time.strftime("%m/%d/%Y, %H:%M:%S lambda watty.py", named_tuple)
-devicenumber = str(sys.argv[1])
-ipadr = str(sys.argv[2])
-uberschuss = int(sys.argv[3])
-uberschussvz = str(sys.argv[4])
-forcesend = int(sys.argv[5])
-# forcesend = 0 default acthor time period applies
-# forcesend = 1 default overwritten send now
-# forcesend = 9 default overwritten no send
-if (uberschussvz == 'UN'):
-    uberschuss = uberschuss * -1
-bp = '/var/www/html/openWB/ramdisk/smarthome_device_'
-file_string = bp + str(devicenumber) + '_lambda.log'
-file_stringpv = bp + str(devicenumber) + '_pv'
-file_stringcount = bp + str(devicenumber) + '_count'
-file_stringcount5 = bp + str(devicenumber) + '_count5'
-count5 = 999
-modbuswrite = 0
-neupower = 0
-if os.path.isfile(file_stringcount5):
-    with open(file_stringcount5, 'r') as f:
-        count5 = int(f.read())
-if (forcesend == 0):
-    count5 = count5 + 1
-elif (forcesend == 1):
+from smarthome.smartret import writeret
+from smarthome.smartret import writeret
+
+
+def watt(argv):
+    named_tuple = time.localtime()  # getstruct_time
+    time_string = time.strftime("%m/%d/%Y, %H:%M:%S lambda watty.py", named_tuple)
+    devicenumber = str(argv[0])
+    ipadr = str(argv[1])
+    uberschuss = int(argv[2])
+    uberschussvz = str(argv[3])
+    forcesend = int(argv[4])
+    # forcesend = 0 default acthor time period applies
+    # forcesend = 1 default overwritten send now
+    # forcesend = 9 default overwritten no send
+    if (uberschussvz == 'UN'):
+        uberschuss = uberschuss * -1
+    bp = '/var/www/html/openWB/ramdisk/smarthome_device_'
+    file_string = bp + str(devicenumber) + '_lambda.log'
+    file_stringpv = bp + str(devicenumber) + '_pv'
+    file_stringcount = bp + str(devicenumber) + '_count'
+    file_stringcount5 = bp + str(devicenumber) + '_count5'
     count5 = 999
-else:
-    count5 = 1
-if count5 > 3:
-    count5 = 0
-with open(file_stringcount5, 'w') as f:
-    f.write(str(count5))
-# pv modus
-pvmodus = 0
-if os.path.isfile(file_stringpv):
-    with open(file_stringpv, 'r') as f:
-        pvmodus = int(f.read())
-# aktuelle Leistung lesen
-client = ModbusTcpClient(ipadr, port=502)
-start = 103
-resp = client.read_holding_registers(start, 2)
-#
-value1 = resp.registers[0]
-all = format(value1, '04x')
-aktpower = int(struct.unpack('>h', codecs.decode(all, 'hex'))[0])
-if count5 == 0:
-    # log counter
-    count1 = 999
-    if os.path.isfile(file_stringcount):
-        with open(file_stringcount, 'r') as f:
-            count1 = int(f.read())
-    count1 = count1+1
-    if count1 > 80:
-        count1 = 0
-    with open(file_stringcount, 'w') as f:
-        f.write(str(count1))
-    # logik nur schicken bei pvmodus
-    if pvmodus == 1:
-        modbuswrite = 1
-    neupower = uberschuss
-    if (uberschussvz == 'UZ'):
-        if neupower < 0:
-            neupower = 0
-        if neupower > 65535:
-            neupower = 65535
+    modbuswrite = 0
+    neupower = 0
+    if os.path.isfile(file_stringcount5):
+        with open(file_stringcount5, 'r') as f:
+            count5 = int(f.read())
+    if (forcesend == 0):
+        count5 = count5 + 1
+    elif (forcesend == 1):
+        count5 = 999
     else:
-        if neupower < -32767:
-            neupower = -32767
-        if neupower > 32767:
-            neupower = 32767
-    # wurde lambda gerade ausgeschaltet ?    (pvmodus == 99 ?)
-    # dann 0 schicken wenn kein pvmodus mehr
-    # und pv modus ausschalten
-    if pvmodus == 99:
-        modbuswrite = 1
-        neupower = 0
-        pvmodus = 0
-        with open(file_stringpv, 'w') as f:
-            f.write(str(pvmodus))
-    if count1 < 3:
-        if os.path.isfile(file_string):
-            pass
+        count5 = 1
+    if count5 > 3:
+        count5 = 0
+    with open(file_stringcount5, 'w') as f:
+        f.write(str(count5))
+    # pv modus
+    pvmodus = 0
+    if os.path.isfile(file_stringpv):
+        with open(file_stringpv, 'r') as f:
+            pvmodus = int(f.read())
+    # aktuelle Leistung lesen
+    client = ModbusTcpClient(ipadr, port=502)
+    start = 103
+    resp = client.read_holding_registers(start, 2)
+    #
+    value1 = resp.registers[0]
+    all = format(value1, '04x')
+    aktpower = int(struct.unpack('>h', codecs.decode(all, 'hex'))[0])
+    if count5 == 0:
+        # log counter
+        count1 = 999
+        if os.path.isfile(file_stringcount):
+            with open(file_stringcount, 'r') as f:
+                count1 = int(f.read())
+        count1 = count1+1
+        if count1 > 80:
+            count1 = 0
+        with open(file_stringcount, 'w') as f:
+            f.write(str(count1))
+        # logik nur schicken bei pvmodus
+        if pvmodus == 1:
+            modbuswrite = 1
+        neupower = uberschuss
+        if (uberschussvz == 'UZ'):
+            if neupower < 0:
+                neupower = 0
+            if neupower > 65535:
+                neupower = 65535
         else:
-            with open(file_string, 'w') as f:
-                print('lambda start log', file=f)
-        with open(file_string, 'a') as f:
-            print('%s Nr %s ipadr %s ueberschuss %6d Akt Leistung %6d'
-                  % (time_string, devicenumber, ipadr, uberschuss, aktpower),
-                  file=f)
-            print('%s Nr %s ipadr %s neupower %6d pvmodus %1d modbusw %1d'
-                  % (time_string, devicenumber, ipadr, neupower, pvmodus,
-                     modbuswrite), file=f)
-    # modbus write
-    if modbuswrite == 1:
-        # andernfalls absturz bei negativen Zahlen
-        builder = BinaryPayloadBuilder(byteorder=Endian.Big)
-        builder.reset()
-        builder.add_16bit_int(neupower)
-        pay = builder.to_registers()
-        client.write_registers(102, [pay[0]])
+            if neupower < -32767:
+                neupower = -32767
+            if neupower > 32767:
+                neupower = 32767
+        # wurde lambda gerade ausgeschaltet ?    (pvmodus == 99 ?)
+        # dann 0 schicken wenn kein pvmodus mehr
+        # und pv modus ausschalten
+        if pvmodus == 99:
+            modbuswrite = 1
+            neupower = 0
+            pvmodus = 0
+            with open(file_stringpv, 'w') as f:
+                f.write(str(pvmodus))
         if count1 < 3:
+            if os.path.isfile(file_string):
+                pass
+            else:
+                with open(file_string, 'w') as f:
+                    print('lambda start log', file=f)
             with open(file_string, 'a') as f:
-                print('%s devicenr %s ipadr %s written %6d %#4X' %
-                      (time_string, devicenumber, ipadr, pay[0], pay[0]),
+                print('%s Nr %s ipadr %s ueberschuss %6d Akt Leistung %6d'
+                      % (time_string, devicenumber, ipadr, uberschuss, aktpower),
                       file=f)
-else:
-    if pvmodus == 99:
-        pvmodus = 0
-answer = '{"power":' + str(aktpower) + ',"powerc":0'
-answer += ',"send":' + str(modbuswrite) + ',"sendpower":' + str(neupower)
-answer += ',"on":' + str(pvmodus) + '}'
-with open('/var/www/html/openWB/ramdisk/smarthome_device_ret' +
-          str(devicenumber), 'w') as f1:
-    json.dump(answer, f1)
+                print('%s Nr %s ipadr %s neupower %6d pvmodus %1d modbusw %1d'
+                      % (time_string, devicenumber, ipadr, neupower, pvmodus,
+                         modbuswrite), file=f)
+        # modbus write
+        if modbuswrite == 1:
+            # andernfalls absturz bei negativen Zahlen
+            builder = BinaryPayloadBuilder(byteorder=Endian.Big)
+            builder.reset()
+            builder.add_16bit_int(neupower)
+            pay = builder.to_registers()
+            client.write_registers(102, [pay[0]])
+            if count1 < 3:
+                with open(file_string, 'a') as f:
+                    print('%s devicenr %s ipadr %s written %6d %#4X' %
+                          (time_string, devicenumber, ipadr, pay[0], pay[0]),
+                          file=f)
+    else:
+        if pvmodus == 99:
+            pvmodus = 0
+    client.close()
+    answer = '{"power":' + str(aktpower) + ',"powerc":0'
+    answer += ',"send":' + str(modbuswrite) + ',"sendpower":' + str(neupower)
+    answer += ',"on":' + str(pvmodus) + '}'
+    return json.loads(answer)
+
+
+if __name__ == '__main__':
+    writeret(json.dumps(watt(sys.argv[1:])), int(sys.argv[1]))
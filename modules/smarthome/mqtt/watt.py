@@ -10,59 +10,61 @@ import codecs
 import binascii
 import paho.mqtt.client as mqtt
 import re
+from smarthome.smartret import writeret
 numberOfSupportedDevices=9 # limit number of smarthome devices
-def on_connect(client, userdata, flags, rc):
-    global devicenumber
-    client.subscribe("openWB/SmartHome/set/Devices/"+devicenumber+ "/#",2)
-    
-def on_message(client, userdata, msg):
-    global numberOfSupportedDevices
-    global aktpower
-    global powerc
-    if (( "openWB/SmartHome/set/Device" in msg.topic) and ("Aktpower" in msg.topic)):
-        devicenumb=re.sub(r'\D', '', msg.topic)
-        if ( 1 <= int(devicenumb) <= numberOfSupportedDevices ):
-            aktpower = int(msg.payload)
-    if (( "openWB/SmartHome/set/Device" in msg.topic) and ("Powerc" in msg.topic)):
-        devicenumb=re.sub(r'\D', '', msg.topic)
-        if ( 1 <= int(devicenumb) <= numberOfSupportedDevices ):
-            powerc = int(msg.payload)
-            
-aktpower = 0
-powerc = 0
-devicenumber=str(sys.argv[1])
-ipadr=str(sys.argv[2])
-uberschuss=int(sys.argv[3])
-file_string= '/var/www/html/openWB/ramdisk/smarthome_device_' + str(devicenumber) + '_mqtt.log'
-if os.path.isfile(file_string):
-    fx = open( file_string , 'a')
-else:
-    fx = open( file_string , 'w')
-named_tuple = time.localtime() # getstruct_time
-time_string = time.strftime("%m/%d/%Y, %H:%M:%S mqtt watt.py", named_tuple)
-client = mqtt.Client("openWB-mqttsmarthomecust" + devicenumber)
-client.on_connect = on_connect
-client.on_message = on_message
-startTime = time.time()
-waitTime = 5
-client.connect("localhost")
-while True:
-    client.loop()
-    elapsedTime = time.time() - startTime
-    if elapsedTime > waitTime:
-        break
-client.publish("openWB/SmartHome/set/Devices/"+str(devicenumber)+"/Ueberschuss", payload=str(uberschuss), qos=0, retain=True)
-client.loop(timeout=2.0)
-client.disconnect()
-file_stringpv= '/var/www/html/openWB/ramdisk/smarthome_device_' + str(devicenumber) + '_pv'
-# pv modus
-pvmodus = 0
-if os.path.isfile(file_stringpv):
-    f = open( file_stringpv , 'r')
-    pvmodus =int(f.read())
-    f.close()
-answer = '{"power":' + str(aktpower) + ',"powerc":' + str(powerc) + ',"on":' + str(pvmodus) + '} '
-f1 = open('/var/www/html/openWB/ramdisk/smarthome_device_ret' + str(devicenumber), 'w')
-json.dump(answer,f1)
-f1.close()
-fx.close()
+
+
+def watt(argv):
+    values = {'aktpower': 0, 'powerc': 0}
+
+    def on_connect(client, userdata, flags, rc):
+        client.subscribe("openWB/SmartHome/set/Devices/"+devicenumber+ "/#",2)
+
+    def on_message(client, userdata, msg):
+        if (( "openWB/SmartHome/set/Device" in msg.topic) and ("Aktpower" in msg.topic)):
+            devicenumb=re.sub(r'\D', '', msg.topic)
+            if ( 1 <= int(devicenumb) <= numberOfSupportedDevices ):
+                values['aktpower'] = int(msg.payload)
+        if (( "openWB/SmartHome/set/Device" in msg.topic) and ("Powerc" in msg.topic)):
+            devicenumb=re.sub(r'\D', '', msg.topic)
+            if ( 1 <= int(devicenumb) <= numberOfSupportedDevices ):
+                values['powerc'] = int(msg.payload)
+
+    devicenumber=str(argv[0])
+    ipadr=str(argv[1])
+    uberschuss=int(argv[2])
+    file_string= '/var/www/html/openWB/ramdisk/smarthome_device_' + str(devicenumber) + '_mqtt.log'
+    if os.path.isfile(file_string):
+        fx = open( file_string , 'a')
+    else:
+        fx = open( file_string , 'w')
+    named_tuple = time.localtime() # getstruct_time
+    time_string = time.strftime("%m/%d/%Y, %H:%M:%S mqtt watt.py", named_tuple)
+    client = mqtt.Client("openWB-mqttsmarthomecust" + devicenumber)
+    client.on_connect = on_connect
+    client.on_message = on_message
+    startTime = time.time()
+    waitTime = 5
+    client.connect("localhost")
+    while True:
+        client.loop()
+        elapsedTime = time.time() - startTime
+        if elapsedTime > waitTime:
+            break
+    client.publish("openWB/SmartHome/set/Devices/"+str(devicenumber)+"/Ueberschuss", payload=str(uberschuss), qos=0, retain=True)
+    client.loop(timeout=2.0)
+    client.disconnect()
+    file_stringpv= '/var/www/html/openWB/ramdisk/smarthome_device_' + str(devicenumber) + '_pv'
+    # pv modus
+    pvmodus = 0
+    if os.path.isfile(file_stringpv):
+        f = open( file_stringpv , 'r')
+        pvmodus =int(f.read())
+        f.close()
+    answer = '{"power":' + str(values['aktpower']) + ',"powerc":' + str(values['powerc']) + ',"on":' + str(pvmodus) + '} '
+    fx.close()
+    return json.loads(answer)
+
+
+if __name__ == '__main__':
+    writeret(json.dumps(watt(sys.argv[1:])), int(sys.argv[1]))
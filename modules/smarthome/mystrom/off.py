@@ -9,9 +9,16 @@ import struct
 import codecs
 import binascii
 import urllib.request
-named_tuple = time.localtime() # getstruct_time
-time_string = time.strftime("%m/%d/%Y, %H:%M:%S mystrom off.py", named_tuple)
-devicenumber=str(sys.argv[1])
-ipadr=str(sys.argv[2])
-uberschuss=int(sys.argv[3])
-urllib.request.urlopen("http://"+str(ipadr)+"/relay?state=0", timeout=3)
+
+
+def off(argv):
+    named_tuple = time.localtime() # getstruct_time
+    time_string = time.strftime("%m/%d/%Y, %H:%M:%S mystrom off.py", named_tuple)
+    devicenumber=str(argv[0])
+    ipadr=str(argv[1])
+    uberschuss=int(argv[2])
+    urllib.request.urlopen("http://"+str(ipadr)+"/relay?state=0", timeout=3)
+
+
+if __name__ == '__main__':
+    off(sys.argv[1:])
@@ -1,30 +1,35 @@
 #!/usr/bin/python3
 import os
 import sys
-import logging
 from smarthome.smartlog import initlog
-devicenumber = int(sys.argv[1])
-ipadr = str(sys.argv[2])
-uberschuss = int(sys.argv[3])
-bp = '/var/www/html/openWB/ramdisk/smarthome_device_'
-# standard
-file_stringpv = bp + str(devicenumber) + '_pv'
-file_stringcount = bp + str(devicenumber) + '_count'
-initlog("ratiotherm", devicenumber)
-log = logging.getLogger("ratiotherm")
-aktpower = 0
-log.info(" off devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d"
-         % (devicenumber, ipadr, uberschuss, aktpower))
-pvmodus = 0
-if os.path.isfile(file_stringpv):
-    with open(file_stringpv, 'r') as f:
-        pvmodus = int(f.read())
-# wenn vorher pvmodus an, dann watt.py
-# signaliseren einmalig 0 ueberschuss zu schicken
-if pvmodus == 1:
-    pvmodus = 99
-with open(file_stringpv, 'w') as f:
-    f.write(str(pvmodus))
-count1 = 999
-with open(file_stringcount, 'w') as f:
-    f.write(str(count1))
+
+
+def off(argv):
+    devicenumber = int(argv[0])
+    ipadr = str(argv[1])
+    uberschuss = int(argv[2])
+    bp = '/var/www/html/openWB/ramdisk/smarthome_device_'
+    # standard
+    file_stringpv = bp + str(devicenumber) + '_pv'
+    file_stringcount = bp + str(devicenumber) + '_count'
+    log = initlog("ratiotherm", devicenumber)
+    aktpower = 0
+    log.info(" off devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d"
+             % (devicenumber, ipadr, uberschuss, aktpower))
+    pvmodus = 0
+    if os.path.isfile(file_stringpv):
+        with open(file_stringpv, 'r') as f:
+            pvmodus = int(f.read())
+    # wenn vorher pvmodus an, dann watt.py
+    # signaliseren einmalig 0 ueberschuss zu schicken
+    if pvmodus == 1:
+        pvmodus = 99
+    with open(file_stringpv, 'w') as f:
+        f.write(str(pvmodus))
+    count1 = 999
+    with open(file_stringcount, 'w') as f:
+        f.write(str(count1))
+
+
+if __name__ == '__main__':
+    off(sys.argv[1:])
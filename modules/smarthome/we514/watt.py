@@ -7,39 +7,43 @@ import socket
 import struct
 import binascii
 import json
+from pymodbus.client.sync import ModbusTcpClient
+from pymodbus.transaction import ModbusRtuFramer
+from smarthome.smartret import writeret
 
-# get variables from arguments
-devicenumber = str(sys.argv[1]) # Smarthome device number
-SERVER_HOST = str(sys.argv[2]) # IP of server to connect to
-MODBUS_DEVICEID = int(sys.argv[3]) # Modbus device ID
 
-SERVER_PORT="502" # TCP port to connect to, should be moved into argument as well
+def watt(argv):
+    # get variables from arguments
+    devicenumber = str(argv[0]) # Smarthome device number
+    SERVER_HOST = str(argv[1]) # IP of server to connect to
+    MODBUS_DEVICEID = int(argv[2]) # Modbus device ID
 
-# Registers: https://github.com/gituser-rk/orno-modbus-mqtt/blob/master/Register%20description%20OR-WE-514%26OR-WE-515.pdf
-# 0x131 frequency
-# 0x131 voltage
-# 0x141 power 
-# 0xA001 (total energy rate1)
+    SERVER_PORT="502" # TCP port to connect to, should be moved into argument as well
 
-TotalEnergyRegisterAddress = 0xA001 # register for total energy
-CurrentPowerRegisterAddress = 0x141 # register for current power reading
+    # Registers: https://github.com/gituser-rk/orno-modbus-mqtt/blob/master/Register%20description%20OR-WE-514%26OR-WE-515.pdf
+    # 0x131 frequency
+    # 0x131 voltage
+    # 0x141 power 
+    # 0xA001 (total energy rate1)
 
-from pymodbus.client.sync import ModbusTcpClient
-from pymodbus.transaction import ModbusRtuFramer
+    TotalEnergyRegisterAddress = 0xA001 # register for total energy
+    CurrentPowerRegisterAddress = 0x141 # register for current power reading
+
+    client = ModbusTcpClient(SERVER_HOST, SERVER_PORT, framer=ModbusRtuFramer) # need to specify framer to enable RTUoverTCP
+
+    #KWH Total Import
+    resp = client.read_holding_registers(TotalEnergyRegisterAddress,1, unit=MODBUS_DEVICEID)
+    TotalEnergy = int(resp.registers[0]) * 10 #Value is in 0.01kWh, need to convert to Wh
 
-client = ModbusTcpClient(SERVER_HOST, SERVER_PORT, framer=ModbusRtuFramer) # need to specify framer to enable RTUoverTCP
+    #Aktueller Verbrauch
+    resp = client.read_holding_registers(CurrentPowerRegisterAddress,1, unit=MODBUS_DEVICEID)
+    CurrentPower = int(resp.registers[0])
 
-#KWH Total Import
-resp = client.read_holding_registers(TotalEnergyRegisterAddress,1, unit=MODBUS_DEVICEID)
-TotalEnergy = int(resp.registers[0]) * 10 #Value is in 0.01kWh, need to convert to Wh
+    client.close() # clean disconnect from modbus server
 
-#Aktueller Verbrauch
-resp = client.read_holding_registers(CurrentPowerRegisterAddress,1, unit=MODBUS_DEVICEID)
-CurrentPower = int(resp.registers[0])
+    answer = '{"power":' + str(CurrentPower) + ',"powerc":' + str(TotalEnergy) + '} '
+    return json.loads(answer)
 
-answer = '{"power":' + str(CurrentPower) + ',"powerc":' + str(TotalEnergy) + '} '
-f1 = open('/var/www/html/openWB/ramdisk/smarthome_device_ret' + str(devicenumber), 'w')
-json.dump(answer,f1)
-f1.close()
 
-client.close() # clean disconnect from modbus server
\ No newline at end of file
+if __name__ == '__main__':
+    writeret(json.dumps(watt(sys.argv[1:])), int(sys.argv[1]))
@@ -10,7 +10,15 @@ else
 	MYLOGFILE="${RAMDISKDIR}/bat.log"
 fi
 
-bash "$OPENWBBASEDIR/packages/legacy_run.sh" "bezug_rct2.rct_read_speicher" "--ip=${bezug1_ip}" >>"$MYLOGFILE" 2>&1
-ret=$?
+# Werte werden bereits mit dem WR abgefragt, EVU wird in derselben Verbindung mit abgefragt
+if [[ ${pvwattmodul} != "wr_rct2" ]]; then
+	parts="speicher"
+	if [[ ${wattbezugmodul} == "bezug_rct2" ]]; then
+		parts="${parts} bezug"
+	fi
+	# shellcheck disable=SC2086
+	bash "$OPENWBBASEDIR/packages/legacy_run.sh" "bezug_rct2.rct_read_all" "--ip=${bezug1_ip}" ${parts} >>"$MYLOGFILE" 2>&1
+	ret=$?
 
-openwbDebugLog ${DMOD} 2 "BAT RET: ${ret}"
\ No newline at end of file
+	openwbDebugLog ${DMOD} 2 "BAT RET: ${ret}"
+fi
\ No newline at end of file
@@ -11,7 +11,16 @@ else
 	MYLOGFILE="${RAMDISKDIR}/nurpv.log"
 fi
 
-bash "$OPENWBBASEDIR/packages/legacy_run.sh" "bezug_rct2.rct_read_wr" "--ip=${bezug1_ip}" >>"$MYLOGFILE" 2>&1
+# Speicher und EVU werden in derselben Verbindung mit abgefragt, wenn sie ebenfalls am RCT Wechselrichter haengen
+parts="wr"
+if [[ ${speichermodul} == "speicher_rct2" ]]; then
+	parts="${parts} speicher"
+fi
+if [[ ${wattbezugmodul} == "bezug_rct2" ]]; then
+	parts="${parts} bezug"
+fi
+# shellcheck disable=SC2086
+bash "$OPENWBBASEDIR/packages/legacy_run.sh" "bezug_rct2.rct_read_all" "--ip=${bezug1_ip}" ${parts} >>"$MYLOGFILE" 2>&1
 ret=$?
 openwbDebugLog ${DMOD} 2 "RET: ${ret}"
 
@@ -0,0 +1,202 @@
+"""SQLite index for the monthly charge logs in web/logging/data/ladelog
+
+ladelog.sh inserts every finished charge session as first line of <YYYYMM>.csv. The index (index.sqlite next to the
+CSVs) holds one row per session with parsed dates, energy, costs and duration. A month is reimported as a whole once
+size or modification time of its CSV changed, all other months are never read again.
+
+The query API returns number of sessions, kWh, costs, duration and range for any combination of date range, charge
+points, RFID tags and charge modes, optionally grouped by month, charge point, RFID tag or mode. The index is synced
+before each query.
+
+The commands are run directly, because query prints its result as csv to stdout, which the legacy run server
+redirects into openWB.log:
+
+    PYTHONPATH=packages python3 -m helpermodules.charge_log_store query web/logging/data/ladelog month 2022 "" "" "" ""
+"""
+import csv
+import logging
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from helpermodules.cli import run_using_positional_cli_args
+
+log = logging.getLogger(__name__)
+
+INDEX_NAME = "index.sqlite"
+_SCHEMA_VERSION = 1
+
+GROUPS = {"month": "month", "charge_point": "charge_point", "rfid": "rfid", "mode": "mode"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (month TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER);
+CREATE TABLE IF NOT EXISTS sessions (
+    month TEXT, start TEXT, end TEXT, range_km REAL, energy_kwh REAL, power_kw REAL, duration_min INTEGER,
+    charge_point INTEGER, mode INTEGER, rfid TEXT, costs REAL
+);
+CREATE INDEX IF NOT EXISTS sessions_month ON sessions (month);
+CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start);
+CREATE INDEX IF NOT EXISTS sessions_charge_point ON sessions (charge_point, start);
+CREATE INDEX IF NOT EXISTS sessions_rfid ON sessions (rfid, start);
+CREATE INDEX IF NOT EXISTS sessions_mode ON sessions (mode, start);
+"""
+
+
+def parse_date(value: str) -> str:
+    """Converts "dd.mm.yy-HH:MM" to the sortable form "YYYYMMDDHHMM"."""
+    return time.strftime("%Y%m%d%H%M", time.strptime(value, "%d.%m.%y-%H:%M"))
+
+
+def parse_duration(value: str) -> Optional[int]:
+    """Converts the duration text of ladelog.sh ("1 H 5 Min" or "45 Min") to minutes, like ladelog.js does. Durations
+    ladelog.sh could not determine ("--") are returned as None, so that the session is still counted."""
+    parts = value.split(" ")
+    try:
+        if len(parts) == 4:
+            return int(parts[0]) * 60 + int(parts[2])
+        return int(parts[0])
+    except ValueError:
+        return None
+
+
+def parse_row(row: List[str]) -> Tuple:
+    """Returns the session columns of a csv row in one of the formats 8 (until 2020/02), 9 (until 2022/07) or 10
+    columns. Missing RFID tags are stored as "0", missing costs as NULL."""
+    if len(row) not in (8, 9, 10):
+        raise ValueError("unexpected row format: " + str(row))
+    rfid = row[8] if len(row) > 8 else "0"
+    costs = float(row[9]) if len(row) > 9 and row[9] != "" else None
+    return (parse_date(row[0]), parse_date(row[1]), float(row[2] or 0), float(row[3]), float(row[4] or 0),
+            parse_duration(row[5]), int(row[6]), int(row[7]), rfid, costs)
+
+
+class ChargeLogStore:
+    def __init__(self, directory: str, index_path: Optional[str] = None):
+        self.directory = directory
+        self.index_path = index_path or os.path.join(directory, INDEX_NAME)
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.index_path)
+        if connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            connection.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS sessions;")
+            connection.execute("PRAGMA user_version = %d" % _SCHEMA_VERSION)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def months(self) -> Dict[str, os.stat_result]:
+        return {name[:6]: os.stat(os.path.join(self.directory, name)) for name in os.listdir(self.directory)
+                if name.endswith(".csv") and len(name) == 10 and name[:6].isdigit()}
+
+    def __import_month(self, connection: sqlite3.Connection, month: str, stat: os.stat_result) -> None:
+        rows = []
+        with open(os.path.join(self.directory, month + ".csv"), "r", newline="") as f:
+            for line, row in enumerate(csv.reader(f), 1):
+                if len(row) < 2:
+                    continue
+                try:
+                    rows.append((month,) + parse_row(row))
+                except ValueError as e:
+                    log.error("%s.csv line %d: %s", month, line, e)
+        with connection:
+            connection.execute("DELETE FROM sessions WHERE month = ?", (month,))
+            connection.executemany("INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                               (month, stat.st_size, stat.st_mtime_ns))
+
+    def __sync(self, connection: sqlite3.Connection) -> int:
+        indexed = {month: (size, mtime_ns) for month, size, mtime_ns in connection.execute("SELECT * FROM files")}
+        months = self.months()
+        updated = 0
+        for month, stat in sorted(months.items()):
+            if indexed.get(month) != (stat.st_size, stat.st_mtime_ns):
+                self.__import_month(connection, month, stat)
+                updated += 1
+        for month in indexed.keys() - months.keys():
+            with connection:
+                connection.execute("DELETE FROM sessions WHERE month = ?", (month,))
+                connection.execute("DELETE FROM files WHERE month = ?", (month,))
+            updated += 1
+        return updated
+
+    def sync(self) -> int:
+        """Reimports every monthly csv which is new or changed since the last sync.
+
+        Returns the number of months updated."""
+        connection = self.__connect()
+        try:
+            return self.__sync(connection)
+        finally:
+            connection.close()
+
+    def summary(self, start: Optional[str] = None, end: Optional[str] = None,
+                charge_points: Optional[Iterable[int]] = None, rfids: Optional[Iterable[str]] = None,
+                modes: Optional[Iterable[int]] = None, group_by: Optional[str] = None) -> List[Dict]:
+        """Returns the aggregated charge sessions matching all given filters.
+
+        start and end are dates of the session start in the format YYYYMMDD (inclusive, shorter prefixes like YYYYMM
+        or YYYY are allowed). group_by is one of GROUPS or None for a single total. Each result holds the group key
+        (if grouped), sessions, energy_kwh, costs, duration_min and range_km. The index is synced before the query.
+        """
+        conditions = []
+        parameters = []  # type: List
+        if start:
+            conditions.append("start >= ?")
+            parameters.append(start)
+        if end:
+            conditions.append("start <= ?")
+            parameters.append(end + "999999999999"[len(end):])
+        for column, values in (("charge_point", charge_points), ("rfid", rfids), ("mode", modes)):
+            if values is not None:
+                values = list(values)
+                conditions.append("%s IN (%s)" % (column, ",".join("?" * len(values))))
+                parameters.extend(values)
+        key = GROUPS[group_by] if group_by else None
+        sql = ("SELECT %sCOUNT(*), TOTAL(energy_kwh), TOTAL(costs), TOTAL(duration_min), TOTAL(range_km) "
+               "FROM sessions" % (key + ", " if key else ""))
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if key:
+            sql += " GROUP BY %s ORDER BY %s" % (key, key)
+        connection = self.__connect()
+        try:
+            self.__sync(connection)
+            result = []
+            for row in connection.execute(sql, parameters):
+                values = row[1:] if key else row
+                entry = {"sessions": values[0], "energy_kwh": round(values[1], 3), "costs": round(values[2], 2),
+                         "duration_min": int(values[3]), "range_km": values[4]}
+                if key:
+                    entry[group_by] = row[0]
+                result.append(entry)
+            return result
+        finally:
+            connection.close()
+
+
+def sync(directory: str):
+    log.debug("%d charge log months indexed", ChargeLogStore(directory).sync())
+
+
+def query(directory: str, group_by: str, start: Optional[str], end: Optional[str], charge_points: Optional[str],
+          rfids: Optional[str], modes: Optional[str]):
+    """group_by "none" for a single total; charge_points, rfids and modes are comma separated, "" for all"""
+    group = None if group_by == "none" else group_by
+    columns = ([group] if group else []) + ["sessions", "energy_kwh", "costs", "duration_min", "range_km"]
+    print(",".join(columns))
+    for entry in ChargeLogStore(directory).summary(
+            start or None, end or None,
+            [int(value) for value in charge_points.split(",")] if charge_points else None,
+            rfids.split(",") if rfids else None,
+            [int(value) for value in modes.split(",")] if modes else None,
+            group):
+        print(",".join(str(entry[column]) for column in columns))
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args({"sync": sync, "query": query}, argv)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
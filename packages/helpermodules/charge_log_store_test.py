@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from helpermodules.charge_log_store import ChargeLogStore, parse_duration, parse_row
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ChargeLogStore:
+    # newest session first, like ladelog.sh writes it
+    (tmp_path / "202201.csv").write_text(
+        "30.01.22-18:00,30.01.22-20:05,60,10.50,5.04,2 H 5 Min,2,2,0,3.15\n"
+        "12.01.22-07:30,12.01.22-08:15,40,7.00,9.33,45 Min,1,0,1234,2.10\n"
+        "\n")
+    # format until 2022/07 without costs and until 2020/02 without rfid tag
+    (tmp_path / "202202.csv").write_text(
+        "02.02.22-10:00,02.02.22-11:00,50,8.25,8.25,1 H 0 Min,1,2,1234\n"
+        "01.02.22-22:00,01.02.22-22:30,20,3.00,6.00,30 Min,1,7\n")
+    return ChargeLogStore(str(tmp_path))
+
+
+@pytest.mark.parametrize("text,expected", [("45 Min", 45), ("2 H 5 Min", 125), ("0 Min", 0), ("--", None)])
+def test_parse_duration(text: str, expected: Optional[int]):
+    assert parse_duration(text) == expected
+
+
+def test_parse_row_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        parse_row(["01.02.22-22:00", "01.02.22-22:30", "20"])
+
+
+def test_sync_imports_changed_months_only(store: ChargeLogStore, tmp_path: Path):
+    # execution
+    first = store.sync()
+    second = store.sync()
+    with (tmp_path / "202202.csv").open("r+") as f:
+        content = f.read()
+        f.seek(0)
+        f.write("03.02.22-09:00,03.02.22-09:30,10,2.00,4.00,30 Min,2,0,1234,0.60\n" + content)
+    third = store.sync()
+
+    # evaluation
+    assert (first, second, third) == (2, 0, 1)
+    assert store.summary()[0]["sessions"] == 5
+
+
+def test_sync_drops_removed_months(store: ChargeLogStore, tmp_path: Path):
+    # setup
+    store.sync()
+    os.remove(str(tmp_path / "202201.csv"))
+
+    # execution
+    actual = store.summary()
+
+    # evaluation
+    assert actual == [{"sessions": 2, "energy_kwh": 11.25, "costs": 0, "duration_min": 90, "range_km": 70}]
+
+
+def test_summary_total(store: ChargeLogStore):
+    assert store.summary() == [
+        {"sessions": 4, "energy_kwh": 28.75, "costs": 5.25, "duration_min": 260, "range_km": 170}
+    ]
+
+
+@pytest.mark.parametrize("filters,expected_sessions,expected_energy", [
+    pytest.param({"start": "20220112", "end": "20220201"}, 3, 20.5, id="date range"),
+    pytest.param({"end": "202201"}, 2, 17.5, id="month prefix"),
+    pytest.param({"charge_points": [1]}, 3, 18.25, id="charge point"),
+    pytest.param({"rfids": ["1234"]}, 2, 15.25, id="rfid"),
+    pytest.param({"rfids": ["0"], "modes": [2, 7]}, 2, 13.5, id="rfid and modes"),
+    pytest.param({"charge_points": []}, 0, 0, id="empty selection"),
+])
+def test_summary_filters(store: ChargeLogStore, filters, expected_sessions: int, expected_energy: float):
+    # execution
+    actual = store.summary(**filters)
+
+    # evaluation
+    assert actual[0]["sessions"] == expected_sessions
+    assert actual[0]["energy_kwh"] == expected_energy
+
+
+def test_summary_grouped(store: ChargeLogStore):
+    # execution
+    by_month = store.summary(group_by="month")
+    by_mode = store.summary(group_by="mode", charge_points=[1])
+
+    # evaluation
+    assert [(entry["month"], entry["sessions"], entry["costs"]) for entry in by_month] == [
+        ("202201", 2, 5.25), ("202202", 2, 0)
+    ]
+    assert [(entry["mode"], entry["energy_kwh"]) for entry in by_mode] == [(0, 7.0), (2, 8.25), (7, 3.0)]
+
+
+def test_summary_counts_session_without_duration(store: ChargeLogStore, tmp_path: Path):
+    # setup
+    (tmp_path / "202203.csv").write_text("01.03.22-10:00,01.03.22-09:00,15,2.50,0,--,1,0,0,0.75\n")
+
+    # execution
+    actual = store.summary(start="202203")
+
+    # evaluation
+    assert actual == [{"sessions": 1, "energy_kwh": 2.5, "costs": 0.75, "duration_min": 0, "range_km": 15}]
@@ -0,0 +1,268 @@
+"""Compact binary companion files for the daily logs in web/logging/data/daily
+
+The sync command writes a <YYYYMMDD>.bin next to each completed day <YYYYMMDD>.csv. The file holds a small header
+followed by one fixed-width float64 array per CSV column (column-major), so a column of a day is a contiguous slice of
+the memory-mapped file. Only rows with a non zero sum of the first five values are stored, the same rows csvcalc.py
+uses. Today's log is still being appended by cron5min.sh and is always read from the CSV.
+
+The query API returns counter deltas (last value - first value, closed with the first row of the following day like
+csvcalc.py does) per day, month or year for any subset of the counter columns. Queries only read: days without a
+current binary file are read from the csv. The binary files are written by the sync command.
+
+Both commands are run directly, because query prints its result to stdout, which the legacy run server redirects
+into openWB.log:
+
+    PYTHONPATH=packages python3 -m helpermodules.daily_log_store sync web/logging/data/daily
+    PYTHONPATH=packages python3 -m helpermodules.daily_log_store query web/logging/data/daily month 2022 2022 bezug,pv
+"""
+import array
+import csv
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from helpermodules.cli import run_using_positional_cli_args
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"OWBD"
+VERSION = 1
+# magic, version, number of columns, number of rows, size and modification time of the csv the file was created from
+_HEADER = struct.Struct("<4sHHIIQ")
+
+# column order of the daily csv written by cron5min.sh
+COLUMNS = (
+    "time", "bezug", "einspeisung", "pv", "ll1", "ll2", "ll3", "llg", "speicheri", "speichere",
+    "verbraucher1", "verbrauchere1", "verbraucher2", "verbrauchere2", "verbraucher3",
+    "ll4", "ll5", "ll6", "ll7", "ll8", "speichersoc", "soc", "soc1", "temp1", "temp2", "temp3",
+    "d1", "d2", "d3", "d4", "d5", "d6", "d7", "d8", "d9", "d10", "temp4", "temp5", "temp6",
+)
+_COLUMN_INDEX = {name: index for index, name in enumerate(COLUMNS)}
+
+PERIODS = {"day": 8, "month": 6, "year": 4}
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+
+def read_csv(path: str) -> List[List[float]]:
+    """Returns the valid rows of a daily csv, each padded with NaN to the length of COLUMNS."""
+    rows = []
+    with open(path, "r", newline="") as f:
+        for line in csv.reader(f):
+            row = [_to_float(value) for value in line[:len(COLUMNS)]]
+            row.extend([math.nan] * (len(COLUMNS) - len(row)))
+            totals = row[1:6]
+            if not any(math.isnan(value) for value in totals) and sum(totals) != 0:
+                rows.append(row)
+    return rows
+
+
+def write_day(csv_path: str, bin_path: str) -> None:
+    csv_stat = os.stat(csv_path)
+    rows = read_csv(csv_path)
+    values = array.array("d", (row[column] for column in range(len(COLUMNS)) for row in rows))
+    tmp_path = bin_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(COLUMNS), len(rows), csv_stat.st_size, csv_stat.st_mtime_ns))
+        values.tofile(f)
+    os.replace(tmp_path, bin_path)
+
+
+class DayColumns:
+    """Columns of one day, either memory-mapped from the binary file or parsed from the csv."""
+
+    def __init__(self, columns: Sequence, rows: int, views: Sequence[memoryview] = (),
+                 mapped: Optional[mmap.mmap] = None):
+        self.__columns = columns
+        self.__views = views
+        self.__mapped = mapped
+        self.rows = rows
+
+    def close(self) -> None:
+        """Releases the memory map of a day read from the binary file."""
+        for view in self.__views:
+            view.release()
+        self.__views = ()
+        self.__columns = []
+        if self.__mapped is not None:
+            self.__mapped.close()
+            self.__mapped = None
+
+    def __enter__(self) -> "DayColumns":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def from_bin(path: str) -> Optional["DayColumns"]:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            magic, version, columns, rows, _, _ = _HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION or columns != len(COLUMNS):
+                return None
+            if rows == 0:
+                return DayColumns([], 0)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        raw = memoryview(mapped)
+        data = raw[_HEADER.size:_HEADER.size + columns * rows * 8]
+        values = data.cast("d")
+        column_views = [values[column * rows:(column + 1) * rows] for column in range(columns)]
+        # alle Views müssen vor dem Schließen der Map freigegeben werden, die abgeleiteten zuerst
+        return DayColumns(column_views, rows, column_views + [values, data, raw], mapped)
+
+    @staticmethod
+    def from_csv(path: str) -> "DayColumns":
+        rows = read_csv(path)
+        return DayColumns([[row[column] for row in rows] for column in range(len(COLUMNS))], len(rows))
+
+    def column(self, index: int) -> Sequence[float]:
+        return self.__columns[index]
+
+
+class DailyLogStore:
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def __csv_path(self, date: str) -> str:
+        return os.path.join(self.directory, date + ".csv")
+
+    def __bin_path(self, date: str) -> str:
+        return os.path.join(self.directory, date + ".bin")
+
+    def days(self) -> List[str]:
+        return sorted(name[:8] for name in os.listdir(self.directory)
+                      if name.endswith(".csv") and len(name) == 12 and name[:8].isdigit())
+
+    def __is_current(self, date: str) -> bool:
+        try:
+            with open(self.__bin_path(date), "rb") as f:
+                header = f.read(_HEADER.size)
+            magic, version, columns, _, csv_size, csv_mtime = _HEADER.unpack(header)
+            csv_stat = os.stat(self.__csv_path(date))
+        except (OSError, struct.error):
+            return False
+        return (magic == MAGIC and version == VERSION and columns == len(COLUMNS) and
+                csv_size == csv_stat.st_size and csv_mtime == csv_stat.st_mtime_ns)
+
+    def sync(self, today: Optional[str] = None) -> int:
+        """Writes the binary file of every completed day which is missing or older than its csv.
+
+        Returns the number of files written."""
+        if today is None:
+            today = time.strftime("%Y%m%d")
+        written = 0
+        for date in self.days():
+            if date < today and not self.__is_current(date):
+                try:
+                    write_day(self.__csv_path(date), self.__bin_path(date))
+                    written += 1
+                except Exception:
+                    log.exception("Could not convert %s", self.__csv_path(date))
+        return written
+
+    def load(self, date: str, today: Optional[str] = None) -> DayColumns:
+        """Returns the columns of a day, from the binary file if it is up to date, else from the csv. Nothing is
+        written. The caller closes the result."""
+        if today is None:
+            today = time.strftime("%Y%m%d")
+        if date < today and self.__is_current(date):
+            day = DayColumns.from_bin(self.__bin_path(date))
+            if day is not None:
+                return day
+        return DayColumns.from_csv(self.__csv_path(date))
+
+    def deltas(self, columns: Iterable[str], start: str, end: str, period: str = "day",
+               today: Optional[str] = None) -> List[Tuple[str, List[float]]]:
+        """Returns the counter deltas of the given columns for each day, month or year between start and end.
+
+        start and end are dates in the format YYYYMMDD (inclusive, shorter prefixes like YYYYMM or YYYY are allowed).
+        Negative deltas (counter resets) count as 0. The result is sorted by period key.
+        """
+        indexes = [_COLUMN_INDEX[column] for column in columns]
+        key_length = PERIODS[period]
+        end = end + "99999999"[len(end):]
+        dates = [date for date in self.days() if start <= date <= end]
+        # the first row of the following day closes a day, like in csvcalc.py
+        following = [date for date in self.days() if date > end][:1]
+
+        firsts = []  # type: List[List[float]]
+        lasts = []  # type: List[List[float]]
+        valid_dates = []
+        for date in dates + following:
+            with self.load(date, today) as day:
+                if day.rows == 0:
+                    continue
+                valid_dates.append(date)
+                firsts.append([_first_valid(day.column(index)) for index in indexes])
+                lasts.append([_last_valid(day.column(index)) for index in indexes])
+
+        result = {}  # type: Dict[str, List[float]]
+        for position, date in enumerate(valid_dates):
+            if date > end:
+                break
+            if position + 1 < len(valid_dates) and valid_dates[position + 1] == _next_day(date):
+                closing = firsts[position + 1]
+            else:
+                closing = lasts[position]
+            delta = [_delta(first, last) for first, last in zip(firsts[position], closing)]
+            key = date[:key_length]
+            if key in result:
+                result[key] = [total + value for total, value in zip(result[key], delta)]
+            else:
+                result[key] = delta
+        return sorted(result.items())
+
+
+def _first_valid(values: Sequence[float]) -> float:
+    for value in values:
+        if not math.isnan(value):
+            return value
+    return math.nan
+
+
+def _last_valid(values: Sequence[float]) -> float:
+    for value in reversed(values):
+        if not math.isnan(value):
+            return value
+    return math.nan
+
+
+def _delta(first: float, last: float) -> float:
+    delta = last - first
+    return delta if delta > 0 else 0.0
+
+
+def _next_day(date: str) -> str:
+    return time.strftime("%Y%m%d", time.localtime(time.mktime(time.strptime(date, "%Y%m%d")) + 36 * 3600))
+
+
+def sync(directory: str):
+    log.debug("%d daily logs converted", DailyLogStore(directory).sync())
+
+
+def query(directory: str, period: str, start: str, end: str, columns: str):
+    names = columns.split(",")
+    print(",".join(["date"] + names))
+    for key, values in DailyLogStore(directory).deltas(names, start, end, period):
+        print(",".join([key] + ["%.3f" % value for value in values]))
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args({"sync": sync, "query": query}, argv)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from helpermodules.daily_log_store import COLUMNS, DailyLogStore, DayColumns
+
+
+def write_csv(directory: Path, date: str, rows) -> None:
+    lines = []
+    for time, bezug, pv in rows:
+        lp = "1" if bezug else "0"
+        values = [time, str(bezug), "0", str(pv), lp, lp] + ["0"] * (len(COLUMNS) - 6)
+        lines.append(",".join(values) + "\n")
+    (directory / (date + ".csv")).write_text("".join(lines))
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> DailyLogStore:
+    write_csv(tmp_path, "20220130", [("0000", 1000, 50), ("1200", 1500, 80), ("2355", 1800, 90)])
+    write_csv(tmp_path, "20220131", [("0000", 1810, 90), ("0005", 0, 0), ("2355", 2000, 120)])
+    write_csv(tmp_path, "20220201", [("0000", 2100, 125), ("2355", 2400, 130)])
+    write_csv(tmp_path, "20220203", [("0000", 2500, 140), ("2355", 2600, 150)])
+    return DailyLogStore(str(tmp_path))
+
+
+def test_sync_writes_completed_days_only(store: DailyLogStore, tmp_path: Path):
+    # execution
+    written = store.sync(today="20220203")
+
+    # evaluation
+    assert written == 3
+    assert sorted(path.name for path in tmp_path.glob("*.bin")) == ["20220130.bin", "20220131.bin", "20220201.bin"]
+    assert store.sync(today="20220203") == 0
+
+
+def test_bin_matches_csv(store: DailyLogStore, tmp_path: Path):
+    # setup
+    store.sync(today="20220203")
+
+    # execution
+    day = DayColumns.from_bin(str(tmp_path / "20220131.bin"))
+
+    # evaluation
+    # the row with zero counters is skipped
+    assert day.rows == 2
+    assert list(day.column(COLUMNS.index("bezug"))) == [1810, 2000]
+    assert list(day.column(COLUMNS.index("time"))) == [0, 2355]
+
+
+def test_sync_rewrites_changed_csv(store: DailyLogStore, tmp_path: Path):
+    # setup
+    store.sync(today="20220203")
+    write_csv(tmp_path, "20220201", [("0000", 2100, 125), ("2355", 24500, 130)])
+
+    # execution & evaluation
+    assert store.sync(today="20220203") == 1
+    assert list(store.load("20220201", today="20220203").column(1)) == [2100, 24500]
+
+
+@pytest.mark.parametrize("period,expected", [
+    pytest.param("day", [
+        ("20220130", [810, 40]), ("20220131", [290, 35]), ("20220201", [300, 5]), ("20220203", [100, 10])
+    ], id="day"),
+    pytest.param("month", [("202201", [1100, 75]), ("202202", [400, 15])], id="month"),
+    pytest.param("year", [("2022", [1500, 90])], id="year"),
+])
+def test_deltas(store: DailyLogStore, period: str, expected):
+    # execution
+    actual = store.deltas(["bezug", "pv"], "20220101", "20221231", period, today="20220203")
+
+    # evaluation
+    assert actual == expected
+
+
+def test_deltas_closed_with_following_day(store: DailyLogStore):
+    # execution
+    actual = store.deltas(["bezug"], "202201", "202201", "month", today="20220203")
+
+    # evaluation
+    assert actual == [("202201", [1100])]
+
+
+def test_deltas_does_not_write_binary_files(store: DailyLogStore, tmp_path: Path):
+    # execution
+    store.deltas(["bezug"], "2022", "2022", "year", today="20220203")
+
+    # evaluation
+    assert list(tmp_path.glob("*.bin")) == []
+
+
+def test_close_releases_memory_map(store: DailyLogStore, tmp_path: Path):
+    # setup
+    store.sync(today="20220203")
+
+    # execution
+    with store.load("20220131", today="20220203") as day:
+        bezug = list(day.column(COLUMNS.index("bezug")))
+
+    # evaluation
+    assert bezug == [1810, 2000]
+    with pytest.raises(IndexError):
+        day.column(COLUMNS.index("bezug"))
@@ -0,0 +1,152 @@
+"""Live graph of the legacy control loop (graphing.sh)
+
+graphing.sh hands over the values of each control cycle as one line of all-live.graph. The last lines of all-live.graph
+and of every single <series>-live.graph are kept in fixed-size ring buffers in the resident legacy run server. Each
+cycle writes every file once from memory and publishes the openWB/graph/*livevalues topics over one persistent MQTT
+connection, in the same format the former tail/head/mosquitto_pub pipelines produced. After a restart of the server the
+ring buffers are restored from the files in the ramdisk.
+"""
+import logging
+import os
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from paho.mqtt.client import Client as MqttClient
+
+from helpermodules.cli import run_using_positional_cli_args
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SIZE = 180
+CHUNK_SIZE = 50
+CHUNKS = 16
+# fields of the all-live.graph line published as lastlivevalues and written to all-live.graph?incremental=y
+LAST_FIELDS = 29
+INCREMENTAL_FIELDS = 14
+
+# series and their field in the all-live.graph line, "time" is taken from the first field as HH:MM
+SERIES = {
+    "evu": 1, "ev": 2, "pv": 3, "ev1": 4, "soc": 9, "hausverbrauch": 11, "time": 0,
+}
+OPTIONAL_SERIES = {
+    "ev2": 5, "speicher": 7, "speichersoc": 8, "soc1": 10, "verbraucher1": 12, "verbraucher2": 13,
+}
+
+
+def _read_lines(path: str) -> List[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        return []
+
+
+def _write_lines(path: str, lines: Iterable[str]) -> None:
+    # same content as `echo "$(tail -n ...)" > file`
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def chunk(lines: List[str], number: int) -> List[str]:
+    """Returns the lines of openWB/graph/<number>alllivevalues.
+
+    Like the former `tail -n +<start> | head -n 50` with start 0 for the first and 50 * (number - 1) for the following
+    chunks, the last line of a chunk is repeated as first line of the next one."""
+    start = max(CHUNK_SIZE * (number - 1) - 1, 0)
+    return lines[start:CHUNK_SIZE * number - 1 if number > 1 else CHUNK_SIZE]
+
+
+class LiveGraph:
+    def __init__(self, ramdisk: str, size: int = DEFAULT_SIZE):
+        self.ramdisk = ramdisk
+        self.size = size
+        self.__rings = {}  # type: Dict[str, deque]
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.ramdisk, name + "-live.graph")
+
+    def ring(self, name: str) -> deque:
+        ring = self.__rings.get(name)
+        if ring is None:
+            ring = deque(_read_lines(self.path(name)), self.size)
+        elif ring.maxlen != self.size:
+            ring = deque(ring, self.size)
+        else:
+            return ring
+        self.__rings[name] = ring
+        return ring
+
+    def add(self, line: str, optional_series: Iterable[str] = ()) -> List[str]:
+        """Appends the line to all-live.graph and its values to the series, returns the names of the changed rings."""
+        fields = line.split(",")
+        names = ["all"] + list(SERIES) + [name for name in optional_series if name in OPTIONAL_SERIES]
+        for name in names:
+            if name == "all":
+                value = line
+            elif name == "time":
+                value = fields[0][:5]
+            else:
+                index = SERIES.get(name, OPTIONAL_SERIES.get(name))
+                value = fields[index] if index < len(fields) else ""
+            self.ring(name).append(value)
+        return names
+
+    def write(self, names: Iterable[str], line: str) -> None:
+        for name in names:
+            _write_lines(self.path(name), self.ring(name))
+        _write_lines(self.path("all") + "?incremental=y", [",".join(line.split(",")[:INCREMENTAL_FIELDS])])
+
+    def payloads(self, line: str) -> List[Tuple[str, str]]:
+        lines = list(self.ring("all"))
+        last = ",".join(line.split(",")[:LAST_FIELDS])
+        payloads = [
+            ("openWB/graph/alllivevalues", "\n".join(lines[-CHUNK_SIZE:])),
+            ("openWB/graph/lastlivevalues", last),
+            ("openWB/system/lastlivevalues", last),
+            ("openWB/graph/1alllivevalues", "\n".join(chunk(lines, 1))),
+        ]
+        for number in range(2, CHUNKS + 1):
+            text = "\n".join(chunk(lines, number))
+            payloads.append(("openWB/graph/%dalllivevalues" % number, text if len(text) >= 10 else "-"))
+        return payloads
+
+
+_lock = threading.Lock()
+_graphs = {}  # type: Dict[str, LiveGraph]
+_client = None  # type: Optional[MqttClient]
+
+
+def _get_client() -> MqttClient:
+    global _client
+    if _client is None:
+        client = MqttClient("openWB-livegraph-" + str(os.getpid()))
+        client.connect("localhost", 1883)
+        client.loop_start()
+        _client = client
+    return _client
+
+
+def update(ramdisk: str, size: str, line: str, optional_series: Optional[str]):
+    """size is the number of lines to keep, optional_series the comma separated names of OPTIONAL_SERIES in use"""
+    try:
+        size_lines = int(size)
+    except ValueError:
+        size_lines = DEFAULT_SIZE
+    with _lock:
+        graph = _graphs.get(ramdisk)
+        if graph is None:
+            graph = _graphs[ramdisk] = LiveGraph(ramdisk, size_lines)
+        graph.size = size_lines
+        graph.write(graph.add(line, optional_series.split(",") if optional_series else ()), line)
+        payloads = graph.payloads(line)
+    try:
+        client = _get_client()
+        for topic, payload in payloads:
+            client.publish(topic, payload, qos=0, retain=True)
+    except Exception:
+        log.exception("Could not publish live graph")
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args({"update": update}, argv)
@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from helpermodules import live_graph
+from helpermodules.live_graph import LiveGraph, chunk
+
+
+def shell_chunk(lines: List[str], number: int) -> List[str]:
+    # bisherige Pipeline aus graphing.sh als Referenz: tail -n +<start> | head -n <50>
+    start = 0 if number == 1 else 50 * (number - 1)
+    return lines[max(start - 1, 0):][:50]
+
+
+def cycle_line(second: int) -> str:
+    fields = ["12:%02d:%02d" % divmod(second, 60)] + [str(second * 10 + field) for field in range(1, 32)]
+    return ",".join(fields)
+
+
+@pytest.mark.parametrize("count", [0, 1, 49, 50, 51, 120, 800, 900])
+def test_chunks_equal_shell_pipeline(count: int):
+    lines = [str(i) for i in range(count)]
+    for number in range(1, 17):
+        assert chunk(lines, number) == shell_chunk(lines, number)
+
+
+def test_rings_keep_last_lines(tmp_path: Path):
+    # setup
+    graph = LiveGraph(str(tmp_path), 3)
+
+    # execution
+    for second in range(5):
+        line = cycle_line(second)
+        graph.write(graph.add(line, ["speicher"]), line)
+
+    # evaluation
+    assert (tmp_path / "all-live.graph").read_text() == "".join(cycle_line(s) + "\n" for s in range(2, 5))
+    assert (tmp_path / "pv-live.graph").read_text() == "23\n33\n43\n"
+    assert (tmp_path / "speicher-live.graph").read_text() == "27\n37\n47\n"
+    assert (tmp_path / "time-live.graph").read_text() == "12:00\n12:00\n12:00\n"
+    assert not (tmp_path / "verbraucher1-live.graph").exists()
+    assert (tmp_path / "all-live.graph?incremental=y").read_text() == ",".join(cycle_line(4).split(",")[:14]) + "\n"
+
+
+def test_restores_from_files_and_resizes(tmp_path: Path):
+    # setup
+    (tmp_path / "evu-live.graph").write_text("0\n")
+
+    # execution
+    graph = LiveGraph(str(tmp_path), 2)
+    graph.add(cycle_line(1))
+    graph.size = 3
+    graph.add(cycle_line(2))
+
+    # evaluation
+    assert list(graph.ring("evu")) == ["0", "11", "21"]
+
+
+def test_update_publishes_chunks(tmp_path: Path, monkeypatch):
+    # setup
+    client = Mock()
+    monkeypatch.setattr(live_graph, "_client", client)
+    monkeypatch.setattr(live_graph, "_graphs", {})
+    (tmp_path / "all-live.graph").write_text("".join(cycle_line(s) + "\n" for s in range(60)))
+
+    # execution
+    live_graph.update(str(tmp_path), "180", cycle_line(60), "")
+
+    # evaluation
+    published = {call[0][0]: call[0][1] for call in client.publish.call_args_list}
+    lines = [cycle_line(s) for s in range(61)]
+    assert published["openWB/graph/alllivevalues"] == "\n".join(lines[-50:])
+    assert published["openWB/graph/1alllivevalues"] == "\n".join(lines[:50])
+    assert published["openWB/graph/2alllivevalues"] == "\n".join(lines[49:])
+    assert published["openWB/graph/3alllivevalues"] == "-"
+    assert published["openWB/graph/lastlivevalues"] == ",".join(lines[60].split(",")[:29])
+    assert len(published) == 19
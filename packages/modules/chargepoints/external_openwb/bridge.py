@@ -0,0 +1,201 @@
+"""MQTT bridge to external openWB charge points (modules/extopenwb)
+
+For every external charge point the legacy run server keeps one MQTT connection to the remote openWB open and
+subscribes to openWB/lp/<remote charge point>/#. The latest values are held in memory and each ramdisk file is written
+as soon as its value changes. The per cycle call from extopenwb/main.sh only sends %Soc, parent and heartbeat to the
+remote openWB and publishes the fault state, charging currents are forwarded over the same connection by set-current.sh.
+After a reconnect all retained values are received again and rewritten.
+"""
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+from paho.mqtt import publish
+from paho.mqtt.client import Client as MqttClient
+
+from helpermodules.cli import run_using_positional_cli_args
+from modules.chargepoints.lp_meter.meter import ramdisk_files
+from modules.common.store import ramdisk_read, ramdisk_write
+
+log = logging.getLogger(__name__)
+
+PORT = 1883
+# kurzes Keepalive, damit eine ohne TCP Reset verschwundene openWB nach etwa 15 s statt 90 s erkannt wird
+KEEPALIVE = 10
+# Mindestanzahl empfangener Topics, ab der die externe openWB als erreichbar gilt
+MIN_TOPICS = 5
+# Wartezeit auf die retained Topics nach dem Verbindungsaufbau
+CONNECT_TIMEOUT = 1
+MAX_ERRORS = 5
+
+
+def topic_files(charge_point: int) -> Dict[str, str]:
+    """Maps the topics below openWB/lp/<remote charge point>/ to the ramdisk files of the local charge point."""
+    files = ramdisk_files(charge_point)
+    if charge_point == 1:
+        plug_state, charge_state = "plugstat", "chargestat"
+    elif charge_point == 2:
+        plug_state, charge_state = "plugstats1", "chargestats1"
+    else:
+        plug_state, charge_state = "plugstatlp%d" % charge_point, "chargestatlp%d" % charge_point
+    mapping = {"W": files.power, "kWhCounter": files.imported, "boolPlugStat": plug_state,
+               "boolChargeStat": charge_state}
+    for phase in range(3):
+        mapping["VPhase%d" % (phase + 1)] = files.voltages[phase]
+        mapping["APhase%d" % (phase + 1)] = files.currents[phase]
+    return mapping
+
+
+# nur LP1 und LP2 übertragen den SoC an die externe openWB
+SOC_FILES = {1: "soc", 2: "soc1"}
+
+
+class ExternalOpenWB:
+    def __init__(self, charge_point: int, ip_address: str, remote_charge_point: int):
+        self.charge_point = charge_point
+        self.ip_address = ip_address
+        self.remote_charge_point = remote_charge_point
+        self.prefix = "openWB/lp/%d/" % remote_charge_point
+        self.files = topic_files(charge_point)
+        self.values = {}  # type: Dict[str, str]
+        self.__written = {}  # type: Dict[str, str]
+        self.__lock = threading.Lock()
+        self.__received = threading.Event()
+        self.client = MqttClient("openWB-extopenwb-%d-%d" % (charge_point, os.getpid()))
+        self.client.on_connect = self.__on_connect
+        self.client.on_disconnect = self.__on_disconnect
+        self.client.on_message = self.__on_message
+        self.client.connect_async(ip_address, PORT, keepalive=KEEPALIVE)
+        self.client.loop_start()
+
+    def __on_connect(self, client, userdata, flags, rc):
+        if rc == 0:
+            client.subscribe(self.prefix + "#")
+        else:
+            log.error("Externe openWB %s: Verbindung abgelehnt (%d)", self.ip_address, rc)
+
+    def __on_disconnect(self, client, userdata, rc):
+        # veraltete Werte verwerfen, nach dem erneuten Verbinden kommen alle retained Topics wieder
+        with self.__lock:
+            self.values.clear()
+            self.__written.clear()
+            self.__received.clear()
+
+    def __on_message(self, client, userdata, message):
+        if not message.topic.startswith(self.prefix):
+            return
+        name = message.topic[len(self.prefix):]
+        payload = message.payload.decode("utf-8", errors="replace")
+        with self.__lock:
+            self.values[name] = payload
+            if len(self.values) >= MIN_TOPICS:
+                self.__received.set()
+                self.__write_changed()
+
+    def __write_changed(self) -> None:
+        for name, file in self.files.items():
+            value = self.values.get(name)
+            if value is not None and self.__written.get(file) != value:
+                ramdisk_write(file, value)
+                self.__written[file] = value
+
+    def available(self, timeout: float = 0) -> bool:
+        return self.__received.wait(timeout)
+
+    def get(self, name: str) -> Optional[str]:
+        with self.__lock:
+            return self.values.get(name)
+
+    def publish(self, topic: str, payload) -> None:
+        self.client.publish(topic, payload, qos=0, retain=True)
+
+    def close(self) -> None:
+        # erst trennen, damit der Netzwerk-Thread das DISCONNECT noch sendet, dann den Thread beenden
+        self.client.disconnect()
+        self.client.loop_stop()
+
+
+_lock = threading.Lock()
+_bridges = {}  # type: Dict[int, ExternalOpenWB]
+_client = None  # type: Optional[MqttClient]
+
+
+def get_bridge(charge_point: int, ip_address: str, remote_charge_point: int) -> ExternalOpenWB:
+    with _lock:
+        bridge = _bridges.get(charge_point)
+        if bridge is not None and (bridge.ip_address, bridge.remote_charge_point) != (
+                ip_address, remote_charge_point):
+            bridge.close()
+            bridge = None
+        if bridge is None:
+            bridge = _bridges[charge_point] = ExternalOpenWB(charge_point, ip_address, remote_charge_point)
+        return bridge
+
+
+def _get_client() -> MqttClient:
+    global _client
+    if _client is None:
+        client = MqttClient("openWB-extopenwb-" + str(os.getpid()))
+        client.connect("localhost", 1883)
+        client.loop_start()
+        _client = client
+    return _client
+
+
+def _publish_state(charge_point: int, state: int, message: str) -> None:
+    client = _get_client()
+    client.publish("openWB/set/lp/%d/faultState" % charge_point, state, retain=True)
+    client.publish("openWB/set/lp/%d/faultStr" % charge_point, message, retain=True)
+
+
+def _read_tag(value: Optional[str]) -> Optional[int]:
+    try:
+        tag = int(value)
+    except (TypeError, ValueError):
+        return None
+    return tag if tag >= 3 else None
+
+
+def update(charge_point: int, ip_address: str, remote_charge_point: Optional[str]):
+    bridge = get_bridge(charge_point, ip_address, int(remote_charge_point) if remote_charge_point else 1)
+    if not bridge.available(CONNECT_TIMEOUT):
+        _publish_state(charge_point, 1, "Keine Daten vom LP erhalten, IP Korrekt?")
+        log.error("Keine Daten von externe openWB LP %d empfangen", charge_point)
+        try:
+            errors = int(ramdisk_read("errcounterextopenwb")) + 1
+        except (FileNotFoundError, ValueError):
+            errors = 1
+        ramdisk_write("errcounterextopenwb", errors)
+        if errors > MAX_ERRORS:
+            ramdisk_write("lastregelungaktiv", "Fehler bei Auslesung externe openWB LP %d, Netzwerk und Konfiguration "
+                                               "prüfen" % charge_point)
+        return
+    soc_file = SOC_FILES.get(charge_point)
+    if soc_file is not None:
+        bridge.publish("openWB/set/lp/%d/%%Soc" % bridge.remote_charge_point, ramdisk_read(soc_file))
+    tag = _read_tag(bridge.get("LastScannedRfidTag"))
+    if tag is not None:
+        ramdisk_write("readtag", tag)
+        bridge.publish("openWB/set/isss/ClearRfid", "1")
+    bridge.publish("openWB/set/isss/parentWB", ramdisk_read("ipaddress"))
+    bridge.publish("openWB/set/isss/parentCPlp%d" % (1 if bridge.remote_charge_point == 1 else 2), charge_point)
+    bridge.publish("openWB/set/isss/heartbeat", "0")
+    _publish_state(charge_point, 0, "Kein Fehler")
+    ramdisk_write("errcounterextopenwb", 0)
+
+
+def set_current(current: str, ip_address: str, remote_charge_point: Optional[str]):
+    """Forwards the charging current over the open connection to the remote openWB, falls back to a single
+    connection if it is not bridged."""
+    topic = "openWB/set/isss/Lp2Current" if remote_charge_point == "2" else "openWB/set/isss/Current"
+    with _lock:
+        bridge = next((bridge for bridge in _bridges.values() if bridge.ip_address == ip_address), None)
+    if bridge is not None:
+        bridge.publish(topic, current)
+    else:
+        publish.single(topic, current, retain=True, hostname=ip_address, port=PORT)
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args({"update": update, "set_current": set_current}, argv)
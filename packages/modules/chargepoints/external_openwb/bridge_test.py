@@ -0,0 +1,143 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+from unittest.mock import Mock
+
+import pytest
+
+from modules.chargepoints.external_openwb import bridge
+from modules.chargepoints.external_openwb.bridge import ExternalOpenWB, topic_files
+
+REMOTE_VALUES = {
+    "W": "7350", "kWhCounter": "1234.5", "VPhase1": "230.1", "VPhase2": "230.2", "VPhase3": "230.3",
+    "APhase1": "16.02", "APhase2": "15.5", "APhase3": "0", "boolPlugStat": "1", "boolChargeStat": "1",
+}
+
+
+@pytest.fixture
+def ramdisk(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr("modules.common.store.ramdisk.io.RAMDISK_PATH", tmp_path)
+    (tmp_path / "ipaddress").write_text("192.168.1.2\n")
+    (tmp_path / "soc").write_text("55\n")
+    (tmp_path / "errcounterextopenwb").write_text("0\n")
+    return tmp_path
+
+
+@pytest.fixture
+def clients(monkeypatch) -> Dict[str, Mock]:
+    clients = {}
+
+    def create_client(client_id: str):
+        clients[client_id] = Mock()
+        return clients[client_id]
+    monkeypatch.setattr(bridge, "MqttClient", create_client)
+    monkeypatch.setattr(bridge, "_bridges", {})
+    monkeypatch.setattr(bridge, "_client", None)
+    monkeypatch.setattr(bridge, "CONNECT_TIMEOUT", 0)
+    return clients
+
+
+def receive(external: ExternalOpenWB, values: Dict[str, str], remote_charge_point: int = 1) -> None:
+    for name, value in values.items():
+        message = SimpleNamespace(topic="openWB/lp/%d/%s" % (remote_charge_point, name), payload=value.encode())
+        external.client.on_message(external.client, None, message)
+
+
+def published(client: Mock) -> Dict[str, str]:
+    return {call[0][0]: call[0][1] for call in client.publish.call_args_list}
+
+
+@pytest.mark.parametrize("charge_point,expected_power,expected_plug_state", [
+    (1, "llaktuell", "plugstat"), (2, "llaktuells1", "plugstats1"), (3, "llaktuells2", "plugstatlp3"),
+    (5, "llaktuelllp5", "plugstatlp5"),
+])
+def test_topic_files(charge_point: int, expected_power: str, expected_plug_state: str):
+    files = topic_files(charge_point)
+    assert (files["W"], files["boolPlugStat"]) == (expected_power, expected_plug_state)
+
+
+def test_writes_ramdisk_on_change(ramdisk: Path, clients):
+    # setup
+    external = ExternalOpenWB(4, "192.168.1.10", 2)
+    external.client.on_connect(external.client, None, {}, 0)
+
+    # execution
+    receive(external, dict(list(REMOTE_VALUES.items())[:4]), 2)
+    written_before_complete = sorted(path.name for path in ramdisk.iterdir())
+    receive(external, REMOTE_VALUES, 2)
+    (ramdisk / "llaktuelllp4").write_text("0")
+    receive(external, {"W": "7350", "APhase3": "6.1", "Other": "x"}, 2)
+    receive(external, {"W": "1"}, 1)
+
+    # evaluation
+    external.client.subscribe.assert_called_once_with("openWB/lp/2/#")
+    assert written_before_complete == ["errcounterextopenwb", "ipaddress", "soc"]
+    assert (ramdisk / "llaktuelllp4").read_text() == "0"
+    assert (ramdisk / "lla3lp4").read_text() == "6.1"
+    assert (ramdisk / "llkwhlp4").read_text() == "1234.5"
+    assert (ramdisk / "chargestatlp4").read_text() == "1"
+
+
+def test_disconnect_discards_values(ramdisk: Path, clients):
+    # setup
+    external = ExternalOpenWB(1, "192.168.1.10", 1)
+    receive(external, REMOTE_VALUES)
+
+    # execution
+    external.client.on_disconnect(external.client, None, 1)
+
+    # evaluation
+    assert not external.available()
+    assert external.get("W") is None
+
+
+def test_update_forwards_to_remote(ramdisk: Path, clients):
+    # setup
+    external = bridge.get_bridge(1, "192.168.1.10", 1)
+    receive(external, dict(REMOTE_VALUES, LastScannedRfidTag="1234"))
+
+    # execution
+    bridge.update(1, "192.168.1.10", "1")
+    bridge.set_current("16", "192.168.1.10", "1")
+
+    # evaluation
+    assert bridge.get_bridge(1, "192.168.1.10", 1) is external
+    assert published(external.client) == {
+        "openWB/set/lp/1/%Soc": "55",
+        "openWB/set/isss/ClearRfid": "1",
+        "openWB/set/isss/parentWB": "192.168.1.2",
+        "openWB/set/isss/parentCPlp1": 1,
+        "openWB/set/isss/heartbeat": "0",
+        "openWB/set/isss/Current": "16",
+    }
+    assert (ramdisk / "readtag").read_text() == "1234"
+    assert published(bridge._client)["openWB/set/lp/1/faultState"] == 0
+
+
+def test_update_counts_errors(ramdisk: Path, clients):
+    # setup
+    (ramdisk / "errcounterextopenwb").write_text("5\n")
+
+    # execution
+    bridge.update(6, "192.168.1.10", None)
+
+    # evaluation
+    assert bridge._bridges[6].prefix == "openWB/lp/1/"
+    assert (ramdisk / "errcounterextopenwb").read_text() == "6"
+    assert "LP 6" in (ramdisk / "lastregelungaktiv").read_text()
+    assert published(bridge._client)["openWB/set/lp/6/faultState"] == 1
+
+
+def test_changed_configuration_reconnects(ramdisk: Path, clients):
+    # setup
+    external = bridge.get_bridge(4, "192.168.1.10", 1)
+
+    # execution
+    actual = bridge.get_bridge(4, "192.168.1.11", 1)
+
+    # evaluation
+    assert actual is not external
+    external.client.disconnect.assert_called_once_with()
+    assert [call[0] for call in external.client.mock_calls if call[0] in ("disconnect", "loop_stop")] == \
+        ["disconnect", "loop_stop"]
+    actual.client.connect_async.assert_called_once_with("192.168.1.11", 1883, keepalive=10)
@@ -0,0 +1,115 @@
+"""go-e Charger (modules/goelp1..3)
+
+The status of the charger (API v1, http://<ip>/status) is fetched over a keep-alive HTTP session held by the legacy
+run server and parsed in one pass. Power, currents, voltages, energy, plug and charge state are written through the
+chargepoint value store. With simulation enabled the power is corrected by the configured factor and the energy is
+integrated from the power, because the counter of the charger has a resolution of 1 kWh only.
+"""
+import logging
+import os
+import time
+from typing import Dict, List
+
+from helpermodules.cli import run_using_positional_cli_args
+from helpermodules.pub import pub_single
+from modules.common.component_state import ChargepointState
+from modules.common.req import get_http_session
+from modules.common.simcount import sim_count_legacy
+from modules.common.store import get_chargepoint_value_store, ramdisk_read, ramdisk_write
+from modules.common.store.ramdisk import io as ramdisk_io
+
+log = logging.getLogger(__name__)
+
+# car: 1 Ladestation bereit, kein Auto, 2 Auto lädt, 3 Warte auf Fahrzeug, 4 Ladung beendet, Fahrzeug verbunden
+CAR_NONE = 1
+CAR_CHARGING = 2
+
+
+def parse_status(status: Dict) -> ChargepointState:
+    nrg = status["nrg"]
+    car = int(status["car"])
+    return ChargepointState(
+        phases_in_use=0,
+        # nrg[11] in 0.01 kW, nrg[4..6] in 0.1 A, eto in 0.1 kWh
+        power=int(float(nrg[11]) * 10),
+        currents=[int(nrg[index]) / 10 for index in range(4, 7)],
+        voltages=[int(nrg[index]) for index in range(0, 3)],
+        imported=int(status["eto"]) * 100,
+        plug_state=car != CAR_NONE,
+        charge_state=car == CAR_CHARGING,
+        rfid=str(status["uby"]) if "uby" in status else None,
+    )
+
+
+class ChargepointModule:
+    def __init__(self, charge_point: int, ip_address: str) -> None:
+        self.charge_point = charge_point
+        self.ip_address = ip_address
+        self.__session = get_http_session()
+        self.__store = get_chargepoint_value_store(charge_point - 1)
+        self.__sim_prefix = "goe" if charge_point == 1 else "goe%d" % charge_point
+        self.__sim_start_file = \
+            "pluggedladunglp1startkwh" if charge_point == 1 else "temp_kWhCounter_lp%d" % charge_point
+
+    def get_status(self, timeout: float) -> Dict:
+        return self.__session.get("http://%s/status" % self.ip_address, timeout=timeout).json()
+
+    def __simulated_imported(self, power: int) -> float:
+        """Integrates the power like runs/simcount.py, returns the energy in Wh."""
+        ramdisk = str(ramdisk_io.RAMDISK_PATH)
+        prefix = self.__sim_prefix
+        start_kwh = float(ramdisk_read(self.__sim_start_file))
+        # fehlende Dateien werden angelegt, die Simulation startet im nächsten Regelschritt
+        if os.path.isfile(os.path.join(ramdisk, prefix + "watt0neg")):
+            if os.path.isfile(os.path.join(ramdisk, prefix + "watt0pos")):
+                result = sim_count_legacy(power, prefix, ramdisk)
+                if result is not None:
+                    ramdisk_write(prefix + "poskwh", result[0] / 3600)
+                    ramdisk_write(prefix + "negkwh", -result[1] / 3600)
+            else:
+                # Zählerstand bei Ladebeginn als Startwert der Simulation
+                ramdisk_write(prefix + "watt0pos", int(start_kwh * 3600000))
+        else:
+            ramdisk_write(prefix + "watt0neg", 0)
+        try:
+            return float(ramdisk_read(prefix + "poskwh"))
+        except FileNotFoundError:
+            return start_kwh * 1000
+
+    def update(self, timeout: float, correction_factor: float, simulation: bool) -> ChargepointState:
+        state = parse_status(self.get_status(timeout))
+        correction = int(correction_factor * 100000)
+        ramdisk_write("goecorrectionlp%d" % self.charge_point, correction)
+        if simulation:
+            state.power = state.power * correction // 100000
+            state.imported = self.__simulated_imported(state.power)
+        self.__store.set(state)
+
+        if state.rfid is not None:
+            rfid_file = "tmpgoelp%drfid" % self.charge_point
+            try:
+                previous_rfid = ramdisk_read(rfid_file)
+            except FileNotFoundError:
+                previous_rfid = None
+            if state.rfid != previous_rfid:
+                ramdisk_write("readtag", state.rfid)
+                ramdisk_write(rfid_file, state.rfid)
+
+        last_seen = time.strftime("%d.%m.%Y %H:%M:%S")
+        ramdisk_write("goelp%dlastcontact" % self.charge_point, last_seen)
+        pub_single("openWB/lp/%d/lastSeen" % self.charge_point, last_seen, no_json=True)
+        return state
+
+
+_modules = {}  # type: Dict[int, ChargepointModule]
+
+
+def read_legacy(charge_point: int, ip_address: str, timeout: float, correction_factor: float, simulation: int):
+    module = _modules.get(charge_point)
+    if module is None or module.ip_address != ip_address:
+        module = _modules[charge_point] = ChargepointModule(charge_point, ip_address)
+    module.update(timeout, correction_factor, simulation != 0)
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args(read_legacy, argv)
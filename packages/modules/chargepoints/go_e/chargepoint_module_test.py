@@ -0,0 +1,76 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+import requests_mock
+
+from modules.chargepoints.go_e import chargepoint_module
+from modules.chargepoints.go_e.chargepoint_module import parse_status, read_legacy
+
+SAMPLE = {
+    "car": "2", "eto": "12345", "uby": "0",
+    "nrg": [231, 230, 229, 0, 160, 155, 0, 0, 37, 36, 0, 735, 0, 0, 0, 0],
+}
+
+
+@pytest.fixture
+def ramdisk(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr("modules.common.store.ramdisk.io.RAMDISK_PATH", tmp_path)
+    monkeypatch.setattr("helpermodules.compatibility.is_ramdisk_in_use", lambda: True)
+    monkeypatch.setattr(chargepoint_module, "pub_single", Mock())
+    monkeypatch.setattr(chargepoint_module, "_modules", {})
+    return tmp_path
+
+
+def test_parse_status():
+    # execution
+    actual = parse_status(SAMPLE)
+
+    # evaluation
+    assert actual.power == 7350
+    assert actual.currents == [16.0, 15.5, 0]
+    assert actual.voltages == [231, 230, 229]
+    assert actual.imported == 1234500
+    assert (actual.plug_state, actual.charge_state, actual.rfid) == (True, True, "0")
+
+
+def test_read_legacy(ramdisk: Path, requests_mock: requests_mock.Mocker):
+    # setup
+    requests_mock.get("http://1.2.3.4/status", json=SAMPLE)
+
+    # execution
+    read_legacy(2, "1.2.3.4", 2, 1, 0)
+    read_legacy(2, "1.2.3.4", 2, 1, 0)
+
+    # evaluation
+    assert (ramdisk / "llaktuells1").read_text() == "7350"
+    assert (ramdisk / "llas12").read_text() == "15.5"
+    assert (ramdisk / "llvs11").read_text() == "231"
+    assert (ramdisk / "llkwhs1").read_text() == "1234.5"
+    assert (ramdisk / "plugstats1").read_text() == "1"
+    assert (ramdisk / "chargestats1").read_text() == "1"
+    assert (ramdisk / "readtag").read_text() == "0"
+    assert (ramdisk / "tmpgoelp2rfid").read_text() == "0"
+    assert requests_mock.call_count == 2
+    chargepoint_module.pub_single.assert_called_with(
+        "openWB/lp/2/lastSeen", (ramdisk / "goelp2lastcontact").read_text(), no_json=True)
+
+
+def test_read_legacy_simulation(ramdisk: Path, requests_mock: requests_mock.Mocker):
+    # setup
+    requests_mock.get("http://1.2.3.4/status", json=dict(SAMPLE, car="4"))
+    (ramdisk / "pluggedladunglp1startkwh").write_text("1000.5\n")
+
+    # execution
+    read_legacy(1, "1.2.3.4", 2, 0.9, 1)
+    first_energy = (ramdisk / "llkwh").read_text()
+    read_legacy(1, "1.2.3.4", 2, 0.9, 1)
+
+    # evaluation
+    assert first_energy == "1000.5"
+    assert (ramdisk / "goewatt0neg").read_text() == "0"
+    assert (ramdisk / "goewatt0pos").read_text() == "3601800000"
+    assert (ramdisk / "llaktuell").read_text() == "6615"
+    assert (ramdisk / "goecorrectionlp1").read_text() == "90000"
+    assert (ramdisk / "plugstat").read_text() == "1"
+    assert (ramdisk / "chargestat").read_text() == "0"
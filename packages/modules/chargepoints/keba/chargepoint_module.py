@@ -0,0 +1,237 @@
+"""KEBA KeContact (modules/keballlp1, keballlp2)
+
+Wallboxes with Modbus TCP enabled are read over one connection per wallbox, which the legacy run server keeps open
+between the control cycles. All registers are read in three block requests; firmware versions that only answer
+single register requests are detected once and then read register by register over the same connection. Whether
+port 502 is open is probed once per wallbox and cached in memory and in the ramdisk file port_502_<ip>, which is also
+used by set-current.sh. Wallboxes without Modbus are read with the UDP reports 2 and 3 on port 7090.
+
+Several wallboxes are read in parallel within one call.
+"""
+import json
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from helpermodules.cli import run_using_positional_cli_args
+from modules.common.component_state import ChargepointState
+from modules.common.modbus import ModbusDataType, ModbusTcpClient_
+from modules.common.store import get_chargepoint_value_store, ramdisk_read, ramdisk_write
+
+log = logging.getLogger(__name__)
+
+MODBUS_PORT = 502
+MODBUS_UNIT = 255
+UDP_PORT = 7090
+UDP_TIMEOUT = 1.0
+
+# Blöcke (Startadresse, Anzahl 32 Bit Werte) mit allen benötigten Registern
+BLOCKS = [(1000, 23), (1100, 6), (1500, 1)]
+REGISTERS = [1000, 1004, 1006, 1008, 1010, 1012, 1016, 1018, 1020, 1036, 1040, 1042, 1044, 1100, 1110, 1500]
+
+# Ladestatus 3: lädt, Kabelstatus 7: Kabel an Ladestation und Fahrzeug eingesteckt und verriegelt
+STATE_CHARGING = 3
+PLUG_LOCKED = 7
+
+_udp_lock = threading.Lock()
+
+
+def modbus_state(registers: Dict[int, int]) -> ChargepointState:
+    return ChargepointState(
+        phases_in_use=0,
+        power=round(registers[1020] / 1000),
+        currents=[registers[address] / 1000 for address in (1008, 1010, 1012)],
+        voltages=[registers[address] for address in (1040, 1042, 1044)],
+        # Zählerstand in 0,1 Wh
+        imported=round(registers[1036] / 10),
+        plug_state=registers[1004] == PLUG_LOCKED,
+        charge_state=registers[1000] == STATE_CHARGING,
+        rfid="00%08X" % registers[1500],
+    )
+
+
+def modbus_info(registers: Dict[int, int]) -> str:
+    """Returns the content of kebainfolp<n> in the format of the former info.py."""
+    values = [
+        ("maxcur", "%.f" % (registers[1100] / 1000)),
+        ("supcur", "%.f" % (registers[1110] / 1000)),
+        ("hwinfo", "%d" % registers[1016]),
+        ("Error", "%8X" % registers[1006]),
+        ("plugstat", "1" if registers[1004] == PLUG_LOCKED else "0"),
+        ("chargestat", "1" if registers[1000] == STATE_CHARGING else "0"),
+        ("rfid", "00%08X" % registers[1500]),
+        ("firmware", "%08X" % registers[1018]),
+        ("powerc", "%.3f" % (registers[1036] / 10000)),
+        ("power", "%.f" % (registers[1020] / 1000)),
+    ]
+    values += [("V%d" % phase, "%d" % registers[address]) for phase, address in enumerate((1040, 1042, 1044), 1)]
+    values += [("A%d" % phase, "%.2f" % (registers[address] / 1000))
+               for phase, address in enumerate((1008, 1010, 1012), 1)]
+    return json.dumps("{" + ",".join('"%s":%s' % value for value in values) + "} ")
+
+
+def udp_state(report3: Dict, report2: Dict) -> ChargepointState:
+    return ChargepointState(
+        phases_in_use=0,
+        # P in mW, I in mA, E total in 0,1 Wh, Nachkommastellen abgeschnitten wie bisher mit bc
+        power=int(report3["P"] / 1000),
+        currents=[int(report3[name] / 10) / 100 for name in ("I1", "I2", "I3")],
+        voltages=[report3[name] for name in ("U1", "U2", "U3")],
+        imported=int(report3["E total"] / 10),
+        plug_state=report2["Plug"] == PLUG_LOCKED,
+        charge_state=report2["State"] == STATE_CHARGING,
+    )
+
+
+def parse_report(data: bytes) -> Dict:
+    text = data.decode("utf-8", errors="replace").replace("\0", "")
+    return json.loads(text[:text.index("}") + 1])
+
+
+class Keba:
+    def __init__(self, charge_point: int, ip_address: str) -> None:
+        self.charge_point = charge_point
+        self.ip_address = ip_address
+        self.modbus = None  # type: Optional[bool]
+        self.block_reads = True
+        self.__client = None  # type: Optional[ModbusTcpClient_]
+        self.__store = get_chargepoint_value_store(charge_point - 1)
+
+    def probe_modbus(self) -> bool:
+        if self.modbus is None:
+            port_file = "port_502_" + self.ip_address
+            try:
+                self.modbus = {"1": True, "0": False}[ramdisk_read(port_file)]
+            except (FileNotFoundError, KeyError):
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                    probe.settimeout(2)
+                    self.modbus = probe.connect_ex((self.ip_address, MODBUS_PORT)) == 0
+                log.info("Keba %s: Port 502 ist %s", self.ip_address, "offen" if self.modbus else "nicht offen")
+                ramdisk_write(port_file, 1 if self.modbus else 0)
+        return self.modbus
+
+    def __get_client(self) -> ModbusTcpClient_:
+        if self.__client is None:
+            self.__client = ModbusTcpClient_(self.ip_address, MODBUS_PORT)
+        return self.__client
+
+    def close(self) -> None:
+        if self.__client is not None:
+            client, self.__client = self.__client, None
+            try:
+                client.close_connection()
+            except Exception:
+                pass
+
+    def __read_single(self, client: ModbusTcpClient_) -> Dict[int, int]:
+        return {address: client.read_holding_registers(address, ModbusDataType.UINT_32, unit=MODBUS_UNIT)
+                for address in REGISTERS}
+
+    def read_registers(self) -> Dict[int, int]:
+        client = self.__get_client()
+        if self.block_reads:
+            try:
+                registers = {}  # type: Dict[int, int]
+                for start, count in BLOCKS:
+                    values = client.read_holding_registers(start, [ModbusDataType.UINT_32] * count, unit=MODBUS_UNIT)
+                    registers.update((start + 2 * index, value) for index, value in enumerate(values))
+                return registers
+            except Exception:
+                # ältere Firmware beantwortet nur einzelne Register, das gilt ab dann für diese Wallbox
+                client.read_holding_registers(REGISTERS[0], ModbusDataType.UINT_32, unit=MODBUS_UNIT)
+                log.info("Keba %s: keine Blockabfragen möglich, Register werden einzeln gelesen", self.ip_address)
+                self.block_reads = False
+        return self.__read_single(client)
+
+    def __update_rfid(self, rfid: str) -> None:
+        rfid_file = "kebalp%drfid" % self.charge_point
+        try:
+            previous_rfid = ramdisk_read(rfid_file)
+        except FileNotFoundError:
+            previous_rfid = None
+        if previous_rfid is not None and previous_rfid != rfid and rfid != "0000000000":
+            ramdisk_write("readtag", rfid)
+        ramdisk_write(rfid_file, rfid)
+
+    def update_modbus(self) -> ChargepointState:
+        try:
+            registers = self.read_registers()
+        except Exception:
+            self.close()
+            raise
+        state = modbus_state(registers)
+        self.__store.set(state)
+        ramdisk_write("kebainfolp%d" % self.charge_point, modbus_info(registers))
+        self.__update_rfid(state.rfid)
+        return state
+
+    def __udp_report(self, sock: socket.socket, number: int) -> Dict:
+        sock.sendto(("report %d" % number).encode(), (self.ip_address, UDP_PORT))
+        deadline = time.time() + UDP_TIMEOUT
+        while True:
+            sock.settimeout(max(deadline - time.time(), 0.01))
+            data, address = sock.recvfrom(4096)
+            if address[0] == self.ip_address:
+                try:
+                    report = parse_report(data)
+                except ValueError:
+                    # z.B. "TCH-OK :done" als Antwort auf Befehle von set-current.sh
+                    log.debug("Keba %s: Antwort ignoriert: %r", self.ip_address, data)
+                    continue
+                if str(report.get("ID")) == str(number):
+                    return report
+
+    def update_udp(self) -> ChargepointState:
+        # Antworten kommen immer an Port 7090, daher liest immer nur eine Wallbox gleichzeitig
+        with _udp_lock, socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("", UDP_PORT))
+            report3 = self.__udp_report(sock, 3)
+            report2 = self.__udp_report(sock, 2)
+        state = udp_state(report3, report2)
+        self.__store.set(state)
+        return state
+
+    def update(self) -> ChargepointState:
+        return self.update_modbus() if self.probe_modbus() else self.update_udp()
+
+
+_kebas = {}  # type: Dict[int, Keba]
+
+
+def parse_charge_points(charge_points: str) -> List[Tuple[int, str]]:
+    """Parses "<lp>:<ip>,..." """
+    result = []
+    for entry in filter(None, charge_points.split(",")):
+        charge_point, ip_address = entry.split(":")
+        result.append((int(charge_point), ip_address))
+    return result
+
+
+def _update(charge_point: int, ip_address: str) -> None:
+    keba = _kebas.get(charge_point)
+    if keba is None or keba.ip_address != ip_address:
+        if keba is not None:
+            keba.close()
+        keba = _kebas[charge_point] = Keba(charge_point, ip_address)
+    try:
+        keba.update()
+    except Exception as e:
+        log.error("Keba LP%d (%s) konnte nicht gelesen werden: %s", charge_point, ip_address, e)
+
+
+def read_legacy(charge_points: str):
+    """charge_points: comma separated <lp>:<ip> of all KEBA wallboxes to read"""
+    wallboxes = parse_charge_points(charge_points)
+    if not wallboxes:
+        return
+    with ThreadPoolExecutor(max_workers=len(wallboxes)) as executor:
+        for future in [executor.submit(_update, charge_point, ip_address) for charge_point, ip_address in wallboxes]:
+            future.result()
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args(read_legacy, argv)
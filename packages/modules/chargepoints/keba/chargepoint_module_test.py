@@ -0,0 +1,140 @@
+import socket
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from modules.chargepoints.keba import chargepoint_module
+from modules.chargepoints.keba.chargepoint_module import (BLOCKS, Keba, parse_charge_points, parse_report,
+                                                          read_legacy, udp_state)
+
+REGISTERS = {
+    1000: 3, 1004: 7, 1006: 0, 1008: 16020, 1010: 15900, 1012: 0, 1016: 1, 1018: 0x30A01, 1020: 7350400,
+    1036: 12345678, 1040: 231, 1042: 230, 1044: 0, 1100: 32000, 1110: 16000, 1500: 0xA1B2C3D4,
+}
+
+
+def read_holding_registers(address, types, unit):
+    if isinstance(types, list):
+        return [REGISTERS.get(address + 2 * index, 0) for index in range(len(types))]
+    return REGISTERS[address]
+
+
+@pytest.fixture
+def ramdisk(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr("modules.common.store.ramdisk.io.RAMDISK_PATH", tmp_path)
+    monkeypatch.setattr("helpermodules.compatibility.is_ramdisk_in_use", lambda: True)
+    monkeypatch.setattr(chargepoint_module, "_kebas", {})
+    return tmp_path
+
+
+@pytest.fixture
+def client(monkeypatch) -> Mock:
+    client = Mock(read_holding_registers=Mock(side_effect=read_holding_registers))
+    monkeypatch.setattr(chargepoint_module, "ModbusTcpClient_", Mock(return_value=client))
+    return client
+
+
+def test_parse_charge_points():
+    assert parse_charge_points("1:192.168.1.10,2:192.168.1.11,") == [(1, "192.168.1.10"), (2, "192.168.1.11")]
+
+
+def test_parse_report():
+    # execution
+    actual = udp_state(
+        parse_report(b'{\n"ID": "3",\n"U1": 231,\n"U2": 230,\n"U3": 0,\n"I1": 16029,\n"I2": 15900,\n"I3": 0,\n'
+                     b'"P": 7350999,\n"E pres": 12,\n"E total": 12345678\n}\n\x00'),
+        parse_report(b'{"ID": "2", "State": 2, "Plug": 7}'))
+
+    # evaluation
+    assert actual.power == 7350
+    assert actual.currents == [16.02, 15.9, 0]
+    assert actual.voltages == [231, 230, 0]
+    assert actual.imported == 1234567
+    assert (actual.plug_state, actual.charge_state) == (True, False)
+
+
+def test_read_legacy_modbus(ramdisk: Path, client: Mock):
+    # setup
+    (ramdisk / "port_502_1.2.3.4").write_text("1\n")
+    (ramdisk / "port_502_1.2.3.5").write_text("1\n")
+    (ramdisk / "kebalp1rfid").write_text("0000000000\n")
+
+    # execution
+    read_legacy("1:1.2.3.4,2:1.2.3.5")
+    read_legacy("1:1.2.3.4,2:1.2.3.5")
+
+    # evaluation
+    assert client.read_holding_registers.call_count == 4 * len(BLOCKS)
+    assert chargepoint_module.ModbusTcpClient_.call_count == 2
+    assert (ramdisk / "llaktuell").read_text() == "7350"
+    assert (ramdisk / "lla1").read_text() == "16.02"
+    assert (ramdisk / "llkwh").read_text() == "1234.568"
+    assert (ramdisk / "plugstat").read_text() == "1"
+    assert (ramdisk / "chargestats1").read_text() == "1"
+    assert (ramdisk / "llvs12").read_text() == "230"
+    assert (ramdisk / "readtag").read_text() == "00A1B2C3D4"
+    assert (ramdisk / "kebalp2rfid").read_text() == "00A1B2C3D4"
+    assert (ramdisk / "kebainfolp1").read_text() == (
+        '"{\\"maxcur\\":32,\\"supcur\\":16,\\"hwinfo\\":1,\\"Error\\":       0,\\"plugstat\\":1,\\"chargestat\\":1,'
+        '\\"rfid\\":00A1B2C3D4,\\"firmware\\":00030A01,\\"powerc\\":1234.568,\\"power\\":7350,'
+        '\\"V1\\":231,\\"V2\\":230,\\"V3\\":0,\\"A1\\":16.02,\\"A2\\":15.90,\\"A3\\":0.00} "')
+
+
+def test_read_legacy_modbus_single_registers(ramdisk: Path, client: Mock):
+    # setup
+    def single_registers_only(address, types, unit):
+        if isinstance(types, list):
+            raise Exception("illegal data address")
+        return REGISTERS[address]
+    client.read_holding_registers.side_effect = single_registers_only
+    (ramdisk / "port_502_1.2.3.4").write_text("1\n")
+
+    # execution
+    read_legacy("1:1.2.3.4")
+    calls_first_cycle = client.read_holding_registers.call_count
+    read_legacy("1:1.2.3.4")
+
+    # evaluation
+    assert calls_first_cycle == 2 + len(chargepoint_module.REGISTERS)
+    assert client.read_holding_registers.call_count == calls_first_cycle + len(chargepoint_module.REGISTERS)
+    assert (ramdisk / "llaktuell").read_text() == "7350"
+
+
+def test_read_legacy_connection_error_reconnects(ramdisk: Path, client: Mock):
+    # setup
+    client.read_holding_registers.side_effect = Exception("connection refused")
+    (ramdisk / "port_502_1.2.3.4").write_text("1\n")
+
+    # execution
+    read_legacy("1:1.2.3.4")
+    client.read_holding_registers.side_effect = read_holding_registers
+    read_legacy("1:1.2.3.4")
+
+    # evaluation
+    assert chargepoint_module._kebas[1].block_reads is True
+    assert client.close_connection.call_count == 1
+    assert chargepoint_module.ModbusTcpClient_.call_count == 2
+    assert (ramdisk / "llaktuell").read_text() == "7350"
+
+
+def test_update_udp_skips_unrelated_datagrams(ramdisk: Path, monkeypatch):
+    # setup
+    sock = Mock(recvfrom=Mock(side_effect=[
+        (b"TCH-OK :done\n", ("1.2.3.4", 7090)),
+        (b'{"ID": "3", "U1": 231, "U2": 230, "U3": 0, "I1": 16029, "I2": 0, "I3": 0, "P": 7350999, '
+         b'"E total": 12345678}', ("1.2.3.5", 7090)),
+        (b'{"ID": "3", "U1": 231, "U2": 230, "U3": 0, "I1": 16029, "I2": 0, "I3": 0, "P": 7350999, '
+         b'"E total": 12345678}', ("1.2.3.4", 7090)),
+        (b'{"ID": "2", "State": 3, "Plug": 7}', ("1.2.3.4", 7090)),
+    ]))
+    sock.__enter__ = Mock(return_value=sock)
+    sock.__exit__ = Mock(return_value=False)
+    monkeypatch.setattr(socket, "socket", Mock(return_value=sock))
+
+    # execution
+    actual = Keba(1, "1.2.3.4").update_udp()
+
+    # evaluation
+    assert (actual.power, actual.plug_state, actual.charge_state) == (7350, True, True)
+    assert (ramdisk / "llkwh").read_text() == "1234.567"
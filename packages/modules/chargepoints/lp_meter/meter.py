@@ -0,0 +1,136 @@
+"""Meters of the charge points configured as "openWB Satellit" (modules/mpm3pmlllp1..8)
+
+The meters (MPM3PM for modbus ids below 100, SDM otherwise) are connected through a Modbus TCP gateway on port 8899.
+All configured charge points are read in one call of the legacy run server: one connection per gateway is kept open
+between the control cycles, the gateways are read in parallel and each meter is read with block reads (one request
+for MPM3PM, two for SDM) instead of one request per value. The ramdisk files are written in the same format as the
+former readmpm3pm.py scripts.
+"""
+import logging
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple
+
+from helpermodules.cli import run_using_positional_cli_args
+from modules.common.modbus import ModbusDataType, ModbusTcpClient_
+from modules.common.store import ramdisk_write
+
+log = logging.getLogger(__name__)
+
+PORT = 8899
+# Modbus-IDs ab 100 sind SDM Zähler
+SDM_MIN_ID = 100
+
+MeterValues = NamedTuple("MeterValues", [("imported", float), ("currents", List[float]), ("power", int),
+                                         ("voltages", List[float])])
+MeterFiles = NamedTuple("MeterFiles", [("imported", str), ("currents", List[str]), ("power", str),
+                                       ("voltages", List[str])])
+
+_clients = {}  # type: Dict[str, ModbusTcpClient_]
+
+
+def ramdisk_files(charge_point: int) -> MeterFiles:
+    phases = range(1, 4)
+    if charge_point == 1:
+        return MeterFiles("llkwh", ["lla%d" % p for p in phases], "llaktuell", ["llv%d" % p for p in phases])
+    if charge_point in (2, 3):
+        s = charge_point - 1
+        return MeterFiles("llkwhs%d" % s, ["llas%d%d" % (s, p) for p in phases], "llaktuells%d" % s,
+                          ["llvs%d%d" % (s, p) for p in phases])
+    return MeterFiles("llkwhlp%d" % charge_point, ["lla%dlp%d" % (p, charge_point) for p in phases],
+                      "llaktuelllp%d" % charge_point, ["llv%dlp%d" % (p, charge_point) for p in phases])
+
+
+def read_mpm3pm(client: ModbusTcpClient_, modbus_id: int) -> MeterValues:
+    # ein Block von 0x02 (Zählerstand) bis 0x27 (Gesamtleistung), Spannungen und Ströme stehen im unteren Register
+    words = client.read_input_registers(0x02, [ModbusDataType.UINT_16] * 0x26, unit=modbus_id)
+
+    def word(address: int) -> int:
+        return words[address - 0x02]
+
+    def int32(address: int) -> int:
+        return struct.unpack(">i", struct.pack(">HH", word(address), word(address + 1)))[0]
+
+    # Ganzzahldivision wie bisher im Python 2 Skript
+    power = int32(0x26) // 100
+    return MeterValues(imported=int32(0x02) / 100,
+                       currents=[word(address) / 100 for address in (0x0F, 0x11, 0x13)],
+                       power=power if power >= 10 else 0,
+                       voltages=[word(address) / 10 for address in (0x09, 0x0B, 0x0D)])
+
+
+def read_sdm(client: ModbusTcpClient_, modbus_id: int) -> MeterValues:
+    # Spannungen, Ströme und Leistungen je Phase ab 0x00, Zählerstand bei 0x0156
+    values = client.read_input_registers(0x00, [ModbusDataType.FLOAT_32] * 9, unit=modbus_id)
+    imported = client.read_input_registers(0x0156, ModbusDataType.FLOAT_32, unit=modbus_id)
+    power = sum(int(value) for value in values[6:9])
+    return MeterValues(imported=float("%.3f" % imported),
+                       currents=[float("%.1f" % value) for value in values[3:6]],
+                       power=power if power >= 10 else 0,
+                       voltages=[float("%.1f" % value) for value in values[0:3]])
+
+
+def read_meter(client: ModbusTcpClient_, modbus_id: int) -> MeterValues:
+    return (read_sdm if modbus_id >= SDM_MIN_ID else read_mpm3pm)(client, modbus_id)
+
+
+def write_values(files: MeterFiles, values: MeterValues) -> None:
+    ramdisk_write(files.imported, values.imported)
+    for file, value in zip(files.currents, values.currents):
+        ramdisk_write(file, value)
+    ramdisk_write(files.power, values.power)
+    for file, value in zip(files.voltages, values.voltages):
+        ramdisk_write(file, value)
+
+
+def _get_client(ip_address: str) -> ModbusTcpClient_:
+    client = _clients.get(ip_address)
+    if client is None:
+        client = _clients[ip_address] = ModbusTcpClient_(ip_address, PORT)
+    return client
+
+
+def _read_gateway(ip_address: str, meters: List[Tuple[int, int]]) -> None:
+    client = _get_client(ip_address)
+    for charge_point, modbus_id in meters:
+        try:
+            write_values(ramdisk_files(charge_point), read_meter(client, modbus_id))
+        except Exception as e:
+            log.error("Zähler von Ladepunkt %d (%s, ID %d) konnte nicht gelesen werden: %s",
+                      charge_point, ip_address, modbus_id, e)
+            # Verbindung im nächsten Zyklus neu aufbauen
+            _clients.pop(ip_address, None)
+            try:
+                client.close_connection()
+            except Exception:
+                pass
+            client = _get_client(ip_address)
+
+
+def parse_charge_points(charge_points: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Groups "<lp>:<ip>:<id>,..." by gateway ip address."""
+    gateways = {}  # type: Dict[str, List[Tuple[int, int]]]
+    for entry in filter(None, charge_points.split(",")):
+        try:
+            charge_point, ip_address, modbus_id = entry.split(":")
+            if ip_address == "":
+                raise ValueError("no ip address")
+            meter = (int(charge_point), int(modbus_id))
+            gateways.setdefault(ip_address, []).append(meter)
+        except ValueError:
+            log.error("Ungültige Angabe für Ladepunkt-Zähler: <%s>", entry)
+    return gateways
+
+
+def read(charge_points: str):
+    """charge_points: comma separated <lp>:<ip>:<modbus id> of all charge points to read"""
+    gateways = parse_charge_points(charge_points)
+    if not gateways:
+        return
+    with ThreadPoolExecutor(max_workers=len(gateways)) as executor:
+        for future in [executor.submit(_read_gateway, ip_address, meters) for ip_address, meters in gateways.items()]:
+            future.result()
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args({"read": read}, argv)
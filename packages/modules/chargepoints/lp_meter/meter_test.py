@@ -0,0 +1,116 @@
+import struct
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from modules.chargepoints.lp_meter import meter
+from modules.chargepoints.lp_meter.meter import MeterValues, parse_charge_points, ramdisk_files, read_meter
+from modules.common.modbus import ModbusDataType
+
+
+def int32_words(value: int) -> List[int]:
+    return list(struct.unpack(">HH", struct.pack(">i", value)))
+
+
+def mpm3pm_client(imported: int, power: int) -> Mock:
+    words = [0] * 0x26
+    words[0:2] = int32_words(imported)
+    # Spannungen 0x08.., Ströme 0x0E.. jeweils im unteren Register
+    words[0x09 - 2], words[0x0B - 2], words[0x0D - 2] = 2301, 2302, 2303
+    words[0x0F - 2], words[0x11 - 2], words[0x13 - 2] = 1602, 1550, 0
+    words[0x26 - 2:0x28 - 2] = int32_words(power)
+    client = Mock()
+    client.read_input_registers.return_value = words
+    return client
+
+
+def sdm_client(watts: List[float]) -> Mock:
+    def read_input_registers(address: int, types, unit: int):
+        if address == 0x0156:
+            return 12345.6784
+        return [230.14, 231.06, 229.96, 16.04, 15.96, 0.01] + watts
+
+    client = Mock()
+    client.read_input_registers.side_effect = read_input_registers
+    return client
+
+
+def test_read_mpm3pm_single_block():
+    # setup
+    client = mpm3pm_client(1234567, 735099)
+
+    # execution
+    actual = read_meter(client, 5)
+
+    # evaluation
+    assert actual == MeterValues(12345.67, [16.02, 15.5, 0.0], 7350, [230.1, 230.2, 230.3])
+    client.read_input_registers.assert_called_once_with(0x02, [ModbusDataType.UINT_16] * 0x26, unit=5)
+
+
+def test_read_mpm3pm_ignores_standby_power():
+    assert read_meter(mpm3pm_client(0, 999), 5).power == 0
+
+
+@pytest.mark.parametrize("watts,expected_power", [([3700.9, 3650.2, 0.4], 7350), ([4.9, 3.0, 1.0], 0)])
+def test_read_sdm(watts: List[float], expected_power: int):
+    # execution
+    actual = read_meter(sdm_client(watts), 105)
+
+    # evaluation
+    assert actual == MeterValues(12345.678, [16.0, 16.0, 0.0], expected_power, [230.1, 231.1, 230.0])
+
+
+@pytest.mark.parametrize("charge_point,expected_power,expected_current", [
+    (1, "llaktuell", "lla1"), (2, "llaktuells1", "llas11"), (3, "llaktuells2", "llas21"),
+    (4, "llaktuelllp4", "lla1lp4"), (8, "llaktuelllp8", "lla1lp8"),
+])
+def test_ramdisk_files(charge_point: int, expected_power: str, expected_current: str):
+    files = ramdisk_files(charge_point)
+    assert (files.power, files.currents[0]) == (expected_power, expected_current)
+
+
+def test_parse_charge_points_groups_by_gateway():
+    assert parse_charge_points("1:192.168.1.10:105,4:192.168.1.11:5,,5:192.168.1.10:106,6::5,7:192.168.1.12:") == {
+        "192.168.1.10": [(1, 105), (5, 106)],
+        "192.168.1.11": [(4, 5)],
+    }
+
+
+def test_read_writes_ramdisk_and_keeps_connection(tmp_path: Path, monkeypatch):
+    # setup
+    monkeypatch.setattr("modules.common.store.ramdisk.io.RAMDISK_PATH", tmp_path)
+    clients = {"192.168.1.10": mpm3pm_client(1234567, 735099), "192.168.1.11": sdm_client([1, 2, 3])}
+    monkeypatch.setattr(meter, "_clients", dict(clients))
+
+    # execution
+    meter.read("1:192.168.1.10:5,4:192.168.1.11:105")
+    meter.read("1:192.168.1.10:5")
+
+    # evaluation
+    assert (tmp_path / "llkwh").read_text() == "12345.67"
+    assert (tmp_path / "llaktuell").read_text() == "7350"
+    assert (tmp_path / "llv3").read_text() == "230.3"
+    assert (tmp_path / "llkwhlp4").read_text() == "12345.678"
+    assert (tmp_path / "lla3lp4").read_text() == "0.0"
+    assert (tmp_path / "llaktuelllp4").read_text() == "0"
+    assert clients["192.168.1.10"].read_input_registers.call_count == 2
+    assert meter._clients == clients
+
+
+def test_read_reconnects_after_error(tmp_path: Path, monkeypatch):
+    # setup
+    monkeypatch.setattr("modules.common.store.ramdisk.io.RAMDISK_PATH", tmp_path)
+    client = Mock()
+    client.read_input_registers.side_effect = Exception("timeout")
+    monkeypatch.setattr(meter, "_clients", {"192.168.1.10": client})
+    monkeypatch.setattr(meter, "ModbusTcpClient_", Mock(return_value=mpm3pm_client(100, 0)))
+
+    # execution
+    meter.read("1:192.168.1.10:5,2:192.168.1.10:6")
+
+    # evaluation
+    client.close_connection.assert_called_once_with()
+    assert not (tmp_path / "llkwh").exists()
+    assert (tmp_path / "llkwhs1").read_text() == "1.0"
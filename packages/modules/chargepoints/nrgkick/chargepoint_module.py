@@ -0,0 +1,63 @@
+"""NRGKick Connect (modules/nrgkicklp1..2)
+
+The measurements of the charger (http://<ip>/api/measurements/<mac>) are fetched over a keep-alive HTTP session held
+by the legacy run server, parsed in one pass and written through the chargepoint value store.
+"""
+import logging
+from typing import Dict, List
+
+from helpermodules.cli import run_using_positional_cli_args
+from modules.common.component_state import ChargepointState
+from modules.common.req import get_http_session
+from modules.common.store import get_chargepoint_value_store
+
+log = logging.getLogger(__name__)
+
+# die Schnittstelle liefert keinen Steckerstatus, oberhalb dieser Leistung gilt das Fahrzeug als angesteckt und ladend
+CHARGING_POWER_THRESHOLD = 50
+
+
+def parse_measurements(measurements: Dict) -> ChargepointState:
+    power = int(float(measurements["ChargingPower"]) * 1000)
+    return ChargepointState(
+        phases_in_use=0,
+        power=power,
+        currents=[int(float(current)) for current in measurements["ChargingCurrentPhase"][:3]],
+        voltages=[float(voltage) for voltage in measurements["VoltagePhase"][:3]],
+        # ChargingEnergyOverAll in kWh, auf Wh abgeschnitten
+        imported=int(float(measurements["ChargingEnergyOverAll"]) * 1000),
+        plug_state=power > CHARGING_POWER_THRESHOLD,
+        charge_state=power > CHARGING_POWER_THRESHOLD,
+    )
+
+
+class ChargepointModule:
+    def __init__(self, charge_point: int, ip_address: str, mac_address: str) -> None:
+        self.charge_point = charge_point
+        self.ip_address = ip_address
+        self.mac_address = mac_address
+        self.__session = get_http_session()
+        self.__store = get_chargepoint_value_store(charge_point - 1)
+
+    def get_measurements(self, timeout: float) -> Dict:
+        return self.__session.get(
+            "http://%s/api/measurements/%s" % (self.ip_address, self.mac_address), timeout=timeout).json()
+
+    def update(self, timeout: float) -> ChargepointState:
+        state = parse_measurements(self.get_measurements(timeout))
+        self.__store.set(state)
+        return state
+
+
+_modules = {}  # type: Dict[int, ChargepointModule]
+
+
+def read_legacy(charge_point: int, ip_address: str, timeout: float, mac_address: str):
+    module = _modules.get(charge_point)
+    if module is None or (module.ip_address, module.mac_address) != (ip_address, mac_address):
+        module = _modules[charge_point] = ChargepointModule(charge_point, ip_address, mac_address)
+    module.update(timeout)
+
+
+def main(argv: List[str]):
+    run_using_positional_cli_args(read_legacy, argv)
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from modules.chargepoints.nrgkick import chargepoint_module
+from modules.chargepoints.nrgkick.chargepoint_module import parse_measurements, read_legacy
+
+SAMPLE = {
+    "ChargingPower": 7.35, "ChargingCurrentPhase": [16.02, 15.9, 0.0], "VoltagePhase": [231, 230.5, 229],
+    "ChargingEnergyOverAll": 1234.5678, "Frequency": 50.0,
+}
+
+
+@pytest.mark.parametrize("power,expected_state", [(7.35, True), (0.05, False)])
+def test_parse_measurements(power: float, expected_state: bool):
+    # execution
+    actual = parse_measurements(dict(SAMPLE, ChargingPower=power))
+
+    # evaluation
+    assert actual.currents == [16, 15, 0]
+    assert actual.voltages == [231, 230.5, 229]
+    assert actual.imported == 1234567
+    assert (actual.plug_state, actual.charge_state) == (expected_state, expected_state)
+
+
+def test_read_legacy(tmp_path: Path, monkeypatch, requests_mock: requests_mock.Mocker):
+    # setup
+    monkeypatch.setattr("modules.common.store.ramdisk.io.RAMDISK_PATH", tmp_path)
+    monkeypatch.setattr("helpermodules.compatibility.is_ramdisk_in_use", lambda: True)
+    monkeypatch.setattr(chargepoint_module, "_modules", {})
+    requests_mock.get("http://1.2.3.4/api/measurements/00:1E:C0:76:82:1D", json=SAMPLE)
+
+    # execution
+    read_legacy(1, "1.2.3.4", 3, "00:1E:C0:76:82:1D")
+
+    # evaluation
+    assert (tmp_path / "llaktuell").read_text() == "7350"
+    assert (tmp_path / "lla1").read_text() == "16"
+    assert (tmp_path / "llv2").read_text() == "230.5"
+    assert (tmp_path / "llkwh").read_text() == "1234.567"
+    assert (tmp_path / "chargestat").read_text() == "1"
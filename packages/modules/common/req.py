@@ -1,12 +1,54 @@
-
 import logging
+import threading
+from typing import Dict, Tuple
+
 from requests import Session
+from requests.adapters import BaseAdapter, HTTPAdapter
 
 log = logging.getLogger("soc."+__name__)
 
+# Anzahl der Hosts, deren Verbindungen offen gehalten werden, und offene Verbindungen je Host
+POOL_HOSTS = 32
+POOL_CONNECTIONS_PER_HOST = 8
+
+
+class _PooledAdapter(BaseAdapter):
+    """Adapter shared by all sessions. urllib3 keeps one connection pool per scheme, host and port, so keep-alive
+    connections are reused across sessions and update cycles. Certificates are only checked when a connection is
+    established, therefore each verify and cert setting gets its own HTTPAdapter with its own pools. Closing a session
+    must not close the shared pools."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__adapters = {}  # type: Dict[Tuple, HTTPAdapter]
+        self.__lock = threading.Lock()
+
+    def get_adapter(self, verify, cert) -> HTTPAdapter:
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert)
+        with self.__lock:
+            adapter = self.__adapters.get(key)
+            if adapter is None:
+                adapter = self.__adapters[key] = HTTPAdapter(pool_connections=POOL_HOSTS,
+                                                             pool_maxsize=POOL_CONNECTIONS_PER_HOST)
+            return adapter
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return self.get_adapter(verify, cert).send(request, stream=stream, timeout=timeout, verify=verify, cert=cert,
+                                                   proxies=proxies)
+
+    def close(self) -> None:
+        pass
+
+
+_adapter = _PooledAdapter()
+
 
 def get_http_session() -> Session:
+    """Returns a new session using the shared connection pools. Cookies, headers and authentication are not shared
+    between sessions."""
     session = Session()
+    session.mount("http://", _adapter)
+    session.mount("https://", _adapter)
     session.hooks['response'].append(lambda r, *args, **kwargs: r.raise_for_status())
     session.hooks['response'].append(lambda r, *args, **kwargs: log.debug("Get-Response: " + r.text))
     return session
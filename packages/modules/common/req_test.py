@@ -0,0 +1,54 @@
+import pytest
+import requests_mock
+from requests import HTTPError, Response
+from requests.adapters import HTTPAdapter
+
+from modules.common.req import get_http_session
+
+
+def test_sessions_share_connection_pools():
+    # execution
+    first = get_http_session()
+    second = get_http_session()
+    first.close()
+
+    # evaluation
+    assert first.get_adapter("http://1.2.3.4/") is second.get_adapter("http://5.6.7.8/")
+    assert first.get_adapter("https://1.2.3.4/") is second.get_adapter("http://1.2.3.4/")
+    assert first.cookies is not second.cookies
+
+
+def test_session_raises_for_status(requests_mock: requests_mock.Mocker):
+    # setup
+    requests_mock.get("http://1.2.3.4/", status_code=404)
+
+    # execution & evaluation
+    with pytest.raises(HTTPError):
+        get_http_session().get("http://1.2.3.4/")
+
+
+def test_pools_are_separate_per_verify_setting(monkeypatch):
+    # setup
+    monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+    monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+    adapters = []
+
+    def send(self, request, **kwargs):
+        adapters.append((self, kwargs["verify"]))
+        response = Response()
+        response.status_code = 200
+        response._content = b""
+        return response
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    insecure = get_http_session()
+    insecure.verify = False
+
+    # execution
+    get_http_session().get("https://1.2.3.4/")
+    insecure.get("https://1.2.3.4/")
+    get_http_session().get("https://1.2.3.4/", verify=True)
+
+    # evaluation
+    assert [verify for adapter, verify in adapters] == [True, False, True]
+    assert adapters[0][0] is adapters[2][0]
+    assert adapters[0][0] is not adapters[1][0]
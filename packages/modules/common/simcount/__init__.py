@@ -1,3 +1,4 @@
 from modules.common.simcount._simcount import sim_count
 from modules.common.simcount._simcounter import SimCounter
 from modules.common.simcount.simcounter_state import SimCounterState
+from modules.common.simcount._legacy import sim_count_legacy
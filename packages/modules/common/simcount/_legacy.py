@@ -0,0 +1,64 @@
+""" Sim Count für die Legacy-Aufrufer (runs/simcount.py, SmartHome)
+Arbeitet direkt auf den ramdisk-Dateien <prefix>sec0, <prefix>wh0, <prefix>watt0pos und <prefix>watt0neg im bisherigen
+Format: Zeitstempel, letzte Leistung in W, Import in Ws und Export in Ws (negativ), jeweils als Ganzzahl.
+"""
+import logging
+import os
+import time
+from typing import Optional, Tuple
+
+from modules.common.simcount._calculate import calculate_import_export
+
+log = logging.getLogger(__name__)
+
+
+def _read(path: str) -> float:
+    with open(path, 'r') as f:
+        return float(f.read())
+
+
+def _write(path: str, value) -> None:
+    with open(path, 'w') as f:
+        f.write(str(value))
+
+
+def sim_count_legacy(power_present: int, prefix: str, ramdisk: str,
+                     timestamp_present: Optional[float] = None) -> Optional[Tuple[int, int]]:
+    """ emulate import export
+
+    Parameters
+    ----------
+    power_present: aktuelle Leistung in W
+    prefix: prefix der ramdisk-Dateien
+    ramdisk: Verzeichnis der ramdisk-Dateien
+    timestamp_present: Zeitpunkt der Messung, Default jetzt
+
+    Return
+    ------
+    Import und Export (negativ) in Ws, None wenn noch kein vorheriger Zustand existiert
+    """
+    if timestamp_present is None:
+        timestamp_present = time.time()
+    base = os.path.join(ramdisk, prefix)
+    if not os.path.isfile(base + 'sec0'):
+        log.debug("No previous state found. Starting new simulation.")
+        _write(base + 'sec0', "%22.6f" % timestamp_present)
+        _write(base + 'wh0', int(power_present))
+        return None
+    timestamp_previous = _read(base + 'sec0')
+    power_previous = _read(base + 'wh0')
+    imported = _read(base + 'watt0pos')
+    exported = _read(base + 'watt0neg')
+    _write(base + 'sec0', "%22.6f" % timestamp_present)
+    _write(base + 'wh0', int(power_present))
+    seconds = timestamp_present - timestamp_previous
+    if seconds > 0:
+        energy_imported, energy_exported = calculate_import_export(seconds, power_previous, power_present)
+        imported += energy_imported
+        exported -= energy_exported
+    result = int(round(imported)), int(round(exported))
+    log.debug("seconds: %g, power: %g -> %g, imported: %d Ws, exported: %d Ws",
+              seconds, power_previous, power_present, result[0], result[1])
+    _write(base + 'watt0pos', result[0])
+    _write(base + 'watt0neg', result[1])
+    return result
@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from modules.common.simcount._legacy import sim_count_legacy
+
+
+def legacy_loop(seconds1: float, seconds2: float, watt1: int, watt2: int) -> Tuple[int, int]:
+    # bisherige sekundenweise Integration aus runs/simcount.py als Referenz
+    wattposh = 0
+    wattnegh = 0
+    seconds1 = seconds1 + 1
+    deltasec = seconds2 - seconds1
+    deltasectrun = int(deltasec * 1000) / 1000
+    stepsize = int((watt2 - watt1) / deltasec)
+    while seconds1 <= seconds2:
+        if watt1 < 0:
+            wattnegh = wattnegh + watt1
+        else:
+            wattposh = wattposh + watt1
+        watt1 = watt1 + stepsize
+        if stepsize < 0:
+            watt1 = max(watt1, watt2)
+        else:
+            watt1 = min(watt1, watt2)
+        seconds1 = seconds1 + 1
+    rest = deltasec - deltasectrun
+    if rest > 0:
+        watt1 = int(watt1 * rest)
+        if watt1 < 0:
+            wattnegh = wattnegh + watt1
+        else:
+            wattposh = wattposh + watt1
+    return wattposh, wattnegh
+
+
+def write_state(ramdisk: Path, timestamp: float, power: int, imported: int = 0, exported: int = 0) -> None:
+    (ramdisk / "testsec0").write_text("%22.6f" % timestamp)
+    (ramdisk / "testwh0").write_text(str(power))
+    (ramdisk / "testwatt0pos").write_text(str(imported))
+    (ramdisk / "testwatt0neg").write_text(str(exported))
+
+
+def test_first_call_initializes_state(tmp_path: Path):
+    # execution
+    actual = sim_count_legacy(1500, "test", str(tmp_path), 1000.0)
+
+    # evaluation
+    assert actual is None
+    assert float((tmp_path / "testsec0").read_text()) == 1000.0
+    assert (tmp_path / "testwh0").read_text() == "1500"
+    assert not (tmp_path / "testwatt0pos").exists()
+
+
+def test_keeps_file_format(tmp_path: Path):
+    # setup
+    write_state(tmp_path, 1000.0, 100, 3600, -7200)
+
+    # execution
+    actual = sim_count_legacy(100, "test", str(tmp_path), 1010.0)
+
+    # evaluation
+    assert actual == (4600, -7200)
+    assert (tmp_path / "testsec0").read_text() == "%22.6f" % 1010.0
+    assert (tmp_path / "testwh0").read_text() == "100"
+    assert (tmp_path / "testwatt0pos").read_text() == "4600"
+    assert (tmp_path / "testwatt0neg").read_text() == "-7200"
+
+
+@pytest.mark.parametrize("seconds,power_previous,power_present", [
+    pytest.param(10, 500, 500, id="constant import"),
+    pytest.param(10, -500, -500, id="constant export"),
+    pytest.param(10, 0, 0, id="zero"),
+    pytest.param(60, 0, 3000, id="ramp up"),
+    pytest.param(60, 3000, 100, id="ramp down"),
+    pytest.param(30, -1000, 2000, id="export to import"),
+    pytest.param(30, 2000, -1000, id="import to export"),
+    pytest.param(3600, 1200, 1200, id="long pause"),
+])
+def test_equivalent_to_legacy_loop(tmp_path: Path, seconds: int, power_previous: int, power_present: int):
+    # setup
+    write_state(tmp_path, 1000.0, power_previous)
+
+    # execution
+    actual = sim_count_legacy(power_present, "test", str(tmp_path), 1000.0 + seconds)
+
+    # evaluation
+    # die Schleife summiert Rechtecke je Sekunde, Abweichung höchstens eine Sekunde mit der größeren Leistung
+    expected = legacy_loop(1000.0, 1000.0 + seconds, power_previous, power_present)
+    tolerance = max(abs(power_previous), abs(power_present))
+    assert actual[0] == pytest.approx(expected[0], abs=tolerance)
+    assert actual[1] == pytest.approx(expected[1], abs=tolerance)
@@ -1,32 +1,78 @@
 import functools
 import logging
-from typing import Callable, Optional, Iterable, List, TypeVar
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, Generic, Optional, Iterable, List, TypeVar, Union
 
 from requests import Session
 
 log = logging.getLogger(__name__)
 T = TypeVar('T')
-RequestFunction = Callable[[Session], T]
+Responses = Dict[str, Union[str, Exception]]
 
+TIMEOUT = 5
 
-def _request_value(url: str, session: Session) -> float:
-    return float(session.get(url, timeout=5).text.replace("\n", ""))
+
+class RequestFunction(Generic[T]):
+    """Reads a value from the responses of the given URLs, which are fetched beforehand by fetch_all."""
+
+    def __init__(self, urls: List[str], function: Callable[[Responses], T]) -> None:
+        self.urls = urls
+        self.__function = function
+
+    def __call__(self, responses: Responses) -> T:
+        return self.__function(responses)
+
+
+def _request_value(url: str, responses: Responses) -> float:
+    response = responses[url]
+    if isinstance(response, Exception):
+        raise response
+    return float(response.replace("\n", ""))
+
+
+def _fetch(session: Session, url: str, deadline: float) -> str:
+    return session.get(url, timeout=max(deadline - time.time(), 0.1)).text
+
+
+def fetch_all(session: Session, urls: Iterable[str], timeout: float = TIMEOUT) -> Responses:
+    """Fetches all URLs concurrently, identical URLs only once, with one deadline for all requests. Failed requests
+    are returned as exception, so that only the components using the URL fail."""
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    deadline = time.time() + timeout
+    executor = ThreadPoolExecutor(max_workers=len(unique_urls))
+    try:
+        futures = {url: executor.submit(_fetch, session, url, deadline) for url in unique_urls}
+        wait(futures.values(), timeout=timeout)
+    finally:
+        executor.shutdown(wait=False)
+    responses = {}  # type: Responses
+    for url, future in futures.items():
+        if not future.done():
+            responses[url] = TimeoutError("No response from <%s> within %s s" % (url, timeout))
+        elif future.exception() is not None:
+            responses[url] = future.exception()
+        else:
+            responses[url] = future.result()
+    return responses
 
 
 def create_request_function(url: str, path: Optional[str]) -> RequestFunction[Optional[float]]:
     if path is None:
-        return lambda _: None
+        return RequestFunction([], lambda _: None)
     else:
-        return functools.partial(_request_value, url + path)
+        return RequestFunction([url + path], functools.partial(_request_value, url + path))
 
 
 def create_request_function_array(url: str, paths: Iterable[Optional[str]]) -> RequestFunction[Optional[List[float]]]:
-    functions = []  # type: List[RequestFunction[float]]
+    urls = []  # type: List[str]
     for path in paths:
         if path is not None:
-            functions.append(functools.partial(_request_value, url + path))
-        elif functions:
+            urls.append(url + path)
+        elif urls:
             raise Exception("Expected all or no paths to be None, got: <%s>" % paths)
-    if functions:
-        return lambda session: [function(session) for function in functions]
-    return lambda: None
+    if urls:
+        return RequestFunction(urls, lambda responses: [_request_value(request_url, responses) for request_url in urls])
+    return RequestFunction([], lambda _: None)
@@ -1,15 +1,13 @@
 #!/usr/bin/env python3
 from typing import Dict, Union
 
-from requests import Session
-
 from dataclass_utils import dataclass_from_dict
 from modules.common.component_state import BatState
 from modules.common.component_type import ComponentDescriptor
 from modules.common.fault_state import ComponentInfo
 from modules.common.simcount import SimCounter
 from modules.common.store import get_bat_value_store
-from modules.devices.http.api import create_request_function
+from modules.devices.http.api import Responses, create_request_function
 from modules.devices.http.config import HttpBatSetup
 
 
@@ -25,17 +23,19 @@ class HttpBat:
         self.__get_imported = create_request_function(url, self.component_config.configuration.imported_path)
         self.__get_exported = create_request_function(url, self.component_config.configuration.exported_path)
         self.__get_soc = create_request_function(url, self.component_config.configuration.soc_path)
+        self.urls = self.__get_power.urls + self.__get_imported.urls + self.__get_exported.urls + \
+            self.__get_soc.urls
 
-    def update(self, session: Session) -> None:
-        imported = self.__get_imported(session)
-        exported = self.__get_exported(session)
-        power = self.__get_power(session)
+    def update(self, responses: Responses) -> None:
+        imported = self.__get_imported(responses)
+        exported = self.__get_exported(responses)
+        power = self.__get_power(responses)
         if imported is None or exported is None:
             imported, exported = self.sim_counter.sim_count(power)
 
         bat_state = BatState(
             power=power,
-            soc=self.__get_soc(session),
+            soc=self.__get_soc(responses),
             imported=imported,
             exported=exported
         )
@@ -7,7 +7,7 @@ from modules.common.component_type import ComponentDescriptor
 from modules.common.fault_state import ComponentInfo
 from modules.common.simcount import SimCounter
 from modules.common.store import get_counter_value_store
-from modules.devices.http.api import create_request_function, create_request_function_array
+from modules.devices.http.api import Responses, create_request_function, create_request_function_array
 from modules.devices.http.config import HttpCounterSetup
 
 
@@ -27,16 +27,18 @@ class HttpCounter:
             component_config.configuration.current_l2_path,
             component_config.configuration.current_l3_path,
         ])
+        self.urls = self.__get_power.urls + self.__get_imported.urls + self.__get_exported.urls + \
+            self.__get_currents.urls
 
-    def update(self, session):
-        imported = self.__get_imported(session)
-        exported = self.__get_exported(session)
-        power = self.__get_power(session)
+    def update(self, responses: Responses):
+        imported = self.__get_imported(responses)
+        exported = self.__get_exported(responses)
+        power = self.__get_power(responses)
         if imported is None or exported is None:
             imported, exported = self.sim_counter.sim_count(power)
 
         counter_state = CounterState(
-            currents=self.__get_currents(session),
+            currents=self.__get_currents(responses),
             imported=imported,
             exported=exported,
             power=power
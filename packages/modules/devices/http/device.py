@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 import logging
 import re
-from typing import Union, List
+from typing import Iterable, Union, List
 
 from helpermodules.cli import run_using_positional_cli_args
 from modules.common import req
 from modules.common.abstract_device import DeviceDescriptor
-from modules.common.configurable_device import ConfigurableDevice, ComponentFactoryByType, IndependentComponentUpdater
+from modules.common.component_context import SingleComponentUpdateContext
+from modules.common.configurable_device import ConfigurableDevice, ComponentFactoryByType
+from modules.devices.http.api import fetch_all
 from modules.devices.http.bat import HttpBat
 from modules.devices.http.config import HTTP, HTTPConfiguration, HttpBatSetup, HttpCounterSetup, HttpInverterSetup, \
     HttpBatConfiguration, HttpCounterConfiguration, HttpInverterConfiguration
@@ -27,6 +29,15 @@ def create_device(device_config: HTTP):
         return HttpInverter(device_config.id, component_config, device_config.configuration.url)
 
     session = req.get_http_session()
+
+    def update_components(components: Iterable[Union[HttpBat, HttpCounter, HttpInverter]]):
+        components = list(components)
+        # alle URLs aller Komponenten gleichzeitig abfragen, jede Komponente wertet danach nur ihre Antworten aus
+        responses = fetch_all(session, [url for component in components for url in component.urls])
+        for component in components:
+            with SingleComponentUpdateContext(component.component_info):
+                component.update(responses)
+
     return ConfigurableDevice(
         device_config=device_config,
         component_factory=ComponentFactoryByType(
@@ -34,7 +45,7 @@ def create_device(device_config: HTTP):
             counter=create_counter_component,
             inverter=create_inverter_component,
         ),
-        component_updater=IndependentComponentUpdater(lambda component: component.update(session))
+        component_updater=update_components
     )
 
 
@@ -0,0 +1,64 @@
+from unittest.mock import Mock
+
+import pytest
+import requests_mock
+
+from modules.common.fault_state import FaultState
+from modules.devices.http import bat, counter
+from modules.devices.http.config import HTTP, HTTPConfiguration, HttpBatConfiguration, HttpBatSetup, \
+    HttpCounterConfiguration, HttpCounterSetup
+from modules.devices.http.device import create_device
+
+
+@pytest.fixture
+def mock_value_store(monkeypatch):
+    mock_value_store = Mock()
+    mock_value_store_factory = Mock(return_value=mock_value_store)
+    monkeypatch.setattr(bat, "get_bat_value_store", mock_value_store_factory)
+    monkeypatch.setattr(counter, "get_counter_value_store", mock_value_store_factory)
+    monkeypatch.setattr(FaultState, "store_error", Mock())
+    return mock_value_store
+
+
+def create_sample_device():
+    device = create_device(HTTP(configuration=HTTPConfiguration("http://sample_host")))
+    device.add_component(HttpCounterSetup(id=0, configuration=HttpCounterConfiguration(
+        power_path="/power", imported_path="/imported", exported_path="/exported",
+        current_l1_path="/l1", current_l2_path="/l2", current_l3_path="/l3")))
+    device.add_component(HttpBatSetup(id=1, configuration=HttpBatConfiguration(
+        power_path="/bat_power", imported_path="/imported", exported_path="/exported", soc_path="/soc")))
+    return device
+
+
+def test_device_fetches_each_url_once(mock_value_store: Mock, requests_mock: requests_mock.Mocker):
+    # setup
+    for path, value in [("/power", "-1234.5\n"), ("/imported", "100"), ("/exported", "200"), ("/l1", "1"),
+                        ("/l2", "2"), ("/l3", "3"), ("/bat_power", "500"), ("/soc", "42")]:
+        requests_mock.get("http://sample_host" + path, text=value)
+
+    # execution
+    create_sample_device().update()
+
+    # evaluation
+    assert requests_mock.call_count == 8
+    counter_state, bat_state = [call[0][0] for call in mock_value_store.set.call_args_list]
+    assert counter_state.power == -1234.5
+    assert counter_state.currents == [1, 2, 3]
+    assert (counter_state.imported, counter_state.exported) == (100, 200)
+    assert (bat_state.power, bat_state.soc, bat_state.imported) == (500, 42, 100)
+
+
+def test_device_failed_url_affects_only_its_component(mock_value_store: Mock, requests_mock: requests_mock.Mocker):
+    # setup
+    for path in ["/power", "/imported", "/exported", "/bat_power", "/soc"]:
+        requests_mock.get("http://sample_host" + path, text="1")
+    for path in ["/l1", "/l2", "/l3"]:
+        requests_mock.get("http://sample_host" + path, status_code=500)
+
+    # execution
+    create_sample_device().update()
+
+    # evaluation
+    assert len(mock_value_store.set.mock_calls) == 1
+    assert mock_value_store.set.call_args[0][0].soc == 1
+    assert FaultState.store_error.call_count == 2
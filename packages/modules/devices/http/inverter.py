@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from typing import Dict, Union
 
-from requests import Session
-
 from dataclass_utils import dataclass_from_dict
 from helpermodules import compatibility
 from modules.common.component_state import InverterState
@@ -10,7 +8,7 @@ from modules.common.component_type import ComponentDescriptor
 from modules.common.fault_state import ComponentInfo
 from modules.common.simcount import SimCounter
 from modules.common.store import get_inverter_value_store
-from modules.devices.http.api import create_request_function
+from modules.devices.http.api import Responses, create_request_function
 from modules.devices.http.config import HttpInverterSetup
 
 
@@ -23,13 +21,14 @@ class HttpInverter:
         self.component_info = ComponentInfo.from_component_config(self.component_config)
         self.__get_power = create_request_function(url, self.component_config.configuration.power_path)
         self.__get_exported = create_request_function(url, self.component_config.configuration.exported_path)
+        self.urls = self.__get_power.urls + self.__get_exported.urls
 
-    def update(self, session: Session) -> None:
-        power = self.__get_power(session)
+    def update(self, responses: Responses) -> None:
+        power = self.__get_power(responses)
         if compatibility.is_ramdisk_in_use():
             # for compatibility: in 1.x power URL values are positive!
             power *= -1
-        exported = self.__get_exported(session)
+        exported = self.__get_exported(responses)
         if exported is None:
             _, exported = self.sim_counter.sim_count(power)
 
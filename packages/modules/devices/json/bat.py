@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from typing import Dict, Union
 
-import jq
-
 from dataclass_utils import dataclass_from_dict
 from modules.common.component_state import BatState
 from modules.common.component_type import ComponentDescriptor
@@ -10,6 +8,7 @@ from modules.common.fault_state import ComponentInfo
 from modules.common.simcount import SimCounter
 from modules.common.store import get_bat_value_store
 from modules.devices.json.config import JsonBatSetup
+from modules.devices.json.jq_program import evaluate
 
 
 class JsonBat:
@@ -23,16 +22,12 @@ class JsonBat:
     def update(self, response) -> None:
         config = self.component_config.configuration
 
-        power = float(jq.compile(config.jq_power).input(response).first())
-        if config.jq_soc != "":
-            soc = float(jq.compile(config.jq_soc).input(response).first())
-        else:
+        power, soc, imported, exported = evaluate(
+            response, [config.jq_power, config.jq_soc, config.jq_imported, config.jq_exported])
+        if soc is None:
             soc = 0
 
-        if config.jq_imported is not None and config.jq_exported is not None:
-            imported = float(jq.compile(config.jq_imported).input(response).first())
-            exported = float(jq.compile(config.jq_exported).input(response).first())
-        else:
+        if imported is None or exported is None:
             imported, exported = self.sim_counter.sim_count(power)
 
         bat_state = BatState(
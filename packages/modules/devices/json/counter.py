@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from typing import Dict, Union
 
-import jq
-
 from dataclass_utils import dataclass_from_dict
 from modules.common.component_state import CounterState
 from modules.common.component_type import ComponentDescriptor
@@ -10,6 +8,7 @@ from modules.common.fault_state import ComponentInfo
 from modules.common.simcount._simcounter import SimCounter
 from modules.common.store import get_counter_value_store
 from modules.devices.json.config import JsonCounterSetup
+from modules.devices.json.jq_program import evaluate
 
 
 class JsonCounter:
@@ -23,13 +22,10 @@ class JsonCounter:
     def update(self, response):
         config = self.component_config.configuration
 
-        power = float(jq.compile(config.jq_power).input(response).first())
+        power, imported, exported = evaluate(response, [config.jq_power, config.jq_imported, config.jq_exported])
         # ToDo: add current or power per phase
-        if config.jq_exported is None or config.jq_exported is None:
+        if imported is None or exported is None:
             imported, exported = self.sim_counter.sim_count(power)
-        else:
-            imported = float(jq.compile(config.jq_imported).input(response).first())
-            exported = float(jq.compile(config.jq_exported).input(response).first())
 
         counter_state = CounterState(
             imported=imported,
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from typing import Dict, Union
 
-import jq
-
 from dataclass_utils import dataclass_from_dict
 from modules.common.component_state import InverterState
 from modules.common.component_type import ComponentDescriptor
@@ -10,6 +8,7 @@ from modules.common.fault_state import ComponentInfo
 from modules.common.simcount import SimCounter
 from modules.common.store import get_inverter_value_store
 from modules.devices.json.config import JsonInverterSetup
+from modules.devices.json.jq_program import evaluate
 
 
 class JsonInverter:
@@ -23,13 +22,11 @@ class JsonInverter:
     def update(self, response) -> None:
         config = self.component_config.configuration
 
-        power = float(jq.compile(config.jq_power).input(response).first())
+        power, exported = evaluate(response, [config.jq_power, config.jq_exported])
         if power >= 0:
             power = power * -1
-        if config.jq_exported is None:
+        if exported is None:
             _, exported = self.sim_counter.sim_count(power)
-        else:
-            exported = float(jq.compile(config.jq_exported).input(response).first())
 
         inverter_state = InverterState(
             power=power,
@@ -0,0 +1,45 @@
+import functools
+from typing import List, Optional, Sequence, Tuple
+
+import jq
+
+
+@functools.lru_cache(maxsize=128)
+def compile_program(expression: str):
+    """Compiled jq programs are cached per expression, so unchanged expressions are only compiled once."""
+    return jq.compile(expression)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_combined(expressions: Tuple[str, ...]):
+    # jeder Ausdruck wird in ein eigenes Array gesammelt, damit Ausdrücke ohne Ergebnis die übrigen nicht verschieben
+    try:
+        return compile_program("[" + ",".join("[" + expression + "]" for expression in expressions) + "]")
+    except ValueError:
+        # z.B. Kommentare (#) verschlucken die schließenden Klammern, dann jeden Ausdruck einzeln auswerten
+        return None
+
+
+def _evaluate_all(response, expressions: Tuple[str, ...]) -> List[List]:
+    combined = _compile_combined(expressions)
+    if combined is not None:
+        return combined.input(response).first()
+    return [compile_program(expression).input(response).all() for expression in expressions]
+
+
+def evaluate(response, expressions: Sequence[Optional[str]]) -> List[Optional[float]]:
+    """Evaluates all configured expressions in one combined jq program against the response. If the expressions
+    cannot be combined, each one is evaluated on its own. Returns the first result of each expression as float and
+    None for expressions that are not configured (None or empty)."""
+    configured = tuple(expression for expression in expressions if expression)
+    results = iter(_evaluate_all(response, configured) if configured else [])
+    values = []  # type: List[Optional[float]]
+    for expression in expressions:
+        if expression:
+            result = next(results)
+            if not result:
+                raise Exception("jq expression <%s> returned no value" % expression)
+            values.append(float(result[0]))
+        else:
+            values.append(None)
+    return values
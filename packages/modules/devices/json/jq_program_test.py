@@ -0,0 +1,43 @@
+import pytest
+
+from modules.devices.json.jq_program import compile_program, evaluate
+
+SAMPLE = {"power": {"total": -1234.5}, "counter": ["100", "200"], "empty": []}
+
+
+def test_evaluate():
+    # execution
+    actual = evaluate(SAMPLE, [".power.total", None, ".counter[]", "", ".counter[1]"])
+
+    # evaluation
+    assert actual == [-1234.5, None, 100, None, 200]
+
+
+def test_evaluate_compiles_once():
+    # setup
+    misses = compile_program.cache_info().misses
+
+    # execution
+    for _ in range(3):
+        evaluate(SAMPLE, [".power.total * 2", ".counter[0]"])
+
+    # evaluation
+    assert compile_program.cache_info().misses == misses + 1
+
+
+def test_evaluate_without_result_raises():
+    with pytest.raises(Exception, match="returned no value"):
+        evaluate(SAMPLE, [".power.total", ".empty[]"])
+
+
+def test_evaluate_falls_back_to_single_expressions():
+    # setup
+    misses = compile_program.cache_info().misses
+
+    # execution
+    for _ in range(2):
+        actual = evaluate(SAMPLE, [".power.total # Leistung", None, ".counter[1]"])
+
+    # evaluation
+    assert actual == [-1234.5, None, 200]
+    assert compile_program.cache_info().misses == misses + 3
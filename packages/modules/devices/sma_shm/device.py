@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
 import logging
-import socket
-import time
 from typing import List, Optional, Union
 
 from helpermodules.cli import run_using_positional_cli_args
@@ -12,7 +10,7 @@ from modules.devices.sma_shm import counter
 from modules.devices.sma_shm import inverter
 from modules.devices.sma_shm.config import SmaHomeManagerCounterSetup, SmaHomeManagerInverterSetup, Speedwire, \
     SmaHomeManagerCounterConfiguration, SmaHomeManagerInverterConfiguration
-from modules.devices.sma_shm.speedwire_listener import SpeedwireListener
+from modules.devices.sma_shm.speedwire_listener import speedwire_cache
 from modules.devices.sma_shm.utils import SpeedwireComponent
 
 log = logging.getLogger(__name__)
@@ -20,19 +18,13 @@ timeout_seconds = 5
 
 
 def update_components(components_todo: List[SpeedwireComponent]):
-    with SpeedwireListener(timeout_seconds) as speedwire:
-        stop_time = time.time() + timeout_seconds
-        try:
-            for sma_data in speedwire:
-                components_todo = [component for component in components_todo if not component.read_datagram(sma_data)]
-                if not components_todo:
-                    log.debug("All components updated")
-                    return
-                if time.time() > stop_time:
-                    break
-        except socket.timeout:
-            pass
-        raise FaultState.error("Kein passendes Datagramm innerhalb des %ds timeout empfangen." % timeout_seconds)
+    components_missing = []
+    for component in components_todo:
+        sma_data = speedwire_cache.get(component.serial)
+        if sma_data is None or not component.read_datagram(sma_data):
+            components_missing.append(component)
+    if components_missing:
+        raise FaultState.error("Kein passendes Datagramm innerhalb der letzten %ds empfangen." % timeout_seconds)
 
 
 def create_device(device_config: Speedwire):
@@ -1,17 +1,24 @@
+import logging
 import socket
 import struct
-from typing import Iterator, Optional
+import threading
+import time
+from typing import Callable, ContextManager, Dict, FrozenSet, Iterator, Optional, Tuple
 
 from modules.common.fault_state import FaultState
-from modules.devices.sma_shm.speedwiredecoder import decode_speedwire
+from modules.devices.sma_shm.speedwiredecoder import (CHANNELS_COUNTER, CHANNELS_INVERTER, SpeedwireRecord,
+                                                      decode_speedwire_record)
+
+log = logging.getLogger(__name__)
 
 
 class SpeedwireListener:
-    def __init__(self, timeout_seconds: float):
+    def __init__(self, timeout_seconds: float, channels: Optional[FrozenSet[int]] = None):
         self.__timeout_seconds = timeout_seconds
+        self.__channels = channels
         self.__socket = None  # type: Optional[socket.socket]
 
-    def __enter__(self) -> Iterator[dict]:
+    def __enter__(self) -> Iterator[SpeedwireRecord]:
         ip_bind = "0.0.0.0"
         multicast_group = "239.12.255.254"
         multicast_port = 9522
@@ -27,13 +34,81 @@ class SpeedwireListener:
             raise FaultState.error("could not connect to multicast group or bind to given interface")
         self.__socket = sock
 
-        def generator() -> Iterator[dict]:
+        def generator() -> Iterator[SpeedwireRecord]:
             while True:
                 datagram = sock.recv(608)
                 if len(datagram) >= 18 and datagram[16:18] == b'\x60\x69':
-                    yield decode_speedwire(datagram)
+                    record = decode_speedwire_record(datagram, self.__channels)
+                    if record is not None:
+                        yield record
 
         return generator()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.__socket.close()
+
+
+class SpeedwireCache:
+    """Receives all Speedwire datagrams in a background thread and keeps the latest one per serial number.
+
+    The thread is started with the first query and keeps the multicast membership for the lifetime of the process.
+    Queries only wait while the cache is still warming up, afterwards they are answered from the cache immediately.
+    """
+
+    def __init__(self,
+                 max_age_seconds: float = 5,
+                 listener_factory: Callable[[], ContextManager[Iterator[dict]]] = lambda: SpeedwireListener(
+                     60, CHANNELS_COUNTER | CHANNELS_INVERTER)):
+        self.__max_age_seconds = max_age_seconds
+        self.__listener_factory = listener_factory
+        self.__condition = threading.Condition()
+        self.__latest = {}  # type: Dict[int, Tuple[float, dict]]
+        self.__started = 0.0
+        self.__thread = None  # type: Optional[threading.Thread]
+
+    def get(self, serial: Optional[int]) -> Optional[dict]:
+        """Returns the latest datagram of the meter with the given serial (any meter if None) that is not older than
+        max_age_seconds or None if there is none."""
+        with self.__condition:
+            self.__start()
+            deadline = self.__started + self.__max_age_seconds
+            while True:
+                sma_data = self.__find(serial)
+                remaining = deadline - time.time()
+                if sma_data is not None or remaining <= 0:
+                    return sma_data
+                self.__condition.wait(remaining)
+
+    def __find(self, serial: Optional[int]) -> Optional[dict]:
+        if serial is None:
+            entries = list(self.__latest.values())
+        else:
+            entries = [self.__latest[serial]] if serial in self.__latest else []
+        oldest = time.time() - self.__max_age_seconds
+        entries = [entry for entry in entries if entry[0] >= oldest]
+        return max(entries, key=lambda entry: entry[0])[1] if entries else None
+
+    def __start(self) -> None:
+        if self.__thread is None:
+            self.__started = time.time()
+            self.__thread = threading.Thread(target=self.__receive, name="speedwire", daemon=True)
+            self.__thread.start()
+
+    def __receive(self) -> None:
+        while True:
+            try:
+                with self.__listener_factory() as speedwire:
+                    for sma_data in speedwire:
+                        if "serial" in sma_data:
+                            with self.__condition:
+                                self.__latest[sma_data["serial"]] = (time.time(), sma_data)
+                                self.__condition.notify_all()
+                return
+            except socket.timeout:
+                log.debug("No speedwire datagram received, reopening socket")
+            except Exception:
+                log.exception("Error receiving speedwire datagrams")
+                time.sleep(5)
+
+
+speedwire_cache = SpeedwireCache()
@@ -0,0 +1,34 @@
+import base64
+from contextlib import contextmanager
+
+from modules.devices.sma_shm import speedwiredecoder
+from modules.devices.sma_shm.counter_test import SAMPLE_SMA_ENERGY_EM
+from modules.devices.sma_shm.speedwire_listener import SpeedwireCache
+
+
+def create_cache(*datagrams: dict) -> SpeedwireCache:
+    @contextmanager
+    def listener():
+        yield iter(datagrams)
+
+    return SpeedwireCache(max_age_seconds=.5, listener_factory=listener)
+
+
+def test_get_returns_latest_datagram_by_serial():
+    # setup
+    sma_data = speedwiredecoder.decode_speedwire(base64.b64decode(SAMPLE_SMA_ENERGY_EM))
+    other = {"serial": 1, "pconsume": 1}
+    cache = create_cache(sma_data, other)
+
+    # execution & evaluation
+    assert cache.get(sma_data["serial"]) is sma_data
+    assert cache.get(1) is other
+    assert cache.get(None) is not None
+
+
+def test_get_returns_none_for_unknown_serial():
+    # setup
+    cache = create_cache({"serial": 1})
+
+    # execution & evaluation
+    assert cache.get(2) is None
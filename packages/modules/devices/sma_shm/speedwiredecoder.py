@@ -18,6 +18,11 @@
 """
 
 import binascii
+import logging
+import struct
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+log = logging.getLogger(__name__)
 
 # unit definitions with scaling
 sma_units = {
@@ -80,87 +85,145 @@ sma_channels = {
 }
 
 
-def decode_OBIS(obis):
-    measurement = int.from_bytes(obis[0:2], byteorder='big')
-    raw_type = int.from_bytes(obis[2:3], byteorder='big')
-    if raw_type == 4:
-        datatype = 'actual'
-    elif raw_type == 8:
-        datatype = 'counter'
-    elif raw_type == 0 and measurement == 36864:
-        datatype = 'version'
-    else:
-        datatype = 'unknown'
-        print('unknown datatype: measurement {} datatype {} raw_type {}'.format(measurement, datatype, raw_type))
-    return (measurement, datatype)
+_ACTUAL = 4
+_COUNTER = 8
+_VERSION = 36864
 
+_LENGTH = struct.Struct(">H")
+_SERIAL = struct.Struct(">I")
+_OBIS = struct.Struct(">HB")
+_VERSION_BYTES = struct.Struct(">BBBB")
 
-def decode_speedwire(datagram):
-    emparts = {}
-    # process data only of SMA header is present
-    if datagram[0:3] == b'SMA':
-        # datagram length
-        datalength = int.from_bytes(datagram[12:14], byteorder='big')+16
-        # print('data lenght: {}'.format(datalength))
-        # serial number
-        emID = int.from_bytes(datagram[20:24], byteorder='big')
-        # print('seral: {}'.format(emID))
-        emparts['serial'] = emID
-        # print('timestamp: {}'.format(timestamp))
-        # decode OBIS data blocks
-        # start with header
+# channels decoded by the consumers of this package: counter, inverter and the smarthome smaem driver
+CHANNELS_COUNTER = frozenset((1, 2, 14, 21, 22, 31, 32, 33, 41, 42, 51, 52, 53, 61, 62, 71, 72, 73))
+CHANNELS_INVERTER = frozenset((2,))
+
+# revision definitions
+_REVISIONS = {
+    # S – Spezial Version
+    "1": ".S",
+    # A – Alpha (noch kein Feature Complete, Version für Verifizierung und Validierung)
+    "2": ".A",
+    # B – Beta (Feature Complete, Version für Verifizierung und Validierung)
+    "3": ".B",
+    # R – Release Candidate / Release (Version für Verifizierung, Validierung und Feldtest / öffentliche Version)
+    "4": ".R",
+    # E – Experimental Version (dient zur lokalen Verifizierung)
+    "5": ".E",
+    # N – Keine Revision
+    "6": ".N",
+}
+
+
+def decode_version(value: bytes) -> str:
+    major, minor, build, revision = _VERSION_BYTES.unpack_from(value)
+    revision_hex = "%02x" % revision
+    version = "%d.%d.%d" % (major, minor, build)
+    if revision_hex.isdigit():
+        version += _REVISIONS.get(chr(int(revision_hex)), "")
+    # adding versionnumber to compare verions
+    return version + "|" + binascii.b2a_hex(value[0:3]).decode("utf-8")
+
+
+class _Layout:
+    """Position of the requested channels within datagrams of one meter.
+
+    The OBIS blocks are walked once per meter, serial number and datagram length. The values of the requested channels
+    are then read with a single precompiled struct, all other blocks are skipped as padding. The OBIS ids of all blocks
+    are read with a second precompiled struct, so a datagram with other blocks at the same length is detected.
+    """
+    __slots__ = ("struct", "names", "divisors", "index", "version_offset", "obis_struct", "obis")
+
+    def __init__(self, datagram: bytes, datalength: int, channels: Optional[FrozenSet[int]]):
+        fmt = [">"]
+        obis_fmt = [">"]
+        names = []
+        divisors = []
+        self.version_offset = None  # type: Optional[int]
+        end = 0
+        obis_end = 0
         position = 28
-        while position < datalength:
-            # decode header
-            # print('pos: {}'.format(position))
-            (measurement, datatype) = decode_OBIS(datagram[position:position+4])
-            # print('measurement {} datatype: {}'.format(measurement,datatype))
-            # decode values
-            # actual values
-            if datatype == 'actual':
-                value = int.from_bytes(datagram[position+4:position+8], byteorder='big')
-                position += 8
-                if measurement in sma_channels.keys():
-                    emparts[sma_channels[measurement][0]] = value/sma_units[sma_channels[measurement][1]]
-                    emparts[sma_channels[measurement][0]+'unit'] = sma_channels[measurement][1]
-            # counter values
-            elif datatype == 'counter':
-                value = int.from_bytes(datagram[position+4:position+12], byteorder='big')
-                position += 12
-                if measurement in sma_channels.keys():
-                    emparts[sma_channels[measurement][0]+'counter'] = value/sma_units[sma_channels[measurement][2]]
-                    emparts[sma_channels[measurement][0]+'counterunit'] = sma_channels[measurement][2]
-            elif datatype == 'version':
-                value = datagram[position+4:position+8]
-                if measurement in sma_channels.keys():
-                    bversion = (binascii.b2a_hex(value).decode("utf-8"))
-                    version = str(int(bversion[0:2], 16))+"."+str(int(bversion[2:4], 16)
-                                                                  )+"."+str(int(bversion[4:6], 16))
-                    revision = str(chr(int(bversion[6:8])))
-                    # revision definitions
-                    if revision == "1":
-                        # S – Spezial Version
-                        version = version+".S"
-                    elif revision == "2":
-                        # A – Alpha (noch kein Feature Complete, Version für Verifizierung und Validierung)
-                        version = version+".A"
-                    elif revision == "3":
-                        # B – Beta (Feature Complete, Version für Verifizierung und Validierung)
-                        version = version+".B"
-                    elif revision == "4":
-                        # R – Release Candidate / Release (Version für Verifizierung, Validierung und
-                        # Feldtest / öffentliche Version)
-                        version = version+".R"
-                    elif revision == "5":
-                        # E – Experimental Version (dient zur lokalen Verifizierung)
-                        version = version+".E"
-                    elif revision == "6":
-                        # N – Keine Revision
-                        version = version+".N"
-                    # adding versionnumber to compare verions
-                    version = version+"|"+str(bversion[0:2])+str(bversion[2:4])+str(bversion[4:6])
-                    emparts[sma_channels[measurement][0]] = version
-                position += 8
-            else:
-                position += 8
-    return emparts
+        while position + 4 <= datalength:
+            measurement, raw_type = _OBIS.unpack_from(datagram, position)
+            obis_fmt.append("%dxI" % (position - obis_end))
+            obis_end = position + 4
+            size = 8 if raw_type == _COUNTER else 4
+            channel = sma_channels.get(measurement)
+            if channel is not None and (channels is None or measurement in channels):
+                if raw_type == _ACTUAL or (raw_type == _COUNTER and len(channel) > 2):
+                    fmt.append("%dx%s" % (position + 4 - end, "I" if raw_type == _ACTUAL else "Q"))
+                    names.append(channel[0] if raw_type == _ACTUAL else channel[0] + "counter")
+                    divisors.append(sma_units[channel[1] if raw_type == _ACTUAL else channel[2]])
+                    end = position + 4 + size
+                elif raw_type == 0 and measurement == _VERSION:
+                    self.version_offset = position + 4
+            elif raw_type not in (_ACTUAL, _COUNTER, 0):
+                log.debug("unknown datatype: measurement %d raw_type %d", measurement, raw_type)
+            position += 4 + size
+        if self.version_offset is not None:
+            names.append(sma_channels[_VERSION][0])
+        self.struct = struct.Struct("".join(fmt))
+        self.names = tuple(names)
+        self.divisors = tuple(divisors)
+        self.index = {name: i for i, name in enumerate(names)}
+        self.obis_struct = struct.Struct("".join(obis_fmt))
+        self.obis = self.obis_struct.unpack_from(datagram)
+
+    def matches(self, datagram: bytes) -> bool:
+        return self.obis_struct.unpack_from(datagram) == self.obis
+
+    def decode(self, datagram: bytes) -> List:
+        values = [value / divisor for value, divisor in zip(self.struct.unpack_from(datagram), self.divisors)]
+        if self.version_offset is not None:
+            values.append(decode_version(datagram[self.version_offset:self.version_offset + 4]))
+        return values
+
+
+_layouts = {}  # type: Dict[Tuple[int, int, Optional[FrozenSet[int]]], _Layout]
+
+
+class SpeedwireRecord:
+    """Compact decoded datagram, values are stored as tuple and share the channel names with all datagrams of the
+    same meter. Supports read access like the dict returned by decode_speedwire."""
+    __slots__ = ("serial", "_index", "_values")
+
+    def __init__(self, serial: int, index: Dict[str, int], values: Sequence):
+        self.serial = serial
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, name: str):
+        if name == "serial":
+            return self.serial
+        return self._values[self._index[name]]
+
+    def __contains__(self, name: str) -> bool:
+        return name == "serial" or name in self._index
+
+    def get(self, name: str, default=None):
+        return self[name] if name in self else default
+
+    def to_dict(self) -> dict:
+        emparts = dict(zip(self._index, self._values))
+        emparts["serial"] = self.serial
+        return emparts
+
+
+def decode_speedwire_record(datagram: bytes,
+                            channels: Optional[FrozenSet[int]] = None) -> Optional[SpeedwireRecord]:
+    """Decodes the requested channels (all known channels if None) of a datagram, None if there is no SMA header."""
+    # process data only of SMA header is present
+    if datagram[0:3] != b'SMA' or len(datagram) < 28:
+        return None
+    datalength = min(_LENGTH.unpack_from(datagram, 12)[0] + 16, len(datagram))
+    serial = _SERIAL.unpack_from(datagram, 20)[0]
+    key = (serial, datalength, channels)
+    layout = _layouts.get(key)
+    if layout is None or not layout.matches(datagram):
+        layout = _layouts[key] = _Layout(datagram, datalength, channels)
+    return SpeedwireRecord(serial, layout.index, layout.decode(datagram))
+
+
+def decode_speedwire(datagram: bytes, channels: Optional[FrozenSet[int]] = None) -> dict:
+    record = decode_speedwire_record(datagram, channels)
+    return {} if record is None else record.to_dict()
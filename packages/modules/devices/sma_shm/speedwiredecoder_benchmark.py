@@ -0,0 +1,29 @@
+"""Benchmark of the Speedwire decoder on the captured Energy Meter datagram.
+
+PYTHONPATH=packages python3 -m modules.devices.sma_shm.speedwiredecoder_benchmark
+"""
+import base64
+import timeit
+
+from modules.devices.sma_shm import speedwiredecoder
+from modules.devices.sma_shm.counter_test import SAMPLE_SMA_ENERGY_EM
+
+
+def main(number: int = 100000) -> None:
+    datagram = base64.b64decode(SAMPLE_SMA_ENERGY_EM)
+    cases = [
+        ("decode_speedwire, all channels", lambda: speedwiredecoder.decode_speedwire(datagram)),
+        ("decode_speedwire, counter channels",
+         lambda: speedwiredecoder.decode_speedwire(datagram, speedwiredecoder.CHANNELS_COUNTER)),
+        ("decode_speedwire_record, counter channels",
+         lambda: speedwiredecoder.decode_speedwire_record(datagram, speedwiredecoder.CHANNELS_COUNTER)),
+        ("decode_speedwire_record, inverter channels",
+         lambda: speedwiredecoder.decode_speedwire_record(datagram, speedwiredecoder.CHANNELS_INVERTER)),
+    ]
+    for name, case in cases:
+        seconds = timeit.timeit(case, number=number)
+        print("%-45s %8.2f µs/datagram" % (name, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
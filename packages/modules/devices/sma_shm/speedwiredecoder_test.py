@@ -0,0 +1,74 @@
+import base64
+
+from modules.devices.sma_shm import counter, speedwiredecoder
+from modules.devices.sma_shm.counter_test import SAMPLE_SMA_ENERGY_EM, mock_ramdisk  # noqa: F401
+
+DATAGRAM = base64.b64decode(SAMPLE_SMA_ENERGY_EM)
+
+
+def test_decode_speedwire_all_channels():
+    # execution
+    sma_data = speedwiredecoder.decode_speedwire(DATAGRAM)
+
+    # evaluation
+    assert sma_data["serial"] == 1901427928
+    assert sma_data["psupply"] == 11967.0
+    assert sma_data["psupplycounter"] == 86688.627
+    assert sma_data["pconsumecounter"] == 7500.24
+    assert sma_data["u1"] == 238.438
+    assert sma_data["speedwire-version"] == "2.0.18.R|020012"
+    assert not any(key.endswith("unit") for key in sma_data)
+
+
+def test_decode_speedwire_requested_channels_only():
+    # execution
+    sma_data = speedwiredecoder.decode_speedwire(DATAGRAM, speedwiredecoder.CHANNELS_INVERTER)
+
+    # evaluation
+    assert sma_data == {"serial": 1901427928, "psupply": 11967.0, "psupplycounter": 86688.627}
+
+
+def test_decode_speedwire_without_sma_header():
+    assert speedwiredecoder.decode_speedwire(b"XYZ" + DATAGRAM[3:]) == {}
+    assert speedwiredecoder.decode_speedwire_record(b"XYZ" + DATAGRAM[3:]) is None
+
+
+def test_record_matches_dict():
+    # execution
+    record = speedwiredecoder.decode_speedwire_record(DATAGRAM, speedwiredecoder.CHANNELS_COUNTER)
+
+    # evaluation
+    expected = speedwiredecoder.decode_speedwire(DATAGRAM, speedwiredecoder.CHANNELS_COUNTER)
+    assert record.to_dict() == expected
+    assert record["serial"] == expected["serial"]
+    assert "pconsume" in record
+    assert "sconsume" not in record
+    assert record.get("sconsume") is None
+
+
+def test_record_read_by_counter(mock_ramdisk):  # noqa: F811
+    # setup
+    record = speedwiredecoder.decode_speedwire_record(DATAGRAM, speedwiredecoder.CHANNELS_COUNTER)
+    sma_counter = counter.create_component(counter.component_descriptor.configuration_factory())
+
+    # execution
+    sma_counter.read_datagram(record)
+
+    # evaluation
+    assert mock_ramdisk.files["wattbezug"] == "-11967"
+    assert mock_ramdisk.files["einspeisungkwh"] == "86688627.0"
+
+
+def test_decode_speedwire_rebuilds_layout_for_other_blocks():
+    # setup
+    speedwiredecoder.decode_speedwire(DATAGRAM)
+    # same length and serial number, but channel 1 (pconsume) replaced by an unknown channel
+    datagram = DATAGRAM[:28] + b"\x00\x63" + DATAGRAM[30:]
+
+    # execution
+    sma_data = speedwiredecoder.decode_speedwire(datagram)
+
+    # evaluation
+    assert "pconsume" not in sma_data
+    assert sma_data["psupply"] == 11967.0
+    assert speedwiredecoder.decode_speedwire(DATAGRAM)["pconsume"] == 0
@@ -26,6 +26,8 @@ class SpeedwireComponent(Generic[T]):
         self.store = value_store_factory(component_config.id)
         self.__parser = parser
         self.__serial_matcher = _create_serial_matcher(component_config.configuration.serials)
+        serials = component_config.configuration.serials
+        self.serial = serials if isinstance(serials, int) else None
         self.component_info = ComponentInfo.from_component_config(component_config)
         self.component_config = component_config
 
@@ -24,6 +24,18 @@ COOKIE_FILE = RAMDISK_PATH / "powerwall_cookie.txt"
 tesla_component_classes = Union[bat.TeslaBat, counter.TeslaCounter, inverter.TeslaInverter]
 
 
+class PowerwallSession:
+    """HTTP session and authentication cookies of one Powerwall gateway, kept in memory across updates. The cookie
+    file is only read if no cookies are known yet, e.g. after a restart."""
+
+    def __init__(self) -> None:
+        self.session = get_http_session()
+        self.cookies = None  # type: Optional[Dict[str, str]]
+
+
+_sessions = {}  # type: Dict[str, PowerwallSession]
+
+
 class Device(AbstractDevice):
     COMPONENT_TYPE_TO_CLASS = {
         "bat": bat.TeslaBat,
@@ -59,38 +71,42 @@ class Device(AbstractDevice):
 
     def update(self) -> None:
         log.debug("Beginning update")
-        cookies = None
         address = self.device_config.configuration.ip_address
         email = self.device_config.configuration.email
         password = self.device_config.configuration.password
         with MultiComponentUpdateContext(self.components):
-            try:
-                cookies = json.loads(COOKIE_FILE.read_text())
-            except FileNotFoundError:
-                log.debug("Cookie-File <%s> does not exist. It will be created.", COOKIE_FILE)
-            except JSONDecodeError:
-                log.warning("Could not parse Cookie-File "+str(COOKIE_FILE)+". It will be re-created.", exc_info=True)
+            powerwall = _sessions.get(address)
+            if powerwall is None:
+                powerwall = _sessions[address] = PowerwallSession()
+            if powerwall.cookies is None:
+                try:
+                    powerwall.cookies = json.loads(COOKIE_FILE.read_text())
+                except FileNotFoundError:
+                    log.debug("Cookie-File <%s> does not exist. It will be created.", COOKIE_FILE)
+                except JSONDecodeError:
+                    log.warning(
+                        "Could not parse Cookie-File "+str(COOKIE_FILE)+". It will be re-created.", exc_info=True)
+            cookies = powerwall.cookies
 
-            session = get_http_session()
             if cookies is None:
-                self.__authenticate_and_update(session, address, email, password, self.__update_components)
+                self.__authenticate_and_update(powerwall, address, email, password, self.__update_components)
                 return
             try:
-                self.__update_components(PowerwallHttpClient(address, session, cookies))
+                self.__update_components(PowerwallHttpClient(address, powerwall.session, cookies))
                 return
             except HTTPError as e:
                 if e.response.status_code != 401 and e.response.status_code != 403:
                     raise e
                 log.warning(
                     "Login to powerwall with existing cookie failed. Will retry with new cookie...")
-            self.__authenticate_and_update(session, address, email, password, self.__update_components)
+            self.__authenticate_and_update(powerwall, address, email, password, self.__update_components)
             log.debug("Update completed successfully")
 
     def __update_components(self, client: PowerwallHttpClient):
         if self.components:
+            # die Aggregate werden einmal je Update gelesen und an alle Komponenten übergeben
+            aggregate = client.get_json("/api/meters/aggregates")
             for component in self.components:
-                # read aggregate
-                aggregate = client.get_json("/api/meters/aggregates")
                 self.components[component].update(client, aggregate)
         else:
             log.warning(
@@ -112,14 +128,16 @@ class Device(AbstractDevice):
         return {"AuthCookie": response.cookies["AuthCookie"], "UserRecord": response.cookies["UserRecord"]}
 
     def __authenticate_and_update(self,
-                                  session: requests.Session,
+                                  powerwall: PowerwallSession,
                                   address: str,
                                   email: str,
                                   password: str,
                                   update_function: UpdateFunction):
-        cookie = self.__authenticate(session, address, email, password)
+        powerwall.cookies = None
+        cookie = self.__authenticate(powerwall.session, address, email, password)
+        powerwall.cookies = cookie
         COOKIE_FILE.write_text(json.dumps(cookie))
-        update_function(PowerwallHttpClient(address, session, cookie))
+        update_function(PowerwallHttpClient(address, powerwall.session, cookie))
 
 
 COMPONENT_TYPE_TO_MODULE = {
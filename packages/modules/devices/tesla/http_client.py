@@ -2,11 +2,18 @@ import requests
 
 
 class PowerwallHttpClient:
+    """Client for one update. Responses are cached per URL, so endpoints needed by several components are only
+    requested once per update."""
+
     def __init__(self, host: str, session: requests.Session, cookies):
         self.__base_url = "https://" + host
         self.__cookies = cookies
         self.__session = session
+        self.__responses = {}
 
     def get_json(self, relative_url: str):
-        url = self.__base_url + relative_url
-        return self.__session.get(url, cookies=self.__cookies, verify=False, timeout=5).json()
+        if relative_url not in self.__responses:
+            url = self.__base_url + relative_url
+            self.__responses[relative_url] = \
+                self.__session.get(url, cookies=self.__cookies, verify=False, timeout=5).json()
+        return self.__responses[relative_url]
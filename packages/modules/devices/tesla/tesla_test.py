@@ -5,7 +5,7 @@ import pytest
 import requests
 import requests_mock
 
-from modules.devices.tesla import bat
+from modules.devices.tesla import bat, device, inverter
 from modules.devices.tesla.device import Device, Tesla
 from modules.common.component_state import BatState
 from modules.devices.tesla.config import TeslaConfiguration
@@ -139,6 +139,11 @@ def mock_ramdisk(monkeypatch):
     return MockRamdisk(monkeypatch)
 
 
+@pytest.fixture(autouse=True)
+def reset_sessions(monkeypatch):
+    monkeypatch.setattr(device, "_sessions", {})
+
+
 API_URL = "https://sample-address/api"
 COOKIE_FILE_NAME = "powerwall_cookie.txt"
 
@@ -195,3 +200,28 @@ def test_powerwall_update_retrieves_new_cookie_if_cookie_rejected(monkeypatch,
     # evaluation
     assert json.loads(mock_ramdisk[COOKIE_FILE_NAME]) == {"AuthCookie": "auth-cookie", "UserRecord": "user-record"}
     assert_battery_state_correct(mock_bat_value_store.set.call_args[0][0])
+
+
+def test_powerwall_update_shares_aggregates_and_keeps_cookie(monkeypatch,
+                                                             requests_mock: requests_mock.Mocker,
+                                                             mock_ramdisk: MockRamdisk):
+    # setup
+    mock_value_store = Mock()
+    monkeypatch.setattr(bat, "get_bat_value_store", Mock(return_value=mock_value_store))
+    monkeypatch.setattr(inverter, "get_inverter_value_store", Mock(return_value=mock_value_store))
+    requests_mock.post(API_URL + "/login/Basic", cookies={"AuthCookie": "auth-cookie", "UserRecord": "user-record"})
+    requests_mock.get(API_URL + "/meters/aggregates", text=sample_aggregates_json, additional_matcher=match_cookie_ok)
+    requests_mock.get(API_URL + "/system_status/soe", text=sample_soe_json, additional_matcher=match_cookie_ok)
+    dev = setup_battery_component()
+    dev.add_component(inverter.component_descriptor.configuration_factory(id=1))
+
+    # execution
+    dev.update()
+    mock_ramdisk[COOKIE_FILE_NAME] = """{"AuthCookie": "reject-me", "UserRecord": "user-record"}"""
+    dev.update()
+
+    # evaluation
+    assert [request.path for request in requests_mock.request_history] == [
+        "/api/login/basic", "/api/meters/aggregates", "/api/system_status/soe",
+        "/api/meters/aggregates", "/api/system_status/soe"]
+    assert mock_value_store.set.call_args[0][0].power == -3906.1700439453125
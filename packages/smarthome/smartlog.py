@@ -1,13 +1,17 @@
 import logging
 
 
-def initlog(name: str, devicenumber: int) -> None:
-    log = logging.getLogger(name)
-    formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
-    log.setLevel(logging.DEBUG)
-    fname = '/var/www/html/openWB/ramdisk/smarthome_device_'
-    fname += str(devicenumber) + '_' + str(name) + '.log'
-    fh = logging.FileHandler(fname, encoding='utf8')
-    fh.setLevel(logging.DEBUG)
-    fh.setFormatter(formatter)
-    log.addHandler(fh)
+def initlog(name: str, devicenumber: int) -> logging.Logger:
+    # one logger per device, the drivers are called repeatedly within the smarthome process
+    log = logging.getLogger(name).getChild(str(devicenumber))
+    if not log.handlers:
+        formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
+        log.setLevel(logging.DEBUG)
+        log.propagate = False
+        fname = '/var/www/html/openWB/ramdisk/smarthome_device_'
+        fname += str(devicenumber) + '_' + str(name) + '.log'
+        fh = logging.FileHandler(fname, encoding='utf8')
+        fh.setLevel(logging.DEBUG)
+        fh.setFormatter(formatter)
+        log.addHandler(fh)
+    return log
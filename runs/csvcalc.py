@@ -2,7 +2,11 @@
 import os
 import time
 import csv
+import sys
+import json
 import argparse
+import multiprocessing
+import zlib
 
 
 def outfiledefyear(jjjjinput):
@@ -408,7 +412,90 @@ def reyeardet(calcyear):
     return
 
 
-def remonth(jjjjmm):
+def checkpointdef(file_stringo):
+    # Zwischenstand der Monatsberechnung neben dem Monatslog, nur fuer den aktuellen Monat (ramdisk)
+    return file_stringo[:-len('.csv')] + '.chk'
+
+
+def dayhead(jjjjmm, day, offset):
+    # Pruefsumme des bereits gelesenen Teils vom Tageslog, erkennt auch ueberschriebene Dateien gleicher Groesse
+    dds = '0' + str(day)
+    file_stringi = inputp + str(jjjjmm) + dds[-2:] + '.csv'
+    if not os.path.isfile(file_stringi) or os.path.getsize(file_stringi) < offset:
+        return None
+    f = open(file_stringi, 'rb')
+    crc = zlib.crc32(f.read(offset))
+    f.close()
+    return crc
+
+
+def dailysizes(jjjjmm, lastday):
+    # Groessen der Tageslogs bis einschliesslich lastday, aendert sich eine Datei wird neu gerechnet
+    sizes = {}
+    for dd in range(1, lastday + 1):
+        dds = '0' + str(dd)
+        file_stringi = inputp + str(jjjjmm) + dds[-2:] + '.csv'
+        if os.path.isfile(file_stringi):
+            sizes[dds[-2:]] = os.path.getsize(file_stringi)
+    return sizes
+
+
+def dailystamps(jjjjmm, lastday):
+    # Groesse und Aenderungszeit der abgeschlossenen Tageslogs, erkennt auch neu geschriebene Dateien gleicher Groesse
+    stamps = {}
+    for dd in range(1, lastday + 1):
+        dds = '0' + str(dd)
+        file_stringi = inputp + str(jjjjmm) + dds[-2:] + '.csv'
+        if os.path.isfile(file_stringi):
+            stat = os.stat(file_stringi)
+            stamps[dds[-2:]] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def writecheckpoint(jjjjmm, file_stringo, state):
+    state['jjjjmm'] = str(jjjjmm)
+    state['inputp'] = inputp
+    state['columns'] = SUMCOLUMNSTART
+    state['outsize'] = os.path.getsize(file_stringo)
+    state['countercsv'] = countercsv
+    state['sumcsv'] = sumcsv
+    state['sumcsvt'] = sumcsvt
+    state['stamps'] = dailystamps(jjjjmm, state['day'] - 1)
+    state['crc'] = dayhead(jjjjmm, state['day'], state['offset'])
+    file_stringc = checkpointdef(file_stringo)
+    try:
+        f1 = open(file_stringc + '.tmp', 'w')
+        json.dump(state, f1)
+        f1.close()
+        os.replace(file_stringc + '.tmp', file_stringc)
+    except Exception as e:
+        print('%s checkpoint %s nicht geschrieben %s' % (getTime(), file_stringc, str(e)))
+
+
+def readcheckpoint(jjjjmm, file_stringo):
+    # Zwischenstand nur verwenden, wenn Monat, Eingabe, Spalten, Monatslog und bisherige Tageslogs passen
+    file_stringc = checkpointdef(file_stringo)
+    try:
+        if not os.path.isfile(file_stringc) or not os.path.isfile(file_stringo):
+            return None
+        f = open(file_stringc, 'r')
+        state = json.load(f)
+        f.close()
+        if (state['jjjjmm'] != str(jjjjmm) or state['inputp'] != inputp or state['columns'] != SUMCOLUMNSTART):
+            return None
+        if os.path.getsize(file_stringo) < state['outsize']:
+            return None
+        if state['stamps'] != dailystamps(jjjjmm, state['day'] - 1):
+            return None
+        if state['offset'] > 0 and dayhead(jjjjmm, state['day'], state['offset']) != state['crc']:
+            return None
+    except Exception as e:
+        print('%s checkpoint %s ungueltig %s' % (getTime(), file_stringc, str(e)))
+        return None
+    return state
+
+
+def remonth(jjjjmm, resume=False):
     firstfile = 1
     nextmonat = str(jjjjmm)[-2:]
     nextmonat = int(nextmonat) + 1
@@ -422,11 +509,43 @@ def remonth(jjjjmm):
     lastdate = ''
     lastzeit = ''
     rowold = 0
-    for dd in range(1, 32):
+    (file_stringo, file_stringos) = outfiledef(jjjjmm)
+    # beim letzten Lauf verarbeitete Zeilen nicht neu lesen, nur neue Zeilen ab dem gespeicherten Offset
+    startday = 1
+    startoffset = 0
+    startzeile = 0
+    state = None
+    if resume:
+        state = readcheckpoint(jjjjmm, file_stringo)
+    elif os.path.isfile(checkpointdef(file_stringo)):
+        # Monat wird komplett neu gerechnet, alter Zwischenstand passt nicht mehr zum Monatslog
+        os.remove(checkpointdef(file_stringo))
+    if state is not None:
+        firstfile = 0
+        lastdate = state['lastdate']
+        lastzeit = state['lastzeit']
+        rowold = state['rowold']
+        row = state['row']
+        monhtrow = state['monhtrow']
+        countercsv[:] = state['countercsv']
+        sumcsv[:] = state['sumcsv']
+        sumcsvt[:] = state['sumcsvt']
+        startday = state['day']
+        startoffset = state['offset']
+        startzeile = state['zeile']
+        # den zuletzt angehaengten, unvollstaendigen Tag wieder entfernen
+        f1 = open(file_stringo, 'r+')
+        f1.truncate(state['outsize'])
+        f1.close()
+        print('%s output %s fortgesetzt ab Tag %d Offset %d' % (getTime(), file_stringo, startday, startoffset))
+    lastday = startday
+    lastoffset = startoffset
+    lastzeile = startzeile
+    heute = time.strftime("%Y%m%d")
+    for dd in range(startday, 32):
         dds = '0' + str(dd)
         datestring = str(jjjjmm) + dds[-2:]
         file_stringi = inputp + datestring + '.csv'
-        (file_stringo, file_stringos) = outfiledef(jjjjmm)
         if os.path.isfile(file_stringi):
             ifile = 1
         else:
@@ -437,9 +556,20 @@ def remonth(jjjjmm):
                 if firstfile == 1:
                     print('%s output %s' % (getTime(), file_stringo))
                 print('%s input  %s' % (getTime(), file_stringi))
-                csv_o = csv.reader(f)
-                zeile = 0
-                for inrow in csv_o:
+                if (dd == startday):
+                    f.seek(startoffset)
+                    zeile = startzeile
+                else:
+                    zeile = 0
+                lastday = dd
+                lastoffset = f.tell()
+                lastzeile = zeile
+                while True:
+                    line = f.readline()
+                    # heute wird noch geschrieben, unvollstaendige letzte Zeile beim naechsten Lauf lesen
+                    if (line == '') or (not line.endswith('\n') and datestring == heute):
+                        break
+                    inrow = next(csv.reader([line]))
                     (row, totalc) = trdaymonth(inrow)
                     if (totalc != int(0)):
                         if (zeile == 0):
@@ -460,12 +590,19 @@ def remonth(jjjjmm):
                         zeile = zeile + 1
                     else:
                         print('%s skip %s:%s first 5 data columns zero' % (getTime(), datestring, row[0]))
+                    lastoffset = f.tell()
+                    lastzeile = zeile
                 f.close()
             except Exception as e:
                 print('%s error %s inhalt %s' % (getTime(), datestring, str(e)))
     # nichts gelesen ?
     if (firstfile == 1):
         return
+    # Zwischenstand vor dem Abschluss sichern, fillcount und fillcounts setzen die Summen zurueck
+    if resume:
+        writecheckpoint(jjjjmm, file_stringo, {
+            'day': lastday, 'offset': lastoffset, 'zeile': lastzeile, 'lastdate': lastdate, 'lastzeit': lastzeit,
+            'rowold': rowold, 'row': row, 'monhtrow': monhtrow})
     if (str(jjjjmm) == str(aktjjjjmm)):
         # heutiger Monat nachgerechnet, abschliessen
         fillcount(row, datestring, file_stringo, firstfile)
@@ -613,19 +750,123 @@ def checkmonth(jjjjmm):
     return 1
 
 
+def statusdef():
+    # Stand von Modus A, je Monat die Groessen der Tageslogs beim letzten Abschluss
+    return outputp + 'csvcalcA.json'
+
+
+def readstatus():
+    try:
+        f = open(statusdef(), 'r')
+        status = json.load(f)
+        f.close()
+        if (status['inputp'] == inputp and status['columns'] == SUMCOLUMNSTART):
+            return status
+    except Exception:
+        pass
+    return {'inputp': inputp, 'columns': SUMCOLUMNSTART, 'months': {}}
+
+
+def writestatus(status):
+    try:
+        f = open(statusdef() + '.tmp', 'w')
+        json.dump(status, f)
+        f.close()
+        os.replace(statusdef() + '.tmp', statusdef())
+    except Exception as e:
+        print('%s status %s nicht geschrieben %s' % (getTime(), statusdef(), str(e)))
+
+
+def monthfingerprint(jjjjmm):
+    # Tageslogs des Monats und erster Tag des Folgemonats (schliesst den letzten Tag ab)
+    nextmonat = int(str(jjjjmm)[-2:]) + 1
+    nextyear = int(str(jjjjmm)[0:4])
+    if (nextmonat > 12):
+        nextyear = nextyear + 1
+        nextmonat = 1
+    nextmonats = '0' + str(nextmonat)
+    nextfile = inputp + str(nextyear) + nextmonats[-2:] + '01.csv'
+    return {'sizes': dailysizes(jjjjmm, 31), 'next': os.path.isfile(nextfile)}
+
+
+def initworker():
+    # zeilenweise ausgeben, damit sich die Logzeilen der Worker nicht vermischen
+    sys.stdout = os.fdopen(sys.stdout.fileno(), 'w', 1, closefd=False)
+
+
+def calcmonth(jjjjmm):
+    # laeuft im Worker-Prozess, die globalen Listen sind je Prozess eigene Kopien
+    started = time.time()
+    computed = 0
+    if (checkmonth(jjjjmm) == 0):
+        remonth(jjjjmm)
+        computed = 1
+    return (jjjjmm, computed, time.time() - started)
+
+
 def reyear():
+    status = readstatus()
+    months = {}
     for ji in range(startjjjj, aktjjjj+1):
+        months[ji] = []
         for mi in range(1, 13):
             mis = '0' + str(mi)
             jis = str(ji) + mis[-2:]
             # nur bis heute rechnen
             if (int(jis) <= int(aktjjjjmm)):
-                checkflag = checkmonth(jis)
-                if (checkflag == 0):
-                    remonth(jis)
-        checkflag = checkyear(ji)
-        if (checkflag == 0):
-            reyeardet(ji)
+                # beim letzten Lauf abgeschlossene Monate mit unveraenderten Tageslogs nicht erneut pruefen
+                (file_stringo, file_stringos) = outfiledef(jis)
+                fingerprint = status['months'].get(jis)
+                if (jis != aktjjjjmm and fingerprint == monthfingerprint(jis) and
+                        (os.path.isfile(file_stringos) or not fingerprint['sizes'])):
+                    continue
+                months[ji].append(jis)
+    pending = [jis for ji in sorted(months) for jis in months[ji]]
+    print('%s mode A %d Monate zu pruefen mit %d Prozessen' % (getTime(), len(pending), jobs))
+    finished = []
+    recomputed = []
+
+    def finishyears():
+        # Jahre erst nach allen ihren Monaten und in aufsteigender Reihenfolge abschliessen
+        for ji in sorted(months):
+            if ji in finished:
+                continue
+            if months[ji]:
+                break
+            # checkyear vergleicht nur mit dem letzten Monat, daher auch bei neu gerechneten frueheren Monaten
+            if (ji in recomputed) or (checkyear(ji) == 0):
+                reyeardet(ji)
+            finished.append(ji)
+
+    def monthdone(result, done, started):
+        (jis, computed, duration) = result
+        months[int(jis[0:4])].remove(jis)
+        if computed:
+            recomputed.append(int(jis[0:4]))
+        if (jis != aktjjjjmm):
+            status['months'][jis] = monthfingerprint(jis)
+            writestatus(status)
+        elapsed = time.time() - started
+        print('%s mode A Monat %s %s in %.1f s, %d/%d fertig, %.2f Monate/min' % (
+            getTime(), jis, 'neu berechnet' if computed else 'aktuell', duration, done, len(pending),
+            done * 60 / max(elapsed, 0.001)))
+        finishyears()
+
+    finishyears()
+    started = time.time()
+    if (jobs > 1 and len(pending) > 1):
+        # vor dem fork leeren, sonst schreiben die Worker gepufferte Ausgaben doppelt
+        sys.stdout.flush()
+        pool = multiprocessing.get_context('fork').Pool(min(jobs, len(pending)), initworker)
+        try:
+            for done, result in enumerate(pool.imap_unordered(calcmonth, pending), 1):
+                monthdone(result, done, started)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for done, jis in enumerate(pending, 1):
+            monthdone(calcmonth(jis), done, started)
     return
 
 
@@ -639,6 +880,8 @@ if __name__ == "__main__":
                         help='mode for calculation, M = month, A = all starting 2018/01')
     parser.add_argument('-d', '--date', type=int, required=False, default=time.strftime("%Y%m"),
                         help='in mode M: month to calculate in format YYYYMM, defaults to current month')
+    parser.add_argument('-j', '--jobs', type=int, required=False, default=1,
+                        help='in mode A: number of months calculated in parallel, defaults to 1')
     args = parser.parse_args()
 
     '''
@@ -653,10 +896,16 @@ if __name__ == "__main__":
         wenn neue Tageslogs kommen oder bestehende mit neuen 5 Minuten Einträgen erweitert werden
         (deshalb Ramdisk)
     mode = Verarbeitungsmodus
-        M -> Rechnen und schreiben von einem Monat
+        M -> Rechnen und schreiben von einem Monat und Aktualisieren des Jahres,
+        fuer den aktuellen Monat wird der Zwischenstand in outputa/logaktmonthonl.chk gespeichert,
+        beim naechsten Lauf werden nur neue Zeilen gelesen, vergangene Monate werden immer komplett gerechnet
         A -> Ueberpruefen jeden Monat ab Startjjjj (2018) bis heute,
         Neuberechnung gesamter Monat wenn ein gueltiges Tageslog für einen Monat vorhanden ist
-        und Summenlog fehlt oder Anzahl Spalten (SUMCOLUMNSTART ) anders oder neuere Daten in Tageslog vorhanden
+        und Summenlog fehlt oder Anzahl Spalten (SUMCOLUMNSTART ) anders oder neuere Daten in Tageslog vorhanden,
+        die Monate werden parallel in jobs Prozessen gerechnet, die Jahre erst wenn alle ihre Monate fertig sind.
+        Abgeschlossene Monate stehen in <outputp>csvcalcA.json, ein abgebrochener Lauf macht dort weiter
+    jobs -> nur bei A relevant, Anzahl paralleler Prozesse, Standard 1 (der Cronjob laeuft neben der Regelung),
+        mehr Prozesse z.B. fuer eine einmalige Neuberechnung aller Monate von Hand
     JJMM -> nur bei M relevant, Monat zum nachrechnen
     '''
 
@@ -687,6 +936,7 @@ if __name__ == "__main__":
     outputp = args.output
     outputa = args.partial
     mode = args.mode
+    jobs = max(1, args.jobs)
     jjjjmm = args.date
     jjjj = int(int(jjjjmm) / 100)
     countercsv = []
@@ -700,7 +950,10 @@ if __name__ == "__main__":
     prep()
     print('%s csvcalc.py processing mode %s date jjjjmm %6d' % (getTime(), mode, jjjjmm))
     if (mode == 'M'):
-        remonth(jjjjmm)
+        remonth(jjjjmm, str(jjjjmm) == str(aktjjjjmm))
+        # Jahreslog aus den Summenfiles der Monate aktualisieren
+        if (checkyear(jjjj) == 0):
+            reyeardet(jjjj)
     else:
         reyear()
     print('%s csvcalc.py finished' % (getTime()))
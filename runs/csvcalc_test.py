@@ -0,0 +1,164 @@
+import os
+from pathlib import Path
+
+import pytest
+
+import csvcalc
+
+MONTH = '202301'
+
+
+@pytest.fixture
+def paths(tmp_path: Path, monkeypatch) -> Path:
+    for folder in ('daily', 'v001', 'ramdisk'):
+        (tmp_path / folder).mkdir()
+    monkeypatch.setattr(csvcalc, 'inputp', str(tmp_path / 'daily') + '/', raising=False)
+    monkeypatch.setattr(csvcalc, 'outputp', str(tmp_path / 'v001') + '/', raising=False)
+    monkeypatch.setattr(csvcalc, 'outputa', str(tmp_path / 'ramdisk') + '/', raising=False)
+    monkeypatch.setattr(csvcalc, 'aktjjjjmm', MONTH, raising=False)
+    monkeypatch.setattr(csvcalc, 'aktjjjj', int(MONTH[0:4]), raising=False)
+    monkeypatch.setattr(csvcalc, 'startjjjj', int(MONTH[0:4]), raising=False)
+    monkeypatch.setattr(csvcalc, 'SUMCOLUMNSTART', 60, raising=False)
+    monkeypatch.setattr(csvcalc, 'header', ['Datum', 'Bezug', 'Einspeisung', 'Pv'], raising=False)
+    monkeypatch.setattr(csvcalc, 'jobs', 1, raising=False)
+    reset(monkeypatch)
+    csvcalc.prep()
+    return tmp_path
+
+
+def reset(monkeypatch):
+    # Startwerte wie in __main__
+    monkeypatch.setattr(csvcalc, 'countercsv', ["0"] * 60, raising=False)
+    monkeypatch.setattr(csvcalc, 'sumcsv', ["0"] * 60, raising=False)
+    monkeypatch.setattr(csvcalc, 'sumcsvt', [float(0)] * 60, raising=False)
+
+
+def write_day(paths: Path, jjjjmm: str, day: int, first: int, count: int, mode: str = 'a'):
+    with open(str(paths / 'daily' / ('%s%02d.csv' % (jjjjmm, day))), mode) as f:
+        for k in range(first, first + count):
+            base = day * 288 + k
+            values = ['%.3f' % (1000 + base * (column % 7 + 1) * 0.25) for column in range(1, 36)]
+            f.write('%02d%02d,' % (k // 12, k % 12 * 5) + ','.join(values) + '\n')
+
+
+def rewrite_day(paths: Path, jjjjmm: str, day: int, count: int):
+    # gleiche Groesse, anderer Inhalt, eine Sekunde spaeter geschrieben
+    file_stringi = str(paths / 'daily' / ('%s%02d.csv' % (jjjjmm, day)))
+    stat = os.stat(file_stringi)
+    write_day(paths, jjjjmm, day, 1, count, 'w')
+    os.utime(file_stringi, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+
+def shrink_output(paths: Path):
+    with open(str(paths / 'ramdisk' / 'logaktmonthonl.csv'), 'r+') as f:
+        f.truncate(10)
+
+
+def outputs(paths: Path):
+    return [(paths / 'ramdisk' / name).read_text() for name in ('logaktmonthonl.csv', 'logaktmonthonls.csv')]
+
+
+def test_remonth_resume_matches_full_recompute(paths: Path, monkeypatch, capsys):
+    # setup
+    write_day(paths, MONTH, 1, 0, 288)
+    write_day(paths, MONTH, 2, 0, 100)
+    csvcalc.remonth(MONTH, True)
+    write_day(paths, MONTH, 2, 100, 188)
+    write_day(paths, MONTH, 3, 0, 50)
+    capsys.readouterr()
+
+    # execution
+    csvcalc.remonth(MONTH, True)
+    resumed = outputs(paths)
+    resumed_log = capsys.readouterr().out
+    reset(monkeypatch)
+    csvcalc.remonth(MONTH)
+
+    # evaluation
+    assert 'fortgesetzt ab Tag 2' in resumed_log
+    assert resumed == outputs(paths)
+    assert not (paths / 'ramdisk' / 'logaktmonthonl.chk').exists()
+
+
+def test_remonth_past_month_writes_no_checkpoint(paths: Path):
+    # setup
+    write_day(paths, '202212', 1, 0, 20)
+
+    # execution
+    csvcalc.remonth('202212')
+
+    # evaluation
+    assert (paths / 'v001' / '202212onl.csv').exists()
+    assert [path.name for path in (paths / 'v001').iterdir() if path.suffix == '.chk'] == []
+
+
+@pytest.mark.parametrize("change", [
+    pytest.param(lambda paths, monkeypatch: '202302', id="month"),
+    pytest.param(lambda paths, monkeypatch: monkeypatch.setattr(csvcalc, 'inputp', str(paths / 'daily')), id="input"),
+    pytest.param(lambda paths, monkeypatch: monkeypatch.setattr(csvcalc, 'SUMCOLUMNSTART', 50), id="columns"),
+    pytest.param(lambda paths, monkeypatch: shrink_output(paths), id="output shrunk"),
+    pytest.param(lambda paths, monkeypatch: rewrite_day(paths, MONTH, 1, 288), id="complete day rewritten"),
+    pytest.param(lambda paths, monkeypatch: write_day(paths, MONTH, 2, 1, 100, 'w'), id="current day rewritten"),
+])
+def test_readcheckpoint_rejects(paths: Path, monkeypatch, change):
+    # setup
+    write_day(paths, MONTH, 1, 0, 288)
+    write_day(paths, MONTH, 2, 0, 100)
+    csvcalc.remonth(MONTH, True)
+    file_stringo = str(paths / 'ramdisk' / 'logaktmonthonl.csv')
+    assert csvcalc.readcheckpoint(MONTH, file_stringo) is not None
+
+    # execution
+    month = change(paths, monkeypatch) or MONTH
+
+    # evaluation
+    assert csvcalc.readcheckpoint(month, file_stringo) is None
+
+
+@pytest.fixture
+def months(paths: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(csvcalc, 'aktjjjjmm', '202303')
+    for jjjjmm, day in [('202301', 30), ('202301', 31), ('202302', 1), ('202302', 2), ('202303', 1)]:
+        write_day(paths, jjjjmm, day, 0, 60)
+    return paths
+
+
+def results(paths: Path):
+    return {path.name: path.read_text() for folder in ('v001', 'ramdisk') for path in sorted((paths / folder).iterdir())
+            if path.suffix == '.csv'}
+
+
+def test_reyear_skips_unchanged_months(months: Path, monkeypatch):
+    # setup
+    csvcalc.reyear()
+    checked = []
+    checkmonth = csvcalc.checkmonth
+    monkeypatch.setattr(csvcalc, 'checkmonth', lambda jjjjmm: checked.append(jjjjmm) or checkmonth(jjjjmm))
+
+    # execution
+    csvcalc.reyear()
+
+    # evaluation
+    assert checked == ['202303']
+    assert set(results(months)) >= {'202301onl.csv', '202301onls.csv', '202302onl.csv', '202302onls.csv'}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_reyear_recomputes_changed_month(months: Path, monkeypatch, jobs: int):
+    # setup
+    csvcalc.reyear()
+    write_day(months, '202301', 31, 60, 40)
+    write_day(months, '202302', 2, 60, 40)
+    monkeypatch.setattr(csvcalc, 'jobs', jobs)
+
+    # execution
+    csvcalc.reyear()
+    updated = results(months)
+    for path in list((months / 'v001').iterdir()) + list((months / 'ramdisk').iterdir()):
+        path.unlink()
+    reset(monkeypatch)
+    csvcalc.reyear()
+
+    # evaluation
+    assert updated == results(months)
+    assert '31.01.2023' in updated['202301onl.csv'].splitlines()[-1]
@@ -34,125 +34,97 @@ def getTime():
 
 
 def seprow(usedspalten, compspalten, irow):
-    # print ('usedspalten %s compspalten %s len %s' % (str(usedspalten),str(compspalten),str(len(irow))))
     # usedspalten 75 compspalten 40 len 81
-    # datum in it format umwandeln
-    datestringitnext = ''
-    datestringit = ''
+    # datum in it format umwandeln, danach Zaehler (ab Spalte 1) und Betraege (ab Spalte 1 + compspalten) trennen
     (datestringit, datestringitnext) = itdate(str(irow[0]))
-    sumlinec = datestringit+','
-    sumlineb = datestringit+','
-    # alles andere
-    for i in range(2, usedspalten+1):
-        # print ('I %s ' % (str(i)))
-        sumlinec = sumlinec + str(irow[i-1])
-        sumlineb = sumlineb + str(irow[i-1+compspalten])
-        if i < (usedspalten):
-            sumlinec = sumlinec + ','
-            sumlineb = sumlineb + ','
-    sumlinec = sumlinec + '\n'
-    sumlineb = sumlineb + '\n'
+    sumlinec = datestringit + ',' + ','.join(irow[1:usedspalten]) + '\n'
+    sumlineb = datestringit + ',' + ','.join(irow[1+compspalten:usedspalten+compspalten]) + '\n'
     return (sumlinec, sumlineb, datestringitnext)
 
 
-def selmonth(jjjjmm):
-    # lesen summenfile
-    datestringitnext = ''
-    complastdate = ''
-    complastzeit = ''
-    compspalten = 0
-    ifile = 0
+def headerdef(headerrow, compspalten):
+    # Headerline für online mit *ENDE* abschliessen
+    return ','.join([headerrow[0]] + headerrow[compspalten+1:compspalten*2+1] + ['*ENDE*']) + '\n'
+
+
+def monthlines(jjjjmm):
+    # liefert (Dateinummer, Zeile) fuer alle a_onl Dateien in einem Durchlauf
+    # file 1 -> headerst
+    # file 2 -> Zaehler summe
+    # file 3 -> beträge summe
+    # file 4 -> Zaehler detail, erste 14 Tage
+    # file 5 -> beträge detail, erste 14 Tage
+    # file 6 -> beträge detail, restliche Tage und simulierter Folgemonat
+    # file 7 -> Zaehler detail, restliche Tage und simulierter Folgemonat
     (file_cvsfinp, file_cvsfinps) = infiledef(jjjjmm)
+    if not os.path.isfile(file_cvsfinps):
+        print('%s summenfile %s nicht gefunden %s' % (getTime(), jjjjmm, file_cvsfinps))
+        return
     try:
-        if os.path.isfile(file_cvsfinps):
-            ifile = 1
-            f = open(file_cvsfinps, 'r')
-            csv_os = csv.reader(f)
-            sumrow = next(csv_os)
-            compspalten = int(int(sumrow[1]) / 2)
-            complastdate = sumrow[3]
-            complastzeit = sumrow[5]
-            headerrow = next(csv_os)
-            sumrow = next(csv_os)
-            f.close()
-        else:
-            ifile = 0
+        f = open(file_cvsfinps, 'r')
+        csv_os = csv.reader(f)
+        sumrow = next(csv_os)
+        compspalten = int(int(sumrow[1]) / 2)
+        headerrow = next(csv_os)
+        sumrow = next(csv_os)
+        f.close()
     except Exception as e:
         print('%s error %s inhalt %s' % (getTime(), jjjjmm, str(e)))
-    if (ifile == 0):
-        print('%s summenfile %s nicht gefunden %s' % (getTime(), jjjjmm, file_cvsfinps))
         return
-    # header machen
-    headerline = str(headerrow[0]) + ','
-    for i in range(compspalten+2, (compspalten*2)+2):
-        if (i > len(headerrow)):
-            break
-        headerline = headerline + str(headerrow[i-1]) + ','
-    # Headerline für online abschliessen
-    # file 1 -> headerst
-    headerline = headerline + str('*ENDE*') + '\n'
-    f1 = open(outputfile + 'a_onl1', 'w')
-    f1.write(str(headerline))
-    f1.close()
-    # nur bis laenge header  schicken
-    # summenzeile in Zaehler und betraege trennen
-    (sumlinec, sumlineb, datestringitnext) = seprow(len(headerrow)-compspalten, compspalten, sumrow)
-    # file 2 -> Zaehler summe
-    # file 3 -> beträge summe
-    f1 = open(outputfile + 'a_onl2', 'w')
-    f1.write(str(sumlinec))
-    f1.close()
-    f1 = open(outputfile + 'a_onl3', 'w')
-    f1.write(str(sumlineb))
-    f1.close()
-    os.chmod(outputfile + 'a_onl1', 0o777)
-    os.chmod(outputfile + 'a_onl2', 0o777)
-    os.chmod(outputfile + 'a_onl3', 0o777)
+    yield (1, headerdef(headerrow, compspalten))
+    # nur bis laenge header schicken
+    usedspalten = len(headerrow) - compspalten
+    (sumlinec, sumlineb, datestringitnext) = seprow(usedspalten, compspalten, sumrow)
+    yield (2, sumlinec)
+    yield (3, sumlineb)
     # lesen gesamtes monatsfile
-    ifile = 0
+    if not os.path.isfile(file_cvsfinp):
+        print('%s datenfile %s nicht gefunden %s' % (getTime(), jjjjmm, file_cvsfinp))
+        return
+    # Detaildateien auch ohne Saetze neu anlegen
+    for n in range(4, 8):
+        yield (n, '')
+    f = open(file_cvsfinp, 'r')
+    try:
+        csv_o = csv.reader(f)
+        i = 0 if next(csv_o, None) is None else 1
+        for inrow in csv_o:
+            (sumlinec, sumlineb, datestringitnext) = seprow(usedspalten, compspalten, inrow)
+            if (i < 15):
+                yield (4, sumlinec)
+                yield (5, sumlineb)
+            else:
+                yield (7, sumlinec)
+                yield (6, sumlineb)
+            i = i + 1
+    finally:
+        f.close()
+    # folgemonat simulieren
+    print('%s letzer vom Monat %s, Saetze %s' % (getTime(), sumlinec[:8], str(i)))
+    yield (7, datestringitnext + ',' + sumlinec[9:])
+    yield (6, datestringitnext + ',' + sumlineb[9:])
+
+
+def writelines(lines, prefix):
+    # jede Datei einmal oeffnen und gepuffert schreiben, Rechte nur setzen wenn noetig
+    files = {}
     try:
-        if os.path.isfile(file_cvsfinp):
-            ifile = 1
-            f = open(file_cvsfinp, 'r')
-            # file 4 -> Zaehler detail
-            # file 5 -> beträge detail
-            f1 = open(outputfile + 'a_onl4', 'w')
-            f2 = open(outputfile + 'a_onl5', 'w')
-            f3 = open(outputfile + 'a_onl6', 'w')
-            f4 = open(outputfile + 'a_onl7', 'w')
-            csv_o = csv.reader(f)
-            i = 0
-            for inrow in csv_o:
-                if (i == 0):
-                    pass
-                else:
-                    (sumlinec, sumlineb, datestringitnext) = seprow(len(headerrow)-compspalten, compspalten, inrow)
-                    if (i < 15):
-                        f1.write(str(sumlinec))
-                        f2.write(str(sumlineb))
-                    else:
-                        f4.write(str(sumlinec))
-                        f3.write(str(sumlineb))
-                i = i+1
-            # folgemonat simulierem
-            print('%s letzer vom Monat %s, Saetze %s' % (getTime(), sumlinec[:8], str(i)))
-            sumlinec = datestringitnext+','+sumlinec[9:]
-            f4.write(str(sumlinec))
-            sumlineb = datestringitnext+','+sumlineb[9:]
-            f3.write(str(sumlineb))
-            f.close()
+        for (n, line) in lines:
+            if n not in files:
+                files[n] = open(outputfile + prefix + str(n), 'w', buffering=65536)
+            files[n].write(line)
+    finally:
+        for f1 in files.values():
             f1.close()
-            f2.close()
-            f3.close()
-            f4.close()
-            os.chmod(outputfile + 'a_onl4', 0o777)
-            os.chmod(outputfile + 'a_onl5', 0o777)
-            os.chmod(outputfile + 'a_onl6', 0o777)
-            os.chmod(outputfile + 'a_onl7', 0o777)
+            if (os.stat(f1.name).st_mode & 0o777) != 0o777:
+                os.chmod(f1.name, 0o777)
+
+
+def selmonth(jjjjmm):
+    try:
+        writelines(monthlines(jjjjmm), 'a_onl')
     except Exception as e:
         print('%s error1 %s inhalt %s' % (getTime(), jjjjmm, str(e)))
-    if (ifile == 0):
-        print('%s datenfile %s nicht gefunden %s' % (getTime(), jjjjmm, file_cvsfinp))
     return
 
 
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+import os
+import time
+import argparse
+import socketserver
+from http.server import BaseHTTPRequestHandler
+
+import csvselmonth
+import csvselyear
+
+'''
+Liefert die Daten der Monats- und Jahresgrafik direkt aus den Summenlogs, ohne a_onl/b_onl Dateien zu schreiben
+    GET /month/<jjjjmm>/<n> -> Inhalt von a_onl<n> (n = 1 bis 7)
+    GET /year/<jjjj>/<n>    -> Inhalt von b_onl<n> (n = 1, 4, 5)
+Start z.B. mit
+    python3 runs/csvselserver.py --input /var/www/html/openWB/web/logging/data/v001/
+        --partial /var/www/html/openWB/ramdisk/ --socket /var/www/html/openWB/ramdisk/csvsel.sock
+'''
+
+
+def getTime():
+    named_tuple = time.localtime()  # getstruct_time
+    return time.strftime("%m/%d/%Y, %H:%M:%S", named_tuple)
+
+
+def partlines(kind, date, part):
+    # der aktuelle Monat bzw. das aktuelle Jahr kommt aus der ramdisk, deshalb bei jeder Anfrage neu setzen
+    if kind == 'month':
+        csvselmonth.aktjjjjmm = time.strftime("%Y%m")
+        lines = csvselmonth.monthlines(date)
+    else:
+        csvselyear.aktjjjj = time.strftime("%Y")
+        lines = csvselyear.yearlines(date)
+    return (line for (n, line) in lines if n == part)
+
+
+class CsvSelHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        try:
+            (kind, date, part) = self.path.strip('/').split('/')
+            if (kind == 'month' and len(date) == 6) or (kind == 'year' and len(date) == 4):
+                lines = partlines(kind, int(date), int(part))
+            else:
+                lines = None
+        except ValueError:
+            lines = None
+        if lines is None:
+            self.send_error(400, 'erwartet /month/<jjjjmm>/<n> oder /year/<jjjj>/<n>')
+            return
+        # erst die erste Zeile holen, damit fehlende Daten noch als 404 gemeldet werden koennen
+        first = next(lines, None)
+        if first is None:
+            self.send_error(404, 'keine Daten fuer %s' % self.path)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.end_headers()
+        self.wfile.write(first.encode('utf-8'))
+        for line in lines:
+            self.wfile.write(line.encode('utf-8'))
+
+    def address_string(self):
+        # bei Unix Sockets gibt es keine Client Adresse
+        return str(self.client_address[0]) if self.client_address else 'local'
+
+    def log_message(self, format, *args):
+        print('%s %s %s' % (getTime(), self.address_string(), format % args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--input', type=str, required=True, help='folder for complete logfiles as input')
+    parser.add_argument('-p', '--partial', type=str, required=True,
+                        help='partial logfiles (actual month and year), should be in ramdisk as input')
+    parser.add_argument('-s', '--socket', type=str, required=False,
+                        help='unix socket to listen on, otherwise http on 127.0.0.1')
+    parser.add_argument('--port', type=int, required=False, default=8091, help='port if no socket is given')
+    args = parser.parse_args()
+    csvselmonth.inputcvsp = csvselyear.inputcvsp = args.input
+    csvselmonth.inputcvsa = csvselyear.inputcvsa = args.partial
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+        server = socketserver.UnixStreamServer(args.socket, CsvSelHandler)
+        os.chmod(args.socket, 0o777)
+        print('%s csvselserver.py listening on %s' % (getTime(), args.socket))
+    else:
+        server = socketserver.TCPServer(('127.0.0.1', args.port), CsvSelHandler)
+        print('%s csvselserver.py listening on 127.0.0.1:%d' % (getTime(), args.port))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
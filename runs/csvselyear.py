@@ -31,101 +31,87 @@ def getTime():
 
 
 def seprow(usedspalten, compspalten, irow):
-    # print ('usedspalten %s compspalten %s len %s' % (str(usedspalten),str(compspalten),str(len(irow))))
     # usedspalten 75 compspalten 40 len 81
-    # datum in it format umwandeln
-    datestringitnext = ''
-    datestringit = ''
+    # datum in it format umwandeln, danach Zaehler (ab Spalte 1) und Betraege (ab Spalte 1 + compspalten) trennen
     (datestringit, datestringitnext) = itdate(str(irow[0]))
-    sumlinec = datestringit+','
-    sumlineb = datestringit+','
-    # alles andere
-    for i in range(2, usedspalten+1):
-        # print ('I %s ' % (str(i)))
-        sumlinec = sumlinec + str(irow[i-1])
-        sumlineb = sumlineb + str(irow[i-1+compspalten])
-        if i < (usedspalten):
-            sumlinec = sumlinec + ','
-            sumlineb = sumlineb + ','
-    sumlinec = sumlinec + '\n'
-    sumlineb = sumlineb + '\n'
+    sumlinec = datestringit + ',' + ','.join(irow[1:usedspalten]) + '\n'
+    sumlineb = datestringit + ',' + ','.join(irow[1+compspalten:usedspalten+compspalten]) + '\n'
     return (sumlinec, sumlineb, datestringitnext)
 
 
-def selyear(jjjjmm):
-    # lesen summenfile
-    datestringitnext = ''
-    complastdate = ''
-    complastzeit = ''
-    compspalten = 0
-    ifile = 0
-    (file_cvsfinp, file_cvsfinps) = infiledef(jjjjmm)
+def headerdef(headerrow, compspalten):
+    # Headerline für online mit *ENDE* abschliessen
+    return ','.join([headerrow[0]] + headerrow[compspalten+1:compspalten*2+1] + ['*ENDE*']) + '\n'
+
+
+def yearlines(jjjj):
+    # liefert (Dateinummer, Zeile) fuer alle b_onl Dateien in einem Durchlauf
+    # file 1 -> headerst
+    # file 4 -> Zaehler detail und simuliertes Folgejahr
+    # file 5 -> beträge detail und simuliertes Folgejahr
+    (file_cvsfinp, file_cvsfinps) = infiledef(jjjj)
+    if not os.path.isfile(file_cvsfinps):
+        print('%s summenfile nicht gefunden %s' % (getTime(), file_cvsfinps))
+        return
     try:
-        if os.path.isfile(file_cvsfinps):
-            ifile = 1
-            f = open(file_cvsfinps, 'r')
-            csv_os = csv.reader(f)
-            sumrow = next(csv_os)
-            compspalten = int(int(sumrow[1]) / 2)
-            complastdate = sumrow[3]
-            complastzeit = sumrow[5]
-            headerrow = next(csv_os)
-            f.close()
-        else:
-            ifile = 0
+        f = open(file_cvsfinps, 'r')
+        csv_os = csv.reader(f)
+        sumrow = next(csv_os)
+        compspalten = int(int(sumrow[1]) / 2)
+        headerrow = next(csv_os)
+        f.close()
     except Exception as e:
         print('%s error %s inhalt %s' % (getTime(), file_cvsfinps, str(e)))
-    if (ifile == 0):
-        print('%s summenfile nicht gefunden %s' % (getTime(), file_cvsfinps))
         return
-    # header machen
-    headerline = str(headerrow[0]) + ','
-    for i in range(compspalten+2, (compspalten*2)+2):
-        if (i > len(headerrow)):
-            break
-        headerline = headerline + str(headerrow[i-1]) + ','
-    # Headerline für online abschliessen
-    # file 1 -> headerst
-    headerline = headerline + str('*ENDE*') + '\n'
-    f1 = open(outputfile + 'b_onl1', 'w')
-    f1.write(str(headerline))
-    f1.close()
-    os.chmod(outputfile + 'b_onl1', 0o777)
+    yield (1, headerdef(headerrow, compspalten))
     # lesen gesamtes Jahresfile
-    ifile = 0
+    if not os.path.isfile(file_cvsfinp):
+        print('%s datenfile nicht gefunden %s' % (getTime(), file_cvsfinp))
+        return
+    # Detaildateien auch ohne Saetze neu anlegen
+    yield (4, '')
+    yield (5, '')
+    usedspalten = len(headerrow) - compspalten
+    f = open(file_cvsfinp, 'r')
     try:
-        if os.path.isfile(file_cvsfinp):
-            ifile = 1
-            f = open(file_cvsfinp, 'r')
-            # file 4 -> Zaehler detail
-            # file 5 -> beträge detail
-            f1 = open(outputfile + 'b_onl4', 'w')
-            f2 = open(outputfile + 'b_onl5', 'w')
-            csv_o = csv.reader(f)
-            i = 0
-            for inrow in csv_o:
-                if (i == 0):
-                    pass
-                else:
-                    (sumlinec, sumlineb, datestringitnext) = seprow(len(headerrow)-compspalten, compspalten, inrow)
-                    f1.write(str(sumlinec))
-                    f2.write(str(sumlineb))
-                i = i+1
-            # folgejahr simulierem
-            print('%s letzer vom Jahr %s, Saetze %s' % (getTime(), sumlinec[:8], str(i)))
-            sumlinec = datestringitnext+','+sumlinec[9:]
-            f1.write(str(sumlinec))
-            sumlineb = datestringitnext+','+sumlineb[9:]
-            f2.write(str(sumlineb))
-            f.close()
+        csv_o = csv.reader(f)
+        i = 0 if next(csv_o, None) is None else 1
+        for inrow in csv_o:
+            (sumlinec, sumlineb, datestringitnext) = seprow(usedspalten, compspalten, inrow)
+            yield (4, sumlinec)
+            yield (5, sumlineb)
+            i = i + 1
+    finally:
+        f.close()
+    if (i < 2):
+        print('%s keine Saetze im Jahr %s' % (getTime(), file_cvsfinp))
+        return
+    # folgejahr simulieren
+    print('%s letzer vom Jahr %s, Saetze %s' % (getTime(), sumlinec[:8], str(i)))
+    yield (4, datestringitnext + ',' + sumlinec[9:])
+    yield (5, datestringitnext + ',' + sumlineb[9:])
+
+
+def writelines(lines, prefix):
+    # jede Datei einmal oeffnen und gepuffert schreiben, Rechte nur setzen wenn noetig
+    files = {}
+    try:
+        for (n, line) in lines:
+            if n not in files:
+                files[n] = open(outputfile + prefix + str(n), 'w', buffering=65536)
+            files[n].write(line)
+    finally:
+        for f1 in files.values():
             f1.close()
-            f2.close()
-            os.chmod(outputfile + 'b_onl4', 0o777)
-            os.chmod(outputfile + 'b_onl5', 0o777)
+            if (os.stat(f1.name).st_mode & 0o777) != 0o777:
+                os.chmod(f1.name, 0o777)
+
+
+def selyear(jjjj):
+    try:
+        writelines(yearlines(jjjj), 'b_onl')
     except Exception as e:
-        print('%s error1 %s inhalt %s' % (getTime(), file_cvsfinp, str(e)))
-    if (ifile == 0):
-        print('%s datenfile nicht gefunden %s' % (getTime(), file_cvsfinp))
+        print('%s error1 %s inhalt %s' % (getTime(), jjjj, str(e)))
     return
 
 
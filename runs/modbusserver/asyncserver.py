@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+import asyncio
+import logging
+import struct
+import time
+from types import SimpleNamespace
+
+from umodbus.server.tcp import RequestHandler
+from umodbus.utils import unpack_mbap
+
+log = logging.getLogger('uModbus')
+
+# Abstand in Sekunden, in dem die Anfragen je Client ins Log geschrieben werden
+METRICS_INTERVAL = 300
+
+
+class PduProcessor(RequestHandler):
+    """ umodbus RequestHandler ohne Socket, verarbeitet eine Anfrage (ADU) mit der route_map des Servers. """
+    def __init__(self, route_map):
+        self.server = SimpleNamespace(route_map=route_map)
+
+
+class ClientMetrics:
+    def __init__(self, peer):
+        self.peer = peer
+        self.connected = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.busy = 0.0
+
+    def __str__(self):
+        return '%s: %d Anfragen, %d Fehler, %.1f ms je Anfrage, verbunden seit %s' % (
+            self.peer, self.requests, self.errors, self.busy * 1000 / max(self.requests, 1),
+            time.strftime('%H:%M:%S', time.localtime(self.connected)))
+
+
+class AsyncModbusServer:
+    """ Modbus TCP Server fuer beliebig viele gleichzeitige Verbindungen auf Basis von asyncio.
+
+    Die Anfragen werden wie im socketserver Modus von umodbus (functions.py) ausgewertet. """
+    def __init__(self, route_map):
+        self.processor = PduProcessor(route_map)
+        self.clients = {}
+
+    async def handle(self, reader, writer):
+        peer = '%s:%d' % writer.get_extra_info('peername')[:2]
+        metrics = self.clients[peer] = ClientMetrics(peer)
+        log.info('Modbus Client verbunden %s, %d Verbindungen', peer, len(self.clients))
+        try:
+            while True:
+                try:
+                    mbap_header = await reader.readexactly(7)
+                    length = unpack_mbap(mbap_header)[2]
+                    request_pdu = await reader.readexactly(length - 1)
+                except (asyncio.IncompleteReadError, ConnectionError, ValueError, struct.error):
+                    return
+                started = time.time()
+                response_adu = self.processor.process(mbap_header + request_pdu)
+                metrics.busy += time.time() - started
+                metrics.requests += 1
+                # Antworten mit gesetztem Bit 7 im Funktionscode sind Exceptions
+                if len(response_adu) > 7 and response_adu[7] & 0x80:
+                    metrics.errors += 1
+                writer.write(response_adu)
+                await writer.drain()
+        except Exception:
+            log.exception('Fehler bei Modbus Client %s', peer)
+        finally:
+            del self.clients[peer]
+            log.info('Modbus Client getrennt %s', metrics)
+            writer.close()
+
+    async def log_metrics(self):
+        while True:
+            await asyncio.sleep(METRICS_INTERVAL)
+            for metrics in list(self.clients.values()):
+                log.info('Modbus Client %s', metrics)
+
+    def serve_forever(self, host, port):
+        # Verbindungen und Metriken sollen im Log erscheinen
+        if log.getEffectiveLevel() > logging.INFO:
+            log.setLevel(logging.INFO)
+        loop = asyncio.get_event_loop()
+        server = loop.run_until_complete(asyncio.start_server(self.handle, host, port, reuse_address=True))
+        metrics_task = loop.create_task(self.log_metrics())
+        try:
+            loop.run_forever()
+        finally:
+            metrics_task.cancel()
+            server.close()
+            loop.run_until_complete(server.wait_closed())
@@ -1,240 +1,184 @@
 #!/usr/bin/env python
+import argparse
 import logging
+import threading
+import time
 from socketserver import TCPServer
-from collections import defaultdict
+from types import MethodType, SimpleNamespace
 import struct
 from umodbus import conf
+from umodbus.route import Map
+from umodbus.server import route
 from umodbus.server.tcp import RequestHandler, get_server
 from umodbus.utils import log_to_stream
+from asyncserver import AsyncModbusServer
 
 log_to_stream(level=logging.DEBUG)
-data_store = defaultdict(int)
 conf.SIGNED_VALUES = True
 TCPServer.allow_reuse_address = True
-app = get_server(TCPServer, ('0.0.0.0', 502), RequestHandler)
+# Routen unabhaengig vom Server sammeln, damit beide Server Modi dieselben Endpunkte verwenden
+app = SimpleNamespace(route_map=Map())
+app.route = MethodType(route, app)
 
 
-def form_sint32(value, startreg):
-    secondreg = startreg + 1
+RAMDISK = '/var/www/html/openWB/ramdisk/'
+# Registerabbild wird bei einer Anfrage aus der ramdisk neu aufgebaut, wenn es aelter als REFRESH_SECONDS ist
+# oder ein Wert geschrieben wurde, ohne Anfragen wird die ramdisk nicht gelesen
+REFRESH_SECONDS = 5
+image = {}
+image_time = None
+image_lock = threading.Lock()
+refresh_now = threading.Event()
+
+
+def form_sint32(text):
     try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read()))
-        print(str(readvar))
-        binary32 = struct.pack('>l', readvar)
-        high_byte, low_byte = struct.unpack('>hh', binary32)
-        data_store[startreg] = high_byte
-        data_store[secondreg] = low_byte
-    except:
-        data_store[startreg] = -1
-        data_store[secondreg] = -1
-
-
-def form_lpkwhsint32(value, startreg):
-    secondreg = startreg + 1
+        binary32 = struct.pack('>l', int(float(text)))
+        return list(struct.unpack('>hh', binary32))
+    except Exception:
+        return [-1, -1]
+
+
+def form_lpkwhsint32(text):
     try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read())*1000)
-        binary32 = struct.pack('>l', readvar)
-        high_byte, low_byte = struct.unpack('>hh', binary32)
-        data_store[startreg] = high_byte
-        data_store[secondreg] = low_byte
-    except:
-        data_store[startreg] = -1
-        data_store[secondreg] = -1
-
-
-def form_sint16(value, startreg):
+        binary32 = struct.pack('>l', int(float(text)*1000))
+        return list(struct.unpack('>hh', binary32))
+    except Exception:
+        return [-1, -1]
+
+
+def form_sint16(text):
     try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read()))
+        readvar = int(float(text))
         if (readvar > 32767 or readvar < -32768):
             raise Exception("Number to big")
-        data_store[startreg] = readvar
-    except:
-        data_store[startreg] = -1
+        return [readvar]
+    except Exception:
+        return [-1]
 
 
-def form_100sint16(value, startreg):
+def form_100sint16(text):
     try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read())*100)
+        readvar = int(float(text)*100)
         if (readvar > 32767 or readvar < -32768):
-            print("raised")
             raise Exception("Number to big")
-        data_store[startreg] = readvar
-    except:
-        data_store[startreg] = -1
+        return [readvar]
+    except Exception:
+        return [-1]
 
 
 def get_pos(number, n):
     return number // 10**n % 10
 
 
-@app.route(slave_ids=[1], function_codes=[3, 4], addresses=list(range(0, 32000)))
+def lp_file(chargepoint, lp1, lp2, lp3, lpn):
+    # Ladepunkt 1 bis 3 haben eigene Dateinamen, ab 4 mit Nummer
+    return (lp1, lp2, lp3)[chargepoint - 1] if 1 <= chargepoint <= 3 else lpn + str(chargepoint)
+
+
+def lp_registers(chargepoint):
+    # askedvalue (letzte zwei Stellen der Adresse) -> (Datei, Format)
+    lp = str(chargepoint)
+    return {
+        0: (lp_file(chargepoint, "llaktuell", "llaktuells1", "llaktuells2", "llaktuelllp"), form_sint32),
+        2: (lp_file(chargepoint, "llkwh", "llkwhs1", "llkwhs2", "llkwhlp"), form_lpkwhsint32),
+        4: (lp_file(chargepoint, "llv1", "llvs11", "llvs21", "llv1lp"), form_100sint16),
+        5: (lp_file(chargepoint, "llv2", "llvs12", "llvs22", "llv2lp"), form_100sint16),
+        6: (lp_file(chargepoint, "llv3", "llvs13", "llvs23", "llv3lp"), form_100sint16),
+        7: (lp_file(chargepoint, "lla1", "llas11", "llas21", "lla1lp"), form_100sint16),
+        8: (lp_file(chargepoint, "lla2", "llas12", "llas22", "lla2lp"), form_100sint16),
+        9: (lp_file(chargepoint, "lla3", "llas13", "llas23", "lla3lp"), form_100sint16),
+        10: (None if chargepoint == 1 else lp_file(chargepoint, "", "mqttlastmanagement", "mqttlastmanagements2",
+                                                   "mqttlastmanagementlp"), form_sint16),
+        11: ("lp" + lp + "enabled", form_sint16),
+        12: ("rfidlp" + lp, form_sint32),
+        14: (lp_file(chargepoint, "plugstat", "plugstats1", "plugstatlp3", "plugstatlp"), form_sint16),
+        15: (lp_file(chargepoint, "chargestat", "chargestats1", "chargestatlp3", "chargestatlp"), form_sint16),
+        16: (lp_file(chargepoint, "llsoll", "llsolls1", "llsolls2", "llsolllp"), form_sint16),
+    }
+
+
+def build_table():
+    # Startadresse -> (Datei, Format), 32 Bit Werte belegen auch die folgende Adresse
+    table = {
+        110: ("rseaktiv", form_sint16),
+        111: ("ConfiguredChargePoints", form_sint16),
+        300: ("wattbezug", form_sint32),
+        302: ("bezuga1", form_100sint16),
+        303: ("bezuga2", form_100sint16),
+        304: ("bezuga3", form_100sint16),
+        305: ("evuv1", form_100sint16),
+        306: ("evuv2", form_100sint16),
+        307: ("evuv3", form_100sint16),
+        308: ("bezugkwh", form_sint32),
+        310: ("einspeisungkwh", form_sint32),
+        400: ("pvallwatt", form_sint32),
+        402: ("pvallwh", form_sint32),
+        500: ("speicherleistung", form_sint32),
+        502: ("speichersoc", form_sint16),
+        503: ("speicherikwh", form_sint32),
+        505: ("speicherekwh", form_sint32),
+    }
+    # ab 10100 gibt die Hunderterstelle den Ladepunkt an, wie bisher fuer den ganzen Adressbereich
+    lp_tables = [lp_registers(chargepoint) for chargepoint in range(10)]
+    for address in range(10100, 32000):
+        entry = lp_tables[get_pos(address, 2)].get(address % 100)
+        if entry is not None:
+            table[address] = entry
+    return table
+
+
+TABLE = build_table()
+
+
+def read_image():
+    # jede Datei nur einmal lesen, auch wenn sie von mehreren Adressen verwendet wird
+    texts = {}
+    new_image = {}
+    for address, (name, form) in TABLE.items():
+        if name is None:
+            new_image[address] = 1
+            continue
+        if name not in texts:
+            try:
+                with open(RAMDISK + name, 'r') as var:
+                    texts[name] = var.read()
+            except Exception:
+                texts[name] = None
+        for offset, value in enumerate(form(texts[name])):
+            new_image[address + offset] = value
+    return new_image
+
+
+def current_image():
+    global image, image_time
+    with image_lock:
+        now = time.monotonic()
+        if image_time is None or now - image_time >= REFRESH_SECONDS or refresh_now.is_set():
+            refresh_now.clear()
+            try:
+                image = read_image()
+            except Exception:
+                logging.exception('Registerabbild konnte nicht aktualisiert werden')
+            image_time = now
+        return image
+
+
+@app.route(slave_ids=[1], function_codes=[3, 4], addresses=range(0, 32000))
 def read_data_store(slave_id, function_code, address):
     """" Return value of address. """
-    if (address == 110):
-        form_sint16("rseaktiv", address)
-    elif (address == 111):
-        form_sint16("ConfiguredChargePoints", address)
-    elif (address == 300):
-        form_sint32("wattbezug", address)
-    elif (address == 302):
-        form_100sint16("bezuga1", address)
-    elif (address == 303):
-        form_100sint16("bezuga2", address)
-    elif (address == 304):
-        form_100sint16("bezuga3", address)
-    elif (address == 305):
-        form_100sint16("evuv1", address)
-    elif (address == 306):
-        form_100sint16("evuv2", address)
-    elif (address == 307):
-        form_100sint16("evuv3", address)
-    elif (address == 308):
-        form_sint32("bezugkwh", address)
-    elif (address == 310):
-        form_sint32("einspeisungkwh", address)
-    elif (address == 400):
-        form_sint32("pvallwatt", address)
-    elif (address == 402):
-        form_sint32("pvallwh", address)
-    elif (address == 500):
-        form_sint32("speicherleistung", address)
-    elif (address == 502):
-        form_sint16("speichersoc", address)
-    elif (address == 503):
-        form_sint32("speicherikwh", address)
-    elif (address == 505):
-        form_sint32("speicherekwh", address)
-    elif (address > 10099):
-        chargepoint = get_pos(address, 2)
-        askedvalue = int(str(address)[-2:])
-        if (askedvalue == 00):
-            if (chargepoint == 1):
-                form_sint32("llaktuell", address)
-            elif (chargepoint == 2):
-                form_sint32("llaktuells1", address)
-            elif (chargepoint == 3):
-                form_sint32("llaktuells2", address)
-            else:
-                form_sint32("llaktuelllp"+str(chargepoint), address)
-        if (askedvalue == 2):
-            if (chargepoint == 1):
-                form_lpkwhsint32("llkwh", address)
-            elif (chargepoint == 2):
-                form_lpkwhsint32("llkwhs1", address)
-            elif (chargepoint == 3):
-                form_lpkwhsint32("llkwhs2", address)
-            else:
-                form_lpkwhsint32("llkwhlp"+str(chargepoint), address)
-        if (askedvalue == 4):
-            if (chargepoint == 1):
-                form_100sint16("llv1", address)
-            elif (chargepoint == 2):
-                form_100sint16("llvs11", address)
-            elif (chargepoint == 3):
-                form_100sint16("llvs21", address)
-            else:
-                form_100sint16("llv1lp"+str(chargepoint), address)
-        if (askedvalue == 5):
-            if (chargepoint == 1):
-                form_100sint16("llv2", address)
-            elif (chargepoint == 2):
-                form_100sint16("llvs12", address)
-            elif (chargepoint == 3):
-                form_100sint16("llvs22", address)
-            else:
-                form_100sint16("llv2lp"+str(chargepoint), address)
-        if (askedvalue == 6):
-            if (chargepoint == 1):
-                form_100sint16("llv3", address)
-            elif (chargepoint == 2):
-                form_100sint16("llvs13", address)
-            elif (chargepoint == 3):
-                form_100sint16("llvs23", address)
-            else:
-                form_100sint16("llv3lp"+str(chargepoint), address)
-        if (askedvalue == 7):
-            if (chargepoint == 1):
-                form_100sint16("lla1", address)
-            elif (chargepoint == 2):
-                form_100sint16("llas11", address)
-            elif (chargepoint == 3):
-                form_100sint16("llas21", address)
-            else:
-                form_100sint16("lla1lp"+str(chargepoint), address)
-        if (askedvalue == 8):
-            if (chargepoint == 1):
-                form_100sint16("lla2", address)
-            elif (chargepoint == 2):
-                form_100sint16("llas12", address)
-            elif (chargepoint == 3):
-                form_100sint16("llas22", address)
-            else:
-                form_100sint16("lla2lp"+str(chargepoint), address)
-        if (askedvalue == 9):
-            if (chargepoint == 1):
-                form_100sint16("lla3", address)
-            elif (chargepoint == 2):
-                form_100sint16("llas13", address)
-            elif (chargepoint == 3):
-                form_100sint16("llas23", address)
-            else:
-                form_100sint16("lla3lp"+str(chargepoint), address)
-        if (askedvalue == 10):
-            if (chargepoint == 1):
-                data_store[address] = 1
-            elif (chargepoint == 2):
-                form_sint16("mqttlastmanagement", address)
-            elif (chargepoint == 3):
-                form_sint16("mqttlastmanagements2", address)
-            else:
-                form_sint16("mqttlastmanagementlp"+str(chargepoint), address)
-        if (askedvalue == 11):
-            form_sint16("lp"+str(chargepoint)+"enabled", address)
-        if (askedvalue == 12):
-            form_sint32("rfidlp"+str(chargepoint), address)
-        if (askedvalue == 14):
-            if (chargepoint == 1):
-                form_sint16("plugstat", address)
-            elif (chargepoint == 2):
-                form_sint16("plugstats1", address)
-            elif (chargepoint == 3):
-                form_sint16("plugstatlp3", address)
-            else:
-                form_sint16("plugstatlp"+str(chargepoint), address)
-        if (askedvalue == 15):
-            if (chargepoint == 1):
-                form_sint16("chargestat", address)
-            elif (chargepoint == 2):
-                form_sint16("chargestats1", address)
-            elif (chargepoint == 3):
-                form_sint16("chargestatlp3", address)
-            else:
-                form_sint16("chargestatlp"+str(chargepoint), address)
-        if (askedvalue == 16):
-            if (chargepoint == 1):
-                form_sint16("llsoll", address)
-            elif (chargepoint == 2):
-                form_sint16("llsolls1", address)
-            elif (chargepoint == 3):
-                form_sint16("llsolls2", address)
-            else:
-                form_sint16("llsolllp"+str(chargepoint), address)
-    elif (address == 19916):
-        form_sint16("llsolllp8", address)
-
-    return data_store[address]
+    return current_image().get(address, 0)
 
 
 def write_ramdisk(name, value):
-    f = open('/var/www/html/openWB/ramdisk/' + str(name), 'w')
+    f = open(RAMDISK + str(name), 'w')
     f.write(str(value))
     f.close()
+    # geaenderte Werte sofort ins Registerabbild uebernehmen
+    refresh_now.set()
 
 
-@app.route(slave_ids=[1], function_codes=[6, 16], addresses=list(range(0, 32000)))
+@app.route(slave_ids=[1], function_codes=[6, 16], addresses=range(0, 32000))
 def write_data_store(slave_id, function_code, address, value):
     """" Set value for address. """
     if (address == 112):
@@ -252,8 +196,18 @@ def write_data_store(slave_id, function_code, address, value):
 
 
 if __name__ == '__main__':
-    try:
-        app.serve_forever()
-    finally:
-        app.shutdown()
-        app.server_close()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=502, help='tcp port, defaults to 502')
+    parser.add_argument('--threaded', action='store_true',
+                        help='use the socketserver of umodbus (one client at a time) instead of asyncio')
+    args = parser.parse_args()
+    if args.threaded:
+        server = get_server(TCPServer, ('0.0.0.0', args.port), RequestHandler)
+        server.route_map = app.route_map
+        try:
+            server.serve_forever()
+        finally:
+            server.shutdown()
+            server.server_close()
+    else:
+        AsyncModbusServer(app.route_map).serve_forever('0.0.0.0', args.port)
@@ -65,12 +65,8 @@ function setChargingCurrentExtopenwb () {
 	current=$1
 	chargep1ip=$2
 	chargep1cp=$3
-	# set desired charging current
-	if [[ "$chargep1cp" == "2" ]]; then
-		mosquitto_pub -r -t openWB/set/isss/Lp2Current -h "$chargep1ip" -m "$current"
-	else
-		mosquitto_pub -r -t openWB/set/isss/Current -h "$chargep1ip" -m "$current"
-	fi
+	# set desired charging current, forwarded over the open connection of modules/extopenwb
+	bash /var/www/html/openWB/packages/legacy_run.sh "modules.chargepoints.external_openwb.bridge" "set_current" "$current" "$chargep1ip" "$chargep1cp" >>/var/www/html/openWB/ramdisk/openWB.log 2>&1
 }
 
 # function for setting the current - owbpro
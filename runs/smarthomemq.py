@@ -5,6 +5,8 @@ import re
 import os
 import logging
 import math
+import concurrent.futures
+import threading
 from usmarthome.global0 import log, log_config
 from usmarthome.smartbase import Sbase
 from usmarthome.smartavm import Savm
@@ -25,8 +27,20 @@ from usmarthome.smartratiotherm import Sratiotherm
 
 mqtt_cache = {}
 mydevices = []
+# config je device, wird vom mqtt client laufend aktualisiert
+parammqtt = {}
+changeddevices = set()
+paramlock = threading.Lock()
+initialconfigdone = False
+statustopic = re.compile(r'^openWB/SmartHome/Devices/(\d+)/([^/]+)$')
+client = None
 bp = '/var/www/html/openWB'
 numberOfSupportedDevices = 9  # limit number of smarthome devices
+# Messung aller devices parallel, ein langsames device haelt die anderen nicht auf
+devicetimeout = 15  # sec, danach gelten die letzten Werte des devices
+executor = concurrent.futures.ThreadPoolExecutor(max_workers=numberOfSupportedDevices)
+devicefutures = {}
+lastvalues = {}
 
 
 def initlog():
@@ -58,6 +72,10 @@ def on_message(client, userdata, msg):
         keyword = re.sub('openWB/config/get/SmartHome/Devices/'
                          + str(devicenumb) + '/', '', msg.topic)
     if ("openWB/SmartHome/Devices" in msg.topic):
+        # Status topics nur beim Start (retained) übernehmen, die
+        # laufenden Werte publiziert smarthomemq selbst
+        if not msg.retain or initialconfigdone:
+            return
         keyword = re.sub('openWB/SmartHome/Devices/'
                          + str(devicenumb) + '/', '', msg.topic)
     value = str(input)
@@ -71,7 +89,14 @@ def on_message(client, userdata, msg):
         # richtig  topic
         log_config.info("(" + str(devicenumb) + ") Key " +
                         str(keyword) + " Value " + str(value))
-        parammqtt.append([devicenumb, keyword, value])
+        with paramlock:
+            deviceparam = parammqtt.setdefault(str(int(devicenumb)), {})
+            if (value == ''):
+                # retained topic gelöscht
+                deviceparam.pop(keyword, None)
+            else:
+                deviceparam[keyword] = value
+            changeddevices.add(int(devicenumb))
 
 
 def checkbootdone():
@@ -166,7 +191,9 @@ def loadregelvars():
     if (reread == 1):
         with open(bp+'/ramdisk/rereadsmarthomedevices', 'w') as f:
             f.write(str(0))
-        readmq()
+        readmq(set(range(1, numberOfSupportedDevices+1)))
+    else:
+        readmq(set())
 
     for i in range(1, (numberOfSupportedDevices+1)):
         try:
@@ -187,8 +214,22 @@ def loadregelvars():
             pass
 
 
+def keepvalues(mydevice, future):
+    global lastvalues
+    try:
+        future.result()
+        lastvalues[mydevice] = (mydevice.newwatt, mydevice.newwattk,
+                                mydevice.relais, dict(mydevice.mqtt_param))
+    except Exception as e:
+        log.warning("(" + str(mydevice.device_nummer) +
+                    ") Messung fehlgeschlagen, letzte Werte " +
+                    "werden verwendet: " + str(e))
+
+
 def getdevicevalues():
     global mydevices
+    global devicefutures
+    global lastvalues
     global uberschuss
     global uberschussoffset
     totalwatt = 0
@@ -199,11 +240,37 @@ def getdevicevalues():
     Sbase.einrelais = 0
     Sbase.eindevstatus = 0
     mqtt_all = {}
+    newfutures = []
+    for mydevice in mydevices:
+        future = devicefutures.get(mydevice)
+        # laeuft die Messung aus dem letzten Durchlauf noch, nicht erneut starten
+        if (future is None) or future.done():
+            if future is not None:
+                # verspaetet beendete Messung aus dem letzten Durchlauf
+                keepvalues(mydevice, future)
+            devicefutures[mydevice] = executor.submit(mydevice.getwatt,
+                                                      uberschuss,
+                                                      uberschussoffset)
+            newfutures.append(devicefutures[mydevice])
+    for mydevice in list(devicefutures):
+        if mydevice not in mydevices:
+            del devicefutures[mydevice]
+            lastvalues.pop(mydevice, None)
+    # nur auf die in diesem Durchlauf gestarteten Messungen warten, noch
+    # haengende Messungen frueherer Durchlaeufe verlaengern den Zyklus nicht
+    if newfutures:
+        concurrent.futures.wait(newfutures, timeout=devicetimeout)
     for mydevice in mydevices:
-        mydevice.getwatt(uberschuss, uberschussoffset)
-        watt = mydevice.newwatt
-        wattk = mydevice.newwattk
-        relais = mydevice.relais
+        future = devicefutures[mydevice]
+        if future.done():
+            keepvalues(mydevice, future)
+        else:
+            log.warning("(" + str(mydevice.device_nummer) +
+                        ") Messung nach " + str(devicetimeout) +
+                        " Sek nicht beendet, letzte Werte werden verwendet")
+        (watt, wattk, relais, mqtt_param) = lastvalues.get(mydevice,
+                                                           (0, 0, 0, {}))
+        mydevice.gruppewatt(watt, relais)
         # temp0 = mydevice.temp0
         # temp1 = mydevice.temp1
         # temp2 = mydevice.temp2
@@ -222,7 +289,7 @@ def getdevicevalues():
                  str(mydevice.devstatus) + "/" +
                  str(mydevice.ueberschussberechnung) + " akt: " + str(watt) +
                  " Z: " + str(wattk))
-        mqtt_all.update(mydevice.mqtt_param)
+        mqtt_all.update(mqtt_param)
     # device_total_watt is needed for calculation the proper überschuss
     # (including switchable smarthomedevices)
 
@@ -264,8 +331,6 @@ def getdevicevalues():
 
 def sendmq(mqtt_input):
     global mqtt_cache
-    client = mqtt.Client("openWB-SmartHome-bulkpublisher-" + str(os.getpid()))
-    client.connect("localhost")
     for key, value in mqtt_input.items():
         valueold = mqtt_cache.get(key, 'not in cache')
         if (valueold == value):
@@ -275,23 +340,36 @@ def sendmq(mqtt_input):
                      str(value) + " old " + str(valueold))
             mqtt_cache[key] = value
             client.publish(key, payload=value, qos=0, retain=True)
-            client.loop(timeout=2.0)
-    client.disconnect()
+            refreshstatusparam(key, value)
+
+
+def refreshstatusparam(key, value):
+    # Status topics werden nach dem Start nicht mehr empfangen, die selbst
+    # publizierten Werte nachfuehren, damit ein spaeter (neu) erzeugtes
+    # Device die aktuellen und nicht die Werte vom Start uebernimmt
+    match = statustopic.match(key)
+    if match is None:
+        return
+    with paramlock:
+        deviceparam = parammqtt.get(str(int(match.group(1))))
+        if deviceparam is not None:
+            deviceparam[match.group(2)] = str(value)
 
 
 def conditions():
     global mydevices
     global speichersoc
     for mydevice in mydevices:
+        future = devicefutures.get(mydevice)
+        if (future is not None) and not future.done():
+            # Messung laeuft noch, erst im naechsten Durchlauf regeln
+            continue
         mydevice.conditions(speichersoc)
 
 
-def update_devices():
-    global parammqtt
+def update_devices(param, devicenumbers):
     global mydevices
     global mqtt_cache
-    client = mqtt.Client("openWB-SmartHome-bulkpublisher-" + str(os.getpid()))
-    client.connect("localhost")
     # statische daten einschaltgruppe
     Sbase.ausdevices = 0
     Sbase.eindevices = 0
@@ -304,13 +382,18 @@ def update_devices():
         device_type = 'none'
         input_param = {}
         input_param['device_nummer'] = str(i)
-        for devicenumb, keyword, value in parammqtt:
-            if (str(i) == str(devicenumb)):
-                if (keyword == 'device_configured'):
-                    device_configured = value
-                if (keyword == 'device_type'):
-                    device_type = value
-                input_param[keyword] = value
+        for keyword, value in param.get(str(i), {}).items():
+            if (keyword == 'device_configured'):
+                device_configured = value
+            if (keyword == 'device_type'):
+                device_type = value
+            input_param[keyword] = value
+        if (i not in devicenumbers):
+            # unverändert, nur statische daten einschaltgruppe neu rechnen
+            for mydevice in mydevices:
+                if (str(i) == str(mydevice.device_nummer)):
+                    mydevice.gruppepar()
+            continue
         if (device_configured == "1"):
             createnew = 1
             for mydevice in mydevices:
@@ -318,9 +401,20 @@ def update_devices():
                     log.info("(" + str(i) + ") " +
                              "Device bereits erzeugt")
                     if (device_type == mydevice.device_type):
+                        createnew = 0
+                        future = devicefutures.get(mydevice)
+                        if (future is not None) and not future.done():
+                            # Messung laeuft noch auf diesem device, Parameter
+                            # erst im naechsten Durchlauf uebernehmen
+                            log.info("(" + str(i) + ") " +
+                                     "Messung laeuft noch, Parameter " +
+                                     "update im naechsten Durchlauf")
+                            with paramlock:
+                                changeddevices.add(i)
+                            mydevice.gruppepar()
+                            break
                         log.info("(" + str(i) + ") " +
                                  "Typ gleich, nur Parameter update")
-                        createnew = 0
                         mydevice.updatepar(input_param)
                     else:
                         log.info("(" + str(i) + ") " +
@@ -381,37 +475,41 @@ def update_devices():
                         log.info("Mq pub " + str(key) + "=" +
                                  str(value) + " old " + str(valueold))
                         client.publish(key, payload=value, qos=0, retain=True)
-                        client.loop(timeout=2.0)
+                        refreshstatusparam(key, value)
                     mydevice.device_nummer = 0
                     mydevice._device_configured = '9'
                     # del mydevice
                     mydevices.remove(mydevice)
                     log.info("(" + str(i) + ") " +
                              "Device gelöscht")
-    client.disconnect()
 
 
-def readmq():
+def readmq(devicenumbers):
+    # übernimmt die seit dem letzten Aufruf per mqtt geänderte config
     global parammqtt
-    global mydevices
-    log_config.info("Config reRead start")
-    log.info("Config reRead start")
-    parammqtt = []
-    client = mqtt.Client("openWB-mqttsmarthome")
+    global changeddevices
+    global initialconfigdone
+    with paramlock:
+        devicenumbers = devicenumbers | changeddevices
+        changeddevices = set()
+        param = {key: value.copy() for key, value in parammqtt.items()}
+        initialconfigdone = True
+    if (len(devicenumbers) == 0):
+        return
+    log_config.info("Config reRead start " + str(sorted(devicenumbers)))
+    log.info("Config reRead start " + str(sorted(devicenumbers)))
+    update_devices(param, devicenumbers)
+    log_config.info("Config reRead done")
+    log.info("Config reRead done")
+
+
+def startmq():
+    global client
+    client = mqtt.Client("openWB-mqttsmarthome-" + str(os.getpid()))
     client.on_connect = on_connect
     client.on_message = on_message
-    startTime = time.time()
-    waitTime = 5
     client.connect("localhost")
-    while True:
-        client.loop()
-        elapsedTime = time.time() - startTime
-        if elapsedTime > waitTime:
-            client.disconnect()
-            break
-    update_devices()
-    log_config.info("Config reRead done")
-    log.info("Config reRead done")
+    client.loop_start()
 
 
 def resetmaxeinschaltdauerfunc():
@@ -459,8 +557,10 @@ if __name__ == "__main__":
         if (checkbootdone() == 1):
             break
         time.sleep(5)
-    readmq()
+    startmq()
+    # retained config beim Start einsammeln
     time.sleep(5)
+    readmq(set(range(1, numberOfSupportedDevices+1)))
     while True:
         #        update_devices()
         mqtt_man = {}
@@ -473,6 +573,9 @@ if __name__ == "__main__":
         for i in range(1, (numberOfSupportedDevices+1)):
             for mydevice in mydevices:
                 if (str(i) == str(mydevice.device_nummer)):
+                    if not devicefutures[mydevice].done():
+                        # Messung laeuft noch, erst im naechsten Durchlauf
+                        continue
                     if (mydevice.device_manual == 1):
                         if (mydevice.device_manual_control == 0):
                             if (mydevice.relais == 1):
@@ -489,6 +592,8 @@ if __name__ == "__main__":
             pref = 'openWB/config/set/SmartHome/Devices/' + str(i) + '/'
             for mydevice in mydevices:
                 if (str(i) == str(mydevice.device_nummer)):
+                    if not devicefutures[mydevice].done():
+                        continue
                     mydevice.updatebutton()
                     if (mydevice.btchange == 1):
                         sendmess = 1
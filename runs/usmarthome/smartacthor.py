@@ -2,7 +2,6 @@
 from usmarthome.smartbase import Sbase
 from usmarthome.global0 import log
 from typing import Dict
-import subprocess
 
 
 class Sacthor(Sbase):
@@ -42,14 +41,11 @@ class Sacthor(Sbase):
     def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
         self.prewatt(uberschuss, uberschussoffset)
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'acthor/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss), self._device_acthortype,
                         self._device_acthorpower, str(forcesend)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
-            self.answer = self.readret()
+            self.answer = self.readwatt('acthor', argumentList)
             self.newwatt = int(self.answer['power'])
             self.newwattk = int(self.answer['powerc'])
             self.relais = int(self.answer['on'])
@@ -76,15 +72,13 @@ class Sacthor(Sbase):
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'acthor' + pname,
-                        str(self.device_nummer), str(self._device_ip),
+            pname = "off"
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('acthor', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
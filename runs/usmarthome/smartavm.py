@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase, Slavm
 from usmarthome.global0 import log
-import subprocess
 
 
 class Savm(Sbase):
@@ -57,20 +56,17 @@ class Savm(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
+            pname = "off"
 
-        argumentList = ['python3', self._prefixpy + 'avmhomeautomation'
-                        + pname,
-                        str(self.device_nummer), str(self._device_ip),
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         '0', '0',
                         self._device_actor,
                         self._device_username,
                         self._device_password]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('avmhomeautomation', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
@@ -8,6 +8,7 @@ from usmarthome.smartmeas import Slsdm630, Sllovato, Slsdm120, Slwe514, Slfroniu
 from usmarthome.smartmeas import Sljson, Slsmaem, Slshelly, Sltasmota, Slmqtt
 from usmarthome.smartmeas import Slhttp, Slavm, Slmystrom
 from usmarthome.smartbut import Sbshelly
+from modules.common.simcount import sim_count_legacy
 from datetime import datetime, timezone
 
 
@@ -255,10 +256,29 @@ class Sbase(Sbase0):
         else:
             sendstatus = self.devstatus
         self.mqtt_param[pref + 'Status'] = str(sendstatus)
+
+    def gruppepar(self) -> None:
+        # statische daten ein- und ausschaltgruppe
+        if (self._device_deactivateper == 100):
+            self.gruppe = 'E'
+            Sbase.eindevices = Sbase.eindevices + 1
+            workein = self._device_einschaltschwelle
+            Sbase.einschwelle = Sbase.einschwelle + workein
+            workeinverz = self._device_einschaltverzoegerung + 30
+            Sbase.einverz = max(Sbase.einverz, workeinverz)
+        elif (self._device_deactivateper > 0):
+            self.gruppe = 'A'
+            Sbase.ausdevices = Sbase.ausdevices + 1
+        else:
+            self.gruppe = 'none'
+
+    def gruppewatt(self, watt: int, relais: int) -> None:
+        # dyn daten ein- und ausschaltgruppe, wird nach der (parallelen)
+        # Messung aller devices nacheinander aufgerufen
         if (self.gruppe == 'A'):
-            Sbase.ausschaltwatt = Sbase.ausschaltwatt + self._oldwatt
+            Sbase.ausschaltwatt = Sbase.ausschaltwatt + watt
         elif (self.gruppe == 'E'):
-            if (self.relais == 1):
+            if (relais == 1):
                 Sbase.einrelais = 1
             Sbase.eindevstatus = max(Sbase.eindevstatus, self.devstatus)
 
@@ -405,18 +425,7 @@ class Sbase(Sbase0):
         self.mqtt_param_del[pref + 'TemperatureSensor1'] = '300'
         self.mqtt_param_del[pref + 'TemperatureSensor2'] = '300'
         self.mqtt_param_del[pref + 'RunningTimeToday'] = '0'
-        if (self._device_deactivateper == 100):
-            self.gruppe = 'E'
-            Sbase.eindevices = Sbase.eindevices + 1
-            workein = self._device_einschaltschwelle
-            Sbase.einschwelle = Sbase.einschwelle + workein
-            workeinverz = self._device_einschaltverzoegerung + 30
-            Sbase.einverz = max(Sbase.einverz, workeinverz)
-        elif (self._device_deactivateper > 0):
-            self.gruppe = 'A'
-            Sbase.ausdevices = Sbase.ausdevices + 1
-        else:
-            self.gruppe = 'none'
+        self.gruppepar()
         if (self.device_type == 'none'):
             self.device_canswitch = 0
         if (self._device_pbtype == 'shellypb'):
@@ -1155,64 +1164,17 @@ class Sbase(Sbase0):
                 f.write(str(wattnegkh))
             return
         # emulate import  export
-        seconds2 = time.time()
-        watt1 = 0
-        seconds1 = 0.0
-        if os.path.isfile(self._basePath+'/ramdisk/'+pref+'sec0'):
-            with open(self._basePath+'/ramdisk/'+pref+'sec0', 'r') as f:
-                seconds1 = float(f.read())
-            with open(self._basePath+'/ramdisk/'+pref+'wh0', 'r') as f:
-                watt1 = int(f.read())
-            with open(self._basePath+'/ramdisk/'+pref+'watt0pos', 'r') as f:
-                wattposh = int(f.read())
-            with open(self._basePath+'/ramdisk/'+pref+'watt0neg', 'r') as f:
-                wattnegh = int(f.read())
-            value1 = "%22.6f" % seconds2
-            with open(self._basePath+'/ramdisk/'+pref+'sec0', 'w') as f:
-                f.write(str(value1))
-            with open(self._basePath+'/ramdisk/'+pref+'wh0', 'w') as f:
-                f.write(str(watt2))
-            seconds1 = seconds1 + 1
-            deltasec = seconds2 - seconds1
-            deltasectrun = int(deltasec * 1000) / 1000
-            stepsize = int((watt2-watt1)/deltasec)
-            while seconds1 <= seconds2:
-                if watt1 < 0:
-                    wattnegh = wattnegh + watt1
-                else:
-                    wattposh = wattposh + watt1
-                watt1 = watt1 + stepsize
-                if stepsize < 0:
-                    watt1 = max(watt1, watt2)
-                else:
-                    watt1 = min(watt1, watt2)
-                seconds1 = seconds1 + 1
-            rest = deltasec - deltasectrun
-            seconds1 = seconds1 - 1 + rest
-            if rest > 0:
-                watt1 = int(watt1 * rest)
-                if watt1 < 0:
-                    wattnegh = wattnegh + watt1
-                else:
-                    wattposh = wattposh + watt1
+        result = sim_count_legacy(watt2, pref, self._basePath+'/ramdisk/')
+        if result is not None:
+            (wattposh, wattnegh) = result
             wattposkh = int(wattposh/3600)
             wattnegkh = int((wattnegh*-1)/3600)
-            with open(self._basePath+'/ramdisk/'+pref+'watt0pos', 'w') as f:
-                f.write(str(wattposh))
             self._wpos = wattposh
-            with open(self._basePath+'/ramdisk/'+pref+'watt0neg', 'w') as f:
-                f.write(str(wattnegh))
             self._wh = round(wattposkh, 2)
             with open(self._basePath+'/ramdisk/' + importfn, 'w') as f:
                 f.write(str(round(wattposkh, 2)))
             with open(self._basePath+'/ramdisk/' + exportfn, 'w') as f:
                 f.write(str(wattnegkh))
-        else:
-            value1 = "%22.6f" % seconds2
-            with open(self._basePath+'/ramdisk/'+pref+'sec0', 'w') as f:
-                f.write(str(value1))
-            with open(self._basePath+'/ramdisk/'+pref+'wh0', 'w') as f:
-                f.write(str(watt2))
 
     def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
         self.prewatt(uberschuss, uberschussoffset)
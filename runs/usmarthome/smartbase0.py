@@ -1,7 +1,31 @@
-import json
+import importlib.util
+import sys
+import threading
 import time
+from typing import Any, Callable, Dict, List
 from usmarthome.global0 import log
 
+_drivers = {}  # type: Dict[str, Callable[[List[str]], Any]]
+_driverslock = threading.Lock()
+
+
+def loaddriver(path: str, driver: str, script: str) -> Callable[[List[str]], Any]:
+    # die Treiber unter modules/smarthome werden einmal geladen und dann im
+    # smarthome Prozess aufgerufen statt je Abfrage ein python3 zu starten
+    key = driver + '/' + script
+    with _driverslock:
+        if key not in _drivers:
+            driverpath = path + driver
+            # avmcommon, credentials liegen neben den Skripten
+            if driverpath not in sys.path:
+                sys.path.append(driverpath)
+            spec = importlib.util.spec_from_file_location('smarthome_' + driver + '_' + script,
+                                                          driverpath + '/' + script + '.py')
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _drivers[key] = getattr(module, script)
+        return _drivers[key]
+
 
 class Sbase0:
     _basePath = '/var/www/html/openWB'
@@ -9,11 +33,19 @@ class Sbase0:
 
     def __init__(self):
         print('__init__ Sbase executed')
+        self._lastanswer = {}  # type: Dict[str, Dict[str, Any]]
+
+    def calldriver(self, driver: str, script: str, argumentList: List[str]) -> Any:
+        return loaddriver(self._prefixpy, driver, script)(argumentList)
 
-    def readret(self):
-        with open(self._basePath+'/ramdisk/smarthome_device_ret' +
-                  str(self.device_nummer), 'r') as f1:
-            answer = json.loads(json.load(f1))
+    def readwatt(self, driver: str, argumentList: List[str]) -> Dict[str, Any]:
+        answer = self.calldriver(driver, 'watt', argumentList)
+        if answer is None:
+            # Treiber liefert nicht bei jedem Aufruf neue Werte (idm, vampair)
+            if driver not in self._lastanswer:
+                raise Exception("noch keine Werte von " + driver)
+            return self._lastanswer[driver]
+        self._lastanswer[driver] = answer
         return answer
 
     def checkbefsend(self):
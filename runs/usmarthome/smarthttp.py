@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase, Slhttp
 from usmarthome.global0 import log
-import subprocess
 
 
 class Shttp(Sbase):
@@ -61,18 +60,16 @@ class Shttp(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
             url = self._device_einschalturl
         else:
-            pname = "/off.py"
+            pname = "off"
             url = self._device_ausschalturl
 
-        argumentList = ['python3', self._prefixpy + 'http' + pname,
-                        str(self.device_nummer), '0',
+        argumentList = [str(self.device_nummer), '0',
                         str(self.devuberschuss), url]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('http', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase
 from usmarthome.global0 import log
-import subprocess
 
 
 class Sidm(Sbase):
@@ -30,13 +29,10 @@ class Sidm(Sbase):
 
     def getwatt(self, uberschuss, uberschussoffset):
         self.prewatt(uberschuss, uberschussoffset)
-        argumentList = ['python3', self._prefixpy + 'idm/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss), str(self._device_idmnav)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
-            self.answer = self.readret()
+            self.answer = self.readwatt('idm', argumentList)
             self.newwatt = int(self.answer['power'])
             self.newwattk = int(self.answer['powerc'])
             self.relais = int(self.answer['on'])
@@ -50,15 +46,13 @@ class Sidm(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'idm' + pname,
-                        str(self.device_nummer), str(self._device_ip),
+            pname = "off"
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss), str(self._device_idmnav)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('idm', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase
 from usmarthome.global0 import log
-import subprocess
 
 
 class Slambda(Sbase):
@@ -13,14 +12,11 @@ class Slambda(Sbase):
     def getwatt(self, uberschuss, uberschussoffset):
         self.prewatt(uberschuss, uberschussoffset)
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'lambda/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss), str(self.device_lambdaueb),
                         str(forcesend)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
-            self.answer = self.readret()
+            self.answer = self.readwatt('lambda', argumentList)
             self.newwatt = int(self.answer['power'])
             self.newwattk = int(self.answer['powerc'])
             self.relais = int(self.answer['on'])
@@ -35,15 +31,13 @@ class Slambda(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'lambda' + pname,
-                        str(self.device_nummer), str(self._device_ip),
+            pname = "off"
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss), str(self.device_lambdaueb)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('lambda', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
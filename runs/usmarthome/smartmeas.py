@@ -5,8 +5,6 @@ from modules.common import modbus
 from modules.common import sdm
 from modules.common import lovato
 
-import subprocess
-
 
 class Slbase(Sbase0):
     def __init__(self) -> None:
@@ -154,13 +152,10 @@ class Slmqtt(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'mqtt/watt.py',
-                        str(self.device_nummer), str(ip),
+        argumentList = [str(self.device_nummer), str(ip),
                         str(self.devuberschuss)]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('mqtt', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -183,13 +178,10 @@ class Slshelly(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str, chan: int) -> None:
-        argumentList = ['python3', self._prefixpy + 'shelly/watt.py',
-                        str(self.device_nummer), str(ip), '0',
+        argumentList = [str(self.device_nummer), str(ip), '0',
                         str(chan)]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('shelly', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -238,15 +230,11 @@ class Slavm(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str, act: str, user: str, pw: str) -> None:
-        argumentList = ['python3', self._prefixpy +
-                        'avmhomeautomation/watt.py',
-                        str(self.device_nummer), str(ip),
+        argumentList = [str(self.device_nummer), str(ip),
                         '0', '0',
                         act, user, pw]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('avmhomeautomation', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -269,12 +257,9 @@ class Sltasmota(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'tasmota/watt.py',
-                        str(self.device_nummer), str(ip), '0']
+        argumentList = [str(self.device_nummer), str(ip), '0']
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('tasmota', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -299,16 +284,11 @@ class Slhttp(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, url: str, urlc: str, urls: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'http/watt.py',
-                        str(self.device_nummer), '0',
+        argumentList = [str(self.device_nummer), '0',
                         str(self.devuberschuss), url, urlc,
                         '0', '0', urls]
-        proc = subprocess.Popen(argumentList)
-        proc.communicate()
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('http', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -331,12 +311,9 @@ class Slmystrom(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'mystrom/watt.py',
-                        str(self.device_nummer), str(ip), '0']
+        argumentList = [str(self.device_nummer), str(ip), '0']
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('mystrom', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -359,14 +336,11 @@ class Slsmaem(Slbase):
         print('__init__ Slsmaem excuted')
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'smaem/watt.py',
-                        str(self.device_nummer), str(self._device_measureip),
+        argumentList = [str(self.device_nummer), str(self._device_measureip),
                         str(self._device_measuresmaser),
                         str(self._device_measuresmaage)]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('smaem', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
@@ -383,13 +357,10 @@ class Slwe514(Slbase):
         print('__init__ Slwe514 excuted')
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'we514/watt.py',
-                        str(self.device_nummer), str(self._device_measureip),
+        argumentList = [str(self.device_nummer), str(self._device_measureip),
                         str(self._device_measureid)]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('we514', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
@@ -406,15 +377,12 @@ class Sljson(Slbase):
         print('__init__ Sljson excuted')
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'json/watt.py',
-                        str(self.device_nummer),
+        argumentList = [str(self.device_nummer),
                         self._device_measurejsonurl,
                         self._device_measurejsonpower,
                         self._device_measurejsoncounter]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('json', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
@@ -430,13 +398,10 @@ class Slfronius(Slbase):
         print('__init__ Slfronius excuted')
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'fronius/watt.py',
-                        str(self.device_nummer), str(self._device_measureip),
+        argumentList = [str(self.device_nummer), str(self._device_measureip),
                         str(self._device_measureid)]
         try:
-            proc = subprocess.Popen(argumentList)
-            proc.communicate()
-            answer = self.readret()
+            answer = self.readwatt('fronius', argumentList)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase, Slmqtt
 from usmarthome.global0 import log
-import subprocess
 
 
 class Smqtt(Sbase):
@@ -40,15 +39,13 @@ class Smqtt(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'mqtt' + pname,
-                        str(self.device_nummer), str(self._device_ip),
+            pname = "off"
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('mqtt', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
@@ -1,5 +1,4 @@
 #!/usr/bin/python3
-import subprocess
 from usmarthome.global0 import log
 from usmarthome.smartbase import Sbase, Slmystrom
 
@@ -40,15 +39,13 @@ class Smystrom(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
+            pname = "off"
 
-        argumentList = ['python3', self._prefixpy + 'mystrom' + pname,
-                        str(self.device_nummer), str(self._device_ip), '0']
+        argumentList = [str(self.device_nummer), str(self._device_ip), '0']
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('mystrom', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
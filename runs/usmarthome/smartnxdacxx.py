@@ -2,7 +2,6 @@
 from usmarthome.smartbase import Sbase
 from usmarthome.global0 import log
 from typing import Dict
-import subprocess
 
 
 class Snxdacxx(Sbase):
@@ -40,16 +39,13 @@ class Snxdacxx(Sbase):
     def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
         self.prewatt(uberschuss, uberschussoffset)
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'nxdacxx/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss),
                         str(self._device_nxdacxxueb), str(forcesend),
                         str(self._device_dacport),
                         str(self._device_nxdacxxtype)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
-            self.answer = self.readret()
+            self.answer = self.readwatt('nxdacxx', argumentList)
             self.newwatt = int(self.answer['power'])
             self.newwattk = int(self.answer['powerc'])
             self.relais = int(self.answer['on'])
@@ -64,17 +60,15 @@ class Snxdacxx(Sbase):
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'nxdacxx' + pname,
-                        str(self.device_nummer), str(self._device_ip),
+            pname = "off"
+        argumentList = [str(self.device_nummer), str(self._device_ip),
                         str(self.devuberschuss),
                         str(self._device_dacport),
                         str(self._device_nxdacxxtype)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('nxdacxx', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase, Slshelly
 from usmarthome.global0 import log
-import subprocess
 
 
 class Sshelly(Sbase):
@@ -40,16 +39,14 @@ class Sshelly(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
+            pname = "off"
 
-        argumentList = ['python3', self._prefixpy + 'shelly' + pname,
-                        str(self.device_nummer), str(self._device_ip), '0',
+        argumentList = [str(self.device_nummer), str(self._device_ip), '0',
                         str(self._device_chan)]
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('shelly', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from usmarthome.smartbase import Sbase, Sltasmota
 from usmarthome.global0 import log
-import subprocess
 
 
 class Stasmota(Sbase):
@@ -37,15 +36,13 @@ class Stasmota(Sbase):
     def turndevicerelais(self, zustand, ueberschussberechnung, updatecnt):
         self.preturn(zustand, ueberschussberechnung, updatecnt)
         if (zustand == 1):
-            pname = "/on.py"
+            pname = "on"
         else:
-            pname = "/off.py"
+            pname = "off"
 
-        argumentList = ['python3', self._prefixpy + 'tasmota' + pname,
-                        str(self.device_nummer), str(self._device_ip), '0']
+        argumentList = [str(self.device_nummer), str(self._device_ip), '0']
         try:
-            self.proc = subprocess.Popen(argumentList)
-            self.proc.communicate()
+            self.calldriver('tasmota', pname, argumentList)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "